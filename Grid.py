@@ -2,14 +2,20 @@
 # -*- coding: utf-8 -*-
 
 import time
-import hmac
-import hashlib
-import requests
+import asyncio
 import logging
-import numpy as np
-import pandas as pd
 from datetime import datetime
-import os
+from indicators import StreamingRSI
+from ringbuffer import PriceRingBuffer
+from positions import PositionBook
+from journal import TradeJournal
+from risk import RiskEngine, per_period_rate
+from metrics import METRICS
+from tickstore import TickStore
+from records import TradeLog, EquityHistory
+from scheduler import Cadence, TickScheduler
+from checkpoint import save_checkpoint, load_checkpoint
+from roostoo import RoostooAPIClient, AsyncRoostooAPIClient
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
@@ -18,11 +24,29 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(mes
 API_BASE_URL = "https://mock-api.roostoo.com"  # Change this to the live endpoint if needed
 API_KEY = "jr2XBSSD0E1ZcfHfpsYRuwxCK1DHLZiIPvhtj2nWaYJZ508FnuxoiAdFLGGVExiA"
 SECRET_KEY = "symX7GSnEcrud98jhs8plYYqcvsKn36RaT8GglNUqwBLSyJPAyVl8XYgIAPkEWE6"
-RISK_FREE_RATE = 2  # Not used actively in this demo
+RISK_FREE_RATE = 2  # Annual %, converted to a per-tick rate for Sharpe/Sortino
 
 TRADE_PAIR = "EPIC/USD"  # Change to Stellar (XLM)
+MULTI_PAIR_MODE = False  # True runs one bot per entry of TRADE_PAIRS in this process
+TRADE_PAIRS = ["EPIC/USD", "XLM/USD"]
 FETCH_INTERVAL = 10  # seconds between each ticker fetch
+PAIR_INTERVALS = {}  # per-pair overrides for MultiPairRunner, e.g. {"BTC/USD": 0.5}; others use FETCH_INTERVAL
+SCHEDULE_POLICY = "skip"  # ticks missed while a fetch overran: "skip" them or "coalesce" into one catch-up tick
 CSV_FILE = "trading_data.csv"
+TRADE_COLUMNS = ["pair", "timestamp", "signal", "price", "amount", "cash", "holdings", "order_id", "sl", "tp", "exit_reason"]
+JOURNAL_FORMAT = "csv"  # "binary" for the append-only CRC-checked format
+JOURNAL_FSYNC = "batch"  # "batch", "close" or "never"
+HTTP_POOL_SIZE = 4  # keep-alive connections to the exchange
+PRICE_BUFFER_CAPACITY = 100000  # ticks kept in memory for the strategy
+PRICE_SPILL_FILE = None  # e.g. "price_history.bin" to keep evicted ticks on disk
+TICK_STORE_DIR = None  # e.g. "ticks" to record every fetched tick in a TickStore
+WARM_START_TICKS = 1000  # recent ticks preloaded from TICK_STORE_DIR at startup, 0 disables
+CHECKPOINT_FILE = None  # e.g. "grid_checkpoint.pkl": restored at startup, rewritten every CHECKPOINT_INTERVAL
+CHECKPOINT_INTERVAL = 60  # seconds between checkpoints
+RUNNER_BUFFER_CAPACITY = 4096  # per-bot ticks kept by MultiPairRunner (the streaming RSI needs only RSI_PERIOD + 1)
+ASYNC_MODE = True  # event-driven loop; False runs the blocking loop
+METRICS_PORT = None  # e.g. 9108 to serve Prometheus metrics on http://127.0.0.1:9108/metrics
+METRICS_SUMMARY_INTERVAL = 300  # seconds between latency summaries in the log, None disables
 
 # --- STRATEGY PARAMETERS ---
 RSI_PERIOD = 14  # RSI calculation period
@@ -33,95 +57,53 @@ STOP_LOSS_PCT = 1  # 1% stop loss
 TAKE_PROFIT_PCT = 2  # 2% take profit
 QUANTITY_PER_TRADE = 1000  # Buy 1,000 XLM per trade
 PROFIT_TARGET_PCT = 5  # Stop the bot when net profit reaches 5% of initial capital
-
-# --- API CLIENT ---
-class RoostooAPIClient:
-    def __init__(self, api_key, secret_key, base_url=API_BASE_URL):
-        self.api_key = api_key
-        self.secret_key = secret_key.encode()  # must be bytes for HMAC
-        self.base_url = base_url
-
-    def _get_timestamp(self):
-        return str(int(time.time() * 1000))
-
-    def _sign(self, params: dict):
-        sorted_items = sorted(params.items())
-        query_string = '&'.join([f"{key}={value}" for key, value in sorted_items])
-        signature = hmac.new(self.secret_key, query_string.encode(), hashlib.sha256).hexdigest()
-        return signature, query_string
-
-    def _headers(self, params: dict, is_signed=False):
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        if is_signed:
-            signature, _ = self._sign(params)
-            headers["RST-API-KEY"] = self.api_key
-            headers["MSG-SIGNATURE"] = signature
-        return headers
-
-    def _handle_response(self, response):
-        if response.status_code != 200:
-            logging.error(f"HTTP Error: {response.status_code} {response.text}")
-            return None
-        try:
-            return response.json()
-        except Exception as e:
-            logging.error(f"JSON decode error: {e}")
-            return None
-
-    def get_ticker(self, pair=None):
-        url = f"{self.base_url}/v3/ticker"
-        params = {"timestamp": self._get_timestamp()}
-        if pair:
-            params["pair"] = pair
-        headers = self._headers(params, is_signed=False)
-        response = requests.get(url, params=params, headers=headers)
-        if response.status_code == 429:
-            logging.error("Rate limit reached. Sleeping for 2 seconds.")
-            time.sleep(2)
-            response = requests.get(url, params=params, headers=headers)
-        return self._handle_response(response)
-
-    def place_order(self, pair, side, order_type, quantity, price=None):
-        url = f"{self.base_url}/v3/place_order"
-        params = {
-            "pair": pair,
-            "side": side,
-            "type": order_type,
-            "quantity": quantity,
-            "timestamp": self._get_timestamp()
-        }
-        # For MARKET orders, price is not required.
-        if order_type.upper() == "LIMIT":
-            if price is None:
-                raise ValueError("Price must be provided for LIMIT orders")
-            params["price"] = price
-        headers = self._headers(params, is_signed=True)
-        response = requests.post(url, data=params, headers=headers)
-        return self._handle_response(response)
+MAX_DRAWDOWN_PCT = None  # e.g. 10 to halt trading at a 10% drawdown from the peak
+MAX_VAR_PCT = None  # e.g. 0.5 to halt when the 1-tick 95% VaR exceeds 0.5%
+VAR_WINDOW = 1000  # ticks of returns used for historical VaR
 
 # --- TRADING STRATEGY: RSI + GRID + SL/TP ---
 class RsiGridTradingStrategy:
-    def __init__(self, rsi_period=RSI_PERIOD, oversold=RSI_OVERSOLD, overbought=RSI_OVERBOUGHT, grid_gap=GRID_SENSITIVITY):
+    def __init__(self, rsi_period=RSI_PERIOD, oversold=RSI_OVERSOLD, overbought=RSI_OVERBOUGHT, grid_gap=GRID_SENSITIVITY, rsi_mode="sma"):
         self.rsi_period = rsi_period
         self.oversold = oversold
         self.overbought = overbought
         self.grid_gap = grid_gap
+        self.rsi = StreamingRSI(rsi_period, mode=rsi_mode)
+        self.rows_consumed = 0  # rows of `data` already fed into the streaming RSI
 
     def calculate_rsi(self, data):
-        if len(data) < self.rsi_period + 1:
-            return None
-        delta = data['price'].diff().dropna()
-        gain = (delta.where(delta > 0, 0)).rolling(window=self.rsi_period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=self.rsi_period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi.iloc[-1]
+        if data.total < self.rows_consumed:  # buffer was replaced, start over
+            self.rsi.reset()
+            self.rows_consumed = 0
+        # Only the rows appended since the last call are fed in, so each tick costs O(1)
+        for price in data.prices(data.total - self.rows_consumed).tolist():
+            self.rsi.update(price)
+        self.rows_consumed = data.total
+        return self.rsi.value
+
+    def warm(self, data):
+        # Hydrates the RSI from everything buffered in `data` in one vectorized pass, instead
+        # of calculate_rsi's tick-by-tick catch-up
+        self.rsi.warm(data.prices())
+        self.rows_consumed = data.total
+        return self.rsi.value
+
+    def state(self):
+        return {"rsi": dict(vars(self.rsi))}
+
+    def restore(self, state, data):
+        # Indicator state from state(); False (nothing changed) if it was saved with other settings
+        rsi = state["rsi"]
+        if (rsi["period"], rsi["mode"]) != (self.rsi.period, self.rsi.mode):
+            return False
+        vars(self.rsi).update(rsi)
+        self.rows_consumed = data.total
+        return True
 
     def generate_signal(self, data):
         if len(data) < 2:
             return "HOLD"
-        previous_price = data['price'].iloc[-2]
-        current_price = data['price'].iloc[-1]
+        previous_price, current_price = data.prices(2).tolist()
         price_gap = current_price - previous_price
 
         rsi = self.calculate_rsi(data)
@@ -129,92 +111,96 @@ class RsiGridTradingStrategy:
             logging.info("Not enough data for RSI calculation.")
             return "HOLD"
 
-        logging.info(f"Current Price: {current_price}, RSI: {rsi:.2f}, Gap: {price_gap:.4f}")
+        # %-style arguments: the message is only formatted when INFO is enabled
+        logging.info("Current Price: %s, RSI: %.2f, Gap: %.4f", current_price, rsi, price_gap)
 
         if price_gap >= self.grid_gap and rsi < self.oversold:
-            logging.info(f"BUY Signal: Gap +{price_gap:.4f}, RSI {rsi:.2f}")
+            logging.info("BUY Signal: Gap +%.4f, RSI %.2f", price_gap, rsi)
             return "BUY"
         elif price_gap <= -self.grid_gap and rsi > self.overbought:
-            logging.info(f"SELL Signal: Gap {price_gap:.4f}, RSI {rsi:.2f}")
+            logging.info("SELL Signal: Gap %.4f, RSI %.2f", price_gap, rsi)
             return "SELL"
         return "HOLD"
 
 # --- RISK MANAGEMENT ---
 class RiskManager:
-    def __init__(self):
-        self.portfolio_values = []  # list of (timestamp, value)
+    def __init__(self, max_drawdown_pct=MAX_DRAWDOWN_PCT, max_var_pct=MAX_VAR_PCT):
+        # O(1) per update and fixed memory, so it can be checked on every tick
+        self.engine = RiskEngine(per_period_rate(RISK_FREE_RATE, FETCH_INTERVAL), var_window=VAR_WINDOW,
+                                 max_drawdown_pct=max_drawdown_pct, max_var_pct=max_var_pct)
 
     def update_portfolio(self, value, timestamp):
-        self.portfolio_values.append((timestamp, value))
+        self.engine.update(value)
 
     def calculate_sharpe_ratio(self):
-        if len(self.portfolio_values) < 2:
-            return 0
-        values = np.array([v for _, v in self.portfolio_values])
-        returns = np.diff(values) / values[:-1]
-        excess_returns = returns - RISK_FREE_RATE
-        std = np.std(excess_returns)
-        return np.mean(excess_returns) / std if std != 0 else 0
+        return self.engine.sharpe
+
+    def check_limits(self):
+        return self.engine.breach()
 
 # --- TRADING BOT (LIVE ORDERS) ---
 class TradingBot:
-    def __init__(self, strategy, risk_manager, initial_cash=100000):
+    def __init__(self, strategy, risk_manager, initial_cash=100000, pair=TRADE_PAIR, api_client=None, journal=None,
+                 buffer_capacity=PRICE_BUFFER_CAPACITY, metrics=None, recorder=None, checkpoint_path=None):
+        self.pair = pair
         self.strategy = strategy
         self.risk_manager = risk_manager
         self.initial_cash = initial_cash
         self.cash = initial_cash
         self.holdings = 0.0
-        self.trade_log = []
+        self.trade_log = TradeLog()  # every fill, columnar
         self.order_id_counter = 0  # Unique order IDs
-        self.api_client = RoostooAPIClient(API_KEY, SECRET_KEY)
-        self.portfolio_history = []  # list of (timestamp, portfolio_value)
-        self.data = pd.DataFrame(columns=["timestamp", "price"])  # Accumulate new data
-        self.open_positions = []  # List of dicts: entry_price, quantity, sl, tp
+        self.api_client = api_client or RoostooAPIClient(API_KEY, SECRET_KEY, base_url=API_BASE_URL, pool_size=HTTP_POOL_SIZE)
+        self.portfolio_history = EquityHistory()  # (timestamp, portfolio_value) per tick
+        self.data = PriceRingBuffer(buffer_capacity, spill_path=PRICE_SPILL_FILE)  # Recent ticks, fixed memory
+        self.journal = journal or TradeJournal(CSV_FILE, TRADE_COLUMNS, fmt=JOURNAL_FORMAT, fsync=JOURNAL_FSYNC, lazy=True)  # opened on the first trade
+        self.positions = PositionBook()  # open positions indexed by SL/TP, closed ones archived
         self.profit_target = initial_cash * (1 + PROFIT_TARGET_PCT / 100)  # Calculate profit target
+        self.metrics = metrics or METRICS  # stage latencies and event counters
+        self.tick_received = 0  # perf_counter_ns() when the current tick's price arrived
+        self.recorder = recorder  # TickStore that every tick is appended to, or None
+        self.checkpoint_path = checkpoint_path
+        self.next_checkpoint = time.monotonic() + CHECKPOINT_INTERVAL
 
     def update_portfolio_value(self, price, timestamp):
         value = self.cash + self.holdings * price
         self.risk_manager.update_portfolio(value, timestamp)
-        self.portfolio_history.append((timestamp, value))
+        self.portfolio_history.append(timestamp, value)
         return value
 
     def generate_order_id(self):
+        # Order number; journaled as ORDER-000001
         self.order_id_counter += 1
-        return f"ORDER-{self.order_id_counter:06d}"
+        return self.order_id_counter
 
     def log_trade(self, timestamp, signal, price, amount, order_id, sl=None, tp=None, exit_reason=None):
+        self.trade_log.append(timestamp, signal, price, amount, self.cash, self.holdings, order_id, sl, tp, exit_reason)
         trade_record = {
+            "pair": self.pair,
             "timestamp": timestamp,
             "signal": signal,
             "price": price,
             "amount": amount,
             "cash": self.cash,
             "holdings": self.holdings,
-            "order_id": order_id,
+            "order_id": f"ORDER-{order_id:06d}",
             "sl": sl,
             "tp": tp,
             "exit_reason": exit_reason
         }
-        self.trade_log.append(trade_record)
-        # Optionally, write to CSV
-        header = not os.path.exists(CSV_FILE) or os.stat(CSV_FILE).st_size == 0
-        pd.DataFrame([trade_record]).to_csv(CSV_FILE, mode='a', header=header, index=False)
-        logging.info(f"Trade executed: {trade_record}")
+        # Only an in-memory enqueue; the journal thread batches the CSV writes
+        start = time.perf_counter_ns()
+        self.journal.append(trade_record)
+        self.metrics.observe("journal", time.perf_counter_ns() - start)
+        self.metrics.count("trades")
+        logging.info("Trade executed: %s", trade_record)
 
     def check_sl_tp(self, current_price, current_time):
-        for pos in self.open_positions:
-            if pos['status'] == 'open':
-                exit_reason = None
-                if current_price <= pos['sl']:
-                    exit_reason = "SL Hit"
-                elif current_price >= pos['tp']:
-                    exit_reason = "TP Hit"
-                
-                if exit_reason:
-                    pos['status'] = 'closed'
-                    self.cash += pos['quantity'] * current_price
-                    self.holdings -= pos['quantity']
-                    self.log_trade(current_time, "CLOSE", current_price, pos['quantity'], self.generate_order_id(), exit_reason=exit_reason)
+        # Only positions whose SL or TP was crossed are touched
+        for pos, exit_reason in self.positions.pop_triggered(current_price):
+            self.cash += pos['quantity'] * current_price
+            self.holdings -= pos['quantity']
+            self.log_trade(current_time, "CLOSE", current_price, pos['quantity'], self.generate_order_id(), exit_reason=exit_reason)
 
     def check_profit_target(self, current_value):
         if current_value >= self.profit_target:
@@ -222,90 +208,428 @@ class TradingBot:
             return True
         return False
 
-    def live_trade(self, signal, price, timestamp):
-        order_id = self.generate_order_id()
+    def check_risk_limits(self):
+        reason = self.risk_manager.check_limits()
+        if reason:
+            logging.warning(f"Risk limit breached: {reason}")
+            return True
+        return False
+
+    def should_stop(self, current_value):
+        return self.check_profit_target(current_value) or self.check_risk_limits()
+
+    def order_side(self, signal, price):
+        # Side to send for this signal, or None when there is nothing to do
         if signal == "BUY" and self.cash >= price * QUANTITY_PER_TRADE:  # Check if there's enough cash to buy QUANTITY_PER_TRADE units
-            response = self.api_client.place_order(TRADE_PAIR, "BUY", "MARKET", str(QUANTITY_PER_TRADE))  # Fixed quantity of QUANTITY_PER_TRADE
-            if response and response.get("Success"):
-                self.holdings += QUANTITY_PER_TRADE  # Increase holdings by QUANTITY_PER_TRADE units
-                self.cash -= price * QUANTITY_PER_TRADE  # Deduct the cost of QUANTITY_PER_TRADE units
-                sl = price * (1 - STOP_LOSS_PCT / 100)
-                tp = price * (1 + TAKE_PROFIT_PCT / 100)
-                self.open_positions.append({
-                    'entry_time': timestamp,
-                    'entry_price': price,
-                    'quantity': QUANTITY_PER_TRADE,  # Fixed quantity of QUANTITY_PER_TRADE
-                    'sl': sl,
-                    'tp': tp,
-                    'status': 'open'
-                })
-                self.log_trade(timestamp, "BUY", price, QUANTITY_PER_TRADE, order_id, sl, tp)  # Log quantity as QUANTITY_PER_TRADE
-                logging.info(f"Live BUY order placed for {QUANTITY_PER_TRADE} units.")
-            else:
-                logging.error("Live BUY order failed.")
-        elif signal == "SELL" and self.holdings >= QUANTITY_PER_TRADE:  # Check if there's at least QUANTITY_PER_TRADE units to sell
-            response = self.api_client.place_order(TRADE_PAIR, "SELL", "MARKET", str(QUANTITY_PER_TRADE))  # Fixed quantity of QUANTITY_PER_TRADE
-            if response and response.get("Success"):
-                self.holdings -= QUANTITY_PER_TRADE  # Decrease holdings by QUANTITY_PER_TRADE units
-                self.cash += price * QUANTITY_PER_TRADE  # Add the proceeds from selling QUANTITY_PER_TRADE units
-                self.log_trade(timestamp, "SELL", price, QUANTITY_PER_TRADE, order_id)  # Log quantity as QUANTITY_PER_TRADE
-                logging.info(f"Live SELL order placed for {QUANTITY_PER_TRADE} units.")
-            else:
-                logging.error("Live SELL order failed.")
+            return "BUY"
+        if signal == "SELL" and self.holdings >= QUANTITY_PER_TRADE:  # Check if there's at least QUANTITY_PER_TRADE units to sell
+            return "SELL"
+        return None
+
+    def on_order_response(self, side, response, price, timestamp, order_id):
+        if self.tick_received:
+            self.metrics.observe("tick_to_order", time.perf_counter_ns() - self.tick_received)
+        if not (response and response.get("Success")):
+            self.metrics.count("order_failures")
+            logging.error(f"Live {side} order failed.")
+            return
+        if side == "BUY":
+            self.holdings += QUANTITY_PER_TRADE  # Increase holdings by QUANTITY_PER_TRADE units
+            self.cash -= price * QUANTITY_PER_TRADE  # Deduct the cost of QUANTITY_PER_TRADE units
+            sl = price * (1 - STOP_LOSS_PCT / 100)
+            tp = price * (1 + TAKE_PROFIT_PCT / 100)
+            self.positions.add({
+                'entry_time': timestamp,
+                'entry_price': price,
+                'quantity': QUANTITY_PER_TRADE,  # Fixed quantity of QUANTITY_PER_TRADE
+                'sl': sl,
+                'tp': tp,
+                'status': 'open'
+            })
+            self.log_trade(timestamp, "BUY", price, QUANTITY_PER_TRADE, order_id, sl, tp)  # Log quantity as QUANTITY_PER_TRADE
         else:
+            self.holdings -= QUANTITY_PER_TRADE  # Decrease holdings by QUANTITY_PER_TRADE units
+            self.cash += price * QUANTITY_PER_TRADE  # Add the proceeds from selling QUANTITY_PER_TRADE units
+            self.log_trade(timestamp, "SELL", price, QUANTITY_PER_TRADE, order_id)  # Log quantity as QUANTITY_PER_TRADE
+        logging.info(f"Live {side} order placed for {QUANTITY_PER_TRADE} units.")
+
+    def live_trade(self, signal, price, timestamp):
+        order_id = self.generate_order_id()
+        side = self.order_side(signal, price)
+        if side is None:
             logging.info("No live trade executed (HOLD or insufficient funds/holdings).")
+            return
+        start = time.perf_counter_ns()
+        response = self.api_client.place_order(self.pair, side, "MARKET", str(QUANTITY_PER_TRADE))  # Fixed quantity of QUANTITY_PER_TRADE
+        self.metrics.observe("order", time.perf_counter_ns() - start)
+        self.on_order_response(side, response, price, timestamp, order_id)
+
+    async def async_live_trade(self, signal, price, timestamp, client):
+        # Same as live_trade, but the order round-trip doesn't block the event loop
+        order_id = self.generate_order_id()
+        side = self.order_side(signal, price)
+        if side is None:
+            logging.info("No live trade executed (HOLD or insufficient funds/holdings).")
+            return
+        start = time.perf_counter_ns()
+        response = await client.place_order(self.pair, side, "MARKET", str(QUANTITY_PER_TRADE))
+        self.metrics.observe("order", time.perf_counter_ns() - start)
+        self.on_order_response(side, response, price, timestamp, order_id)
+
+    # --- WARM START / CHECKPOINTS ---
+    def warm_start(self, timestamps, prices):
+        # Preloads recorded ticks so the strategy can signal on the first live tick
+        self.data.extend(timestamps, prices)
+        self.strategy.warm(self.data)
+
+    def checkpoint_state(self):
+        recent = min(len(self.data), max(WARM_START_TICKS, 2))
+        engine = self.risk_manager.engine
+        return {
+            "pair": self.pair,
+            "saved_at": time.time(),
+            "cash": self.cash,
+            "holdings": self.holdings,
+            "order_id_counter": self.order_id_counter,
+            "positions": list(self.positions),
+            "strategy": self.strategy.state(),
+            "risk": {key: value.copy() if hasattr(value, "copy") else value for key, value in vars(engine).items()},
+            "timestamps": self.data.timestamps(recent).copy(),
+            "prices": self.data.prices(recent).copy(),
+        }
+
+    def restore_state(self, state):
+        if state["pair"] != self.pair:
+            raise ValueError(f"Checkpoint is for {state['pair']}, not {self.pair}")
+        self.cash = state["cash"]
+        self.holdings = state["holdings"]
+        self.order_id_counter = state["order_id_counter"]
+        self.positions = PositionBook()
+        for position in state["positions"]:
+            self.positions.add(position)
+        self.data.extend(state["timestamps"], state["prices"])
+        if not self.strategy.restore(state["strategy"], self.data):
+            self.strategy.warm(self.data)  # settings changed since the checkpoint
+        engine = self.risk_manager.engine
+        if state["risk"]["var_window"] == engine.var_window:
+            limits = ("risk_free_rate", "var_confidence", "max_drawdown_pct", "max_var_pct")
+            vars(engine).update({key: value for key, value in state["risk"].items() if key not in limits})
+
+    def save_checkpoint(self):
+        start = time.perf_counter_ns()
+        save_checkpoint(self.checkpoint_path, self.checkpoint_state())
+        self.metrics.observe("checkpoint", time.perf_counter_ns() - start)
+        self.next_checkpoint = time.monotonic() + CHECKPOINT_INTERVAL
+
+    def maybe_checkpoint(self):
+        if self.checkpoint_path and time.monotonic() >= self.next_checkpoint:
+            self.save_checkpoint()
+
+    def process_tick(self, price, current_time):
+        # One tick of the trading loop; returns True once the profit target or a risk limit is reached
+        metrics = self.metrics
+        self.tick_received = time.perf_counter_ns()
+        t = metrics.sample()  # non-zero on sampled ticks only
+        # Append new data point (O(1), no copy of the history)
+        self.data.append(current_time, price)
+        if self.recorder is not None:
+            self.recorder.append(self.pair, current_time, price)
+        # Generate signal from the buffered data
+        signal = self.strategy.generate_signal(self.data)
+        if t:
+            t = metrics.lap("signal", t)
+        # Execute live trade (orders actually sent to API)
+        self.live_trade(signal, price, current_time)
+        if t:
+            t = metrics.lap("trade", t)
+        # Check for SL/TP triggers
+        self.check_sl_tp(price, current_time)
+        if t:
+            t = metrics.lap("sl_tp", t)
+        # Update portfolio value
+        current_value = self.update_portfolio_value(price, current_time)
+        self.maybe_checkpoint()
+        # Check if profit target or a risk limit is reached
+        return self.should_stop(current_value)
+
+    def poll_once(self):
+        # One scheduled tick of the blocking loop; True once the bot should stop
+        start = time.perf_counter_ns()
+        ticker_data = self.api_client.get_ticker(pair=self.pair)
+        self.metrics.observe("ticker_fetch", time.perf_counter_ns() - start)
+        if ticker_data and ticker_data.get("Success"):
+            price = float(ticker_data["Data"][self.pair]["LastPrice"])
+            if self.process_tick(price, datetime.now()):
+                logging.info("Stopping bot as profit target or risk limit is reached.")
+                return True
+        else:
+            self.metrics.count("fetch_failures")
+            logging.error("Failed to fetch ticker data in trading loop.")
+        return False
 
     def run_trading_loop(self):
         logging.info("Starting continuous trading loop. Press Ctrl+C to stop.")
-        while True:
-            try:
-                ticker_data = self.api_client.get_ticker(pair=TRADE_PAIR)
+        # Ticks every FETCH_INTERVAL on the monotonic clock, however long the fetch took
+        scheduler = TickScheduler()
+        scheduler.every(FETCH_INTERVAL, self.poll_once, name=self.pair, policy=SCHEDULE_POLICY)
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            logging.info("Trading loop interrupted by user. Exiting.")
+        scheduler.log_stats()
+
+    async def run_async_trading_loop(self, client=None):
+        # Event-driven loop: price polling, signal evaluation, order submission and SL/TP
+        # monitoring are separate tasks joined by queues, so a slow order never delays
+        # the next price read or the SL/TP checks. Orders never queue up behind a slow one:
+        # only the newest signal waits, and it is dropped once a later tick has been evaluated.
+        own_client = client is None
+        client = client or AsyncRoostooAPIClient(self.api_client)
+        stop = asyncio.Event()
+        signal_queue = asyncio.Queue()
+        sl_tp_queue = asyncio.Queue()
+        order_queue = asyncio.Queue(maxsize=1)
+        evaluated = 0  # ticks evaluated so far; tags each signal with its tick
+
+        async def poll_prices():
+            cadence = Cadence(FETCH_INTERVAL, SCHEDULE_POLICY)
+            while not stop.is_set():
+                cadence.begin()
+                start = time.perf_counter_ns()
+                ticker_data = await client.get_ticker(pair=self.pair)
+                received = time.perf_counter_ns()
+                self.metrics.observe("ticker_fetch", received - start)
                 if ticker_data and ticker_data.get("Success"):
-                    price = float(ticker_data["Data"][TRADE_PAIR]["LastPrice"])
-                    current_time = datetime.now()
-                    # Append new data point
-                    new_data = pd.DataFrame([{"timestamp": current_time, "price": price}])
-                    self.data = pd.concat([self.data, new_data], ignore_index=True)
-                    # Generate signal using all accumulated data
-                    signal = self.strategy.generate_signal(self.data)
-                    # Execute live trade (orders actually sent to API)
-                    self.live_trade(signal, price, current_time)
-                    # Check for SL/TP triggers
-                    self.check_sl_tp(price, current_time)
-                    # Update portfolio value
-                    current_value = self.update_portfolio_value(price, current_time)
-                    # Check if profit target is reached
-                    if self.check_profit_target(current_value):
-                        logging.info("Stopping bot as profit target is reached.")
-                        break
+                    # the last field marks ticks whose per-stage latencies are sampled
+                    tick = (float(ticker_data["Data"][self.pair]["LastPrice"]), datetime.now(), received, self.metrics.sample() != 0)
+                    signal_queue.put_nowait(tick)
+                    sl_tp_queue.put_nowait(tick)
                 else:
+                    self.metrics.count("fetch_failures")
                     logging.error("Failed to fetch ticker data in trading loop.")
-                time.sleep(FETCH_INTERVAL)
-            except KeyboardInterrupt:
-                logging.info("Trading loop interrupted by user. Exiting.")
-                break
+                cadence.end()
+                try:
+                    await asyncio.wait_for(stop.wait(), cadence.delay())
+                except asyncio.TimeoutError:
+                    pass
+
+        async def evaluate_signals():
+            nonlocal evaluated
+            while True:
+                price, current_time, received, sampled = await signal_queue.get()
+                evaluated += 1
+                t = time.perf_counter_ns() if sampled else 0
+                self.data.append(current_time, price)
+                if self.recorder is not None:
+                    self.recorder.append(self.pair, current_time, price)
+                signal = self.strategy.generate_signal(self.data)
+                if t:
+                    self.metrics.lap("signal", t)
+                if signal != "HOLD":
+                    if order_queue.full():
+                        order_queue.get_nowait()  # superseded while an order was in flight
+                        self.metrics.count("stale_signals")
+                    order_queue.put_nowait((evaluated, signal, price, current_time, received))
+
+        async def submit_orders():
+            # One order in flight at a time, so each cash/holdings check sees the previous fill
+            while True:
+                tick, signal, price, current_time, self.tick_received = await order_queue.get()
+                if tick != evaluated:
+                    self.metrics.count("stale_signals")  # a later tick arrived during the last order
+                    continue
+                await self.async_live_trade(signal, price, current_time, client)
+
+        async def monitor_sl_tp():
+            while True:
+                price, current_time, _, sampled = await sl_tp_queue.get()
+                t = time.perf_counter_ns() if sampled else 0
+                self.check_sl_tp(price, current_time)
+                if t:
+                    self.metrics.lap("sl_tp", t)
+                current_value = self.update_portfolio_value(price, current_time)
+                self.maybe_checkpoint()
+                if self.should_stop(current_value):
+                    logging.info("Stopping bot as profit target or risk limit is reached.")
+                    stop.set()
+
+        logging.info("Starting event-driven trading loop. Press Ctrl+C to stop.")
+        tasks = [asyncio.create_task(coro(), name=coro.__name__)
+                 for coro in (poll_prices, evaluate_signals, submit_orders, monitor_sl_tp)]
+        stop_task = asyncio.create_task(stop.wait())
+        try:
+            # Returns on stop or as soon as any task ends; a task that raised stops the bot
+            done, _ = await asyncio.wait(tasks + [stop_task], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is not stop_task and not task.cancelled() and task.exception() is not None:
+                    logging.error(f"Trading task {task.get_name()} failed, stopping the bot: {task.exception()!r}")
+                    raise task.exception()
+        finally:
+            stop.set()
+            for task in tasks + [stop_task]:
+                task.cancel()
+            await asyncio.gather(*tasks, stop_task, return_exceptions=True)
+            if own_client:
+                client.close()
+
+# --- MULTI-PAIR RUNNER ---
+class MultiPairRunner:
+    # Hosts many (pair, strategy) bots in one process: one API session, one /v3/ticker request
+    # per interval for every pair, and the prices fanned out to each bot. Cash, holdings and
+    # positions stay per bot; the trade journal is shared and records the pair.
+    def __init__(self, api_client=None, journal=None, metrics=None, recorder=None):
+        self.api_client = api_client or RoostooAPIClient(API_KEY, SECRET_KEY, base_url=API_BASE_URL, pool_size=HTTP_POOL_SIZE)
+        self.journal = journal or TradeJournal(CSV_FILE, TRADE_COLUMNS, fmt=JOURNAL_FORMAT, fsync=JOURNAL_FSYNC, lazy=True)
+        self.bots = []
+        self.pairs = []  # unique pairs, in the order sent to parse_prices
+        self.bot_pair_index = []  # index into self.pairs for each bot
+        self.stopped = set()  # bots that reached their profit target
+        self.metrics = metrics or METRICS
+        self.recorder = recorder  # records each fetched price once per pair, not once per bot
+
+    def add_bot(self, pair, strategy=None, risk_manager=None, initial_cash=100000):
+        bot = TradingBot(strategy or RsiGridTradingStrategy(), risk_manager or RiskManager(), initial_cash,
+                         pair=pair, api_client=self.api_client, journal=self.journal, buffer_capacity=RUNNER_BUFFER_CAPACITY,
+                         metrics=self.metrics)
+        if pair not in self.pairs:
+            self.pairs.append(pair)
+        self.bots.append(bot)
+        self.bot_pair_index.append(self.pairs.index(pair))
+        return bot
+
+    def run_iteration(self, pairs=None):
+        # Fetches `pairs` (all of them by default) and ticks their bots; True once those bots have all stopped
+        group = self.pairs if pairs is None else pairs
+        start = time.perf_counter_ns()
+        prices = self.api_client.get_prices(group)
+        self.metrics.observe("ticker_fetch", time.perf_counter_ns() - start)
+        if prices is None:
+            self.metrics.count("fetch_failures")
+            logging.error("Failed to fetch ticker data in trading loop.")
+            return False
+        current_time = datetime.now()
+        prices = prices.tolist()
+        if self.recorder is not None:
+            self.recorder.append_many(group, current_time, prices)
+        price_of = None if pairs is None else dict(zip(pairs, prices))
+        active = False
+        for i, (bot, pair_index) in enumerate(zip(self.bots, self.bot_pair_index)):
+            if price_of is None:
+                price = prices[pair_index]
+            elif bot.pair in price_of:
+                price = price_of[bot.pair]
+            else:
+                continue
+            if i in self.stopped:
+                continue
+            if price == price:  # NaN: pair missing from this response
+                if bot.process_tick(price, current_time):
+                    logging.info(f"Stopping {bot.pair} bot as profit target or risk limit is reached.")
+                    self.stopped.add(i)
+                    continue
+            active = True
+        return not active
+
+    def run(self):
+        logging.info(f"Starting multi-pair trading loop for {len(self.bots)} bots. Press Ctrl+C to stop.")
+        # One scheduled fetch per distinct interval, covering every pair polled at that rate
+        groups = {}
+        for pair in self.pairs:
+            groups.setdefault(PAIR_INTERVALS.get(pair, FETCH_INTERVAL), []).append(pair)
+        scheduler = TickScheduler()
+        for interval, pairs in groups.items():
+            tick = self.run_iteration if len(groups) == 1 else (lambda pairs=pairs: self.run_iteration(pairs))
+            scheduler.every(interval, tick, name=",".join(pairs), policy=SCHEDULE_POLICY)
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            logging.info("Trading loop interrupted by user. Exiting.")
+        scheduler.log_stats()
+        self.journal.close()
+
+def warm_start(bot, store=None):
+    # Restores the bot's checkpoint when there is one, otherwise preloads its pair's most
+    # recent ticks from the tick store, so it doesn't sit in HOLD for RSI_PERIOD fetches
+    start = time.perf_counter()
+    state = load_checkpoint(bot.checkpoint_path)
+    if state is not None and state.get("pair") == bot.pair:
+        bot.restore_state(state)
+        logging.info(f"Restored {bot.pair} checkpoint from {bot.checkpoint_path} ({len(bot.positions)} open positions, "
+                     f"{len(bot.data)} ticks) in {(time.perf_counter() - start) * 1000:.1f} ms")
+        return True
+    if store is None or not WARM_START_TICKS:
+        return False
+    timestamps, prices = store.read(bot.pair, last=WARM_START_TICKS)
+    if not len(prices):
+        return False
+    bot.warm_start(timestamps, prices)
+    logging.info(f"Warm-started {bot.pair} from {len(prices)} recorded ticks in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return True
+
+def run_multi_pair(recorder=None):
+    runner = MultiPairRunner(recorder=recorder)
+    for pair in TRADE_PAIRS:
+        warm_start(runner.add_bot(pair), recorder)
+    runner.run()
+    for bot in runner.bots:
+        if bot.data.empty:
+            continue
+        final_value = bot.update_portfolio_value(bot.data.last_price, bot.data.last_timestamp)
+        print(f"{bot.pair}: Final Portfolio Value: {final_value:.2f}, Net Profit: {final_value - bot.initial_cash:.2f}")
+
+def start_metrics():
+    if METRICS_PORT is not None:
+        METRICS.serve(METRICS_PORT)
+    if METRICS_SUMMARY_INTERVAL:
+        METRICS.start_reporter(METRICS_SUMMARY_INTERVAL)
 
 def main():
+    start_metrics()
+    recorder = TickStore(TICK_STORE_DIR) if TICK_STORE_DIR else None
+    if MULTI_PAIR_MODE:
+        run_multi_pair(recorder)
+        if recorder is not None:
+            recorder.close()
+        logging.info("Metrics: %s", METRICS.format_summary())
+        return
+
     # Use the RSI + Grid + SL/TP strategy
     strategy = RsiGridTradingStrategy()
     risk_manager = RiskManager()
-    trading_bot = TradingBot(strategy, risk_manager)
+    trading_bot = TradingBot(strategy, risk_manager, recorder=recorder, checkpoint_path=CHECKPOINT_FILE)
+    warm_start(trading_bot, recorder)
 
     # Run trading loop continuously
-    trading_bot.run_trading_loop()
+    if ASYNC_MODE:
+        try:
+            asyncio.run(trading_bot.run_async_trading_loop())
+        except KeyboardInterrupt:
+            logging.info("Trading loop interrupted by user. Exiting.")
+    else:
+        trading_bot.run_trading_loop()
+
+    # Make sure every logged trade and recorded tick is on disk
+    trading_bot.journal.close()
+    if recorder is not None:
+        recorder.close()
+    if CHECKPOINT_FILE and not trading_bot.data.empty:
+        trading_bot.save_checkpoint()
 
     # When interrupted, calculate final portfolio value and net profit
     if trading_bot.data.empty:
         logging.error("No data recorded during trading.")
         return
 
-    final_price = trading_bot.data['price'].iloc[-1]
-    final_timestamp = trading_bot.data['timestamp'].iloc[-1]
+    trading_bot.data.flush()
+    final_price = trading_bot.data.last_price
+    final_timestamp = trading_bot.data.last_timestamp
     final_portfolio_value = trading_bot.update_portfolio_value(final_price, final_timestamp)
     net_profit = final_portfolio_value - trading_bot.initial_cash
 
     logging.info(f"Final Portfolio Value: {final_portfolio_value:.2f}")
     logging.info(f"Net Profit: {net_profit:.2f}")
+    logging.info(f"Risk: {trading_bot.risk_manager.engine.summary()}")
+    logging.info("Metrics: %s", METRICS.format_summary())
     print(f"Final Portfolio Value: {final_portfolio_value:.2f}")
     print(f"Net Profit: {net_profit:.2f}")
 
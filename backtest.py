@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import heapq
+import argparse
+import numpy as np
+from datetime import datetime
+from numpy.lib.stride_tricks import sliding_window_view
+from Grid import (RSI_PERIOD, RSI_OVERSOLD, RSI_OVERBOUGHT, GRID_SENSITIVITY, STOP_LOSS_PCT,
+                  TAKE_PROFIT_PCT, QUANTITY_PER_TRADE, PROFIT_TARGET_PCT)
+from indicators import StreamingRSI
+from tickstore import TickStore
+from momentum import TRADE_AMOUNT
+
+INITIAL_CASH = 100000
+
+# --- PRICE DATA ---
+def load_prices(path, column="price", pair=None, start=None, end=None):
+    # Price column of a CSV or Parquet file as a float64 array. A directory is read as a
+    # TickStore: `pair` (the only pair when omitted) within [start, end), memory-mapped.
+    if os.path.isdir(path):
+        store = TickStore(path)
+        if pair is None:
+            pairs = store.pairs()
+            if not pairs:
+                raise ValueError(f"Tick store {path} holds no pairs")
+            pair = pairs[0]
+        prices = store.read(pair, start, end)[1]
+        if not len(prices):
+            span = f"[{'start' if start is None else start}, {'end' if end is None else end})"
+            raise ValueError(f"Tick store {path} has no {pair} ticks in {span}")
+        return prices
+    import pandas as pd
+    if path.endswith(".parquet"):
+        frame = pd.read_parquet(path, columns=[column])
+    else:
+        frame = pd.read_csv(path, usecols=[column])
+    return frame[column].to_numpy(dtype=np.float64)
+
+# --- VECTORIZED INDICATORS ---
+def rolling_mean(values, window):
+    # mean of values[i - window + 1 : i + 1] at index i, NaN before the first full window
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = sliding_window_view(values, window).mean(axis=1)
+    return out
+
+def rsi_series(prices, period=RSI_PERIOD, mode="sma"):
+    # RSI at every tick, NaN where RsiGridTradingStrategy would not have one yet
+    prices = np.asarray(prices, dtype=np.float64)
+    rsi = np.full(len(prices), np.nan)
+    if len(prices) < period + 1:
+        return rsi
+    if mode != "sma":
+        # Wilder smoothing is recursive; reuse the streaming engine
+        engine = StreamingRSI(period, mode=mode)
+        values = [engine.update(price) for price in prices.tolist()]
+        return np.array([np.nan if v is None else v for v in values])
+    delta = np.diff(prices)
+    gain = rolling_mean(np.where(delta > 0, delta, 0.0), period)
+    loss = rolling_mean(np.where(delta < 0, -delta, 0.0), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi[1:] = 100 - (100 / (1 + gain / loss))
+    return rsi
+
+# --- RSI + GRID BACKTEST ---
+def rsi_grid_signals(prices, rsi_period=RSI_PERIOD, oversold=RSI_OVERSOLD, overbought=RSI_OVERBOUGHT,
+                     grid_gap=GRID_SENSITIVITY, rsi_mode="sma"):
+    # +1 BUY, -1 SELL, 0 HOLD at every tick, same rules as RsiGridTradingStrategy.generate_signal
+    prices = np.asarray(prices, dtype=np.float64)
+    rsi = rsi_series(prices, rsi_period, rsi_mode)
+    gap = np.zeros(len(prices))
+    gap[1:] = np.diff(prices)
+    signals = np.zeros(len(prices), dtype=np.int8)
+    with np.errstate(invalid="ignore"):
+        signals[(gap >= grid_gap) & (rsi < oversold)] = 1
+        signals[(gap <= -grid_gap) & (rsi > overbought)] = -1
+    return signals
+
+def _next_trigger(prices, price_list, start, stop, max_sl, min_tp):
+    # First index in [start, stop) where an open position's SL or TP is crossed, or `stop`.
+    # Short gaps are scanned in Python (cheaper than a NumPy call), longer ones in doubling
+    # NumPy chunks so the cost stays proportional to the distance to the hit.
+    end = min(stop, start + 32)
+    for i in range(start, end):
+        price = price_list[i]
+        if price <= max_sl or price >= min_tp:
+            return i
+    start = end
+    chunk = 64
+    while start < stop:
+        end = min(stop, start + chunk)
+        window = prices[start:end]
+        crossed = (window <= max_sl) | (window >= min_tp)
+        first = int(crossed.argmax())
+        if crossed[first]:
+            return start + first
+        start = end
+        chunk *= 2
+    return stop
+
+def backtest_rsi_grid(prices, rsi_period=RSI_PERIOD, oversold=RSI_OVERSOLD, overbought=RSI_OVERBOUGHT,
+                      grid_gap=GRID_SENSITIVITY, stop_loss_pct=STOP_LOSS_PCT, take_profit_pct=TAKE_PROFIT_PCT,
+                      quantity=QUANTITY_PER_TRADE, initial_cash=INITIAL_CASH, profit_target_pct=PROFIT_TARGET_PCT,
+                      rsi_mode="sma", stop_at_profit_target=True):
+    # Replays TradingBot.run_trading_loop with every order filled at the tick price: signals are
+    # computed for the whole array at once, and the path-dependent part (cash checks, SL/TP exits)
+    # only visits ticks where a signal fires or an open position's trigger is crossed.
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    n = len(prices)
+    signals = rsi_grid_signals(prices, rsi_period, oversold, overbought, grid_gap, rsi_mode)
+    signal_ticks = np.flatnonzero(signals).tolist()
+    signal_ticks.append(n)
+    price_list = prices.tolist()  # scalar reads from a list are much cheaper than from the array
+
+    cash = float(initial_cash)
+    holdings = 0.0
+    sl_heap, tp_heap = [], []  # (-sl, seq) and (tp, seq) of open positions
+    open_positions = {}  # seq -> (sl, tp)
+    seq = 0
+    trades = []  # (tick, signal, price, amount, cash, holdings, sl, tp, exit_reason)
+    change_ticks, cash_path, holdings_path = [0], [cash], [holdings]
+
+    i = 0
+    for next_signal in signal_ticks:
+        # SL/TP exits between signals
+        while open_positions and i < next_signal:
+            i = _next_trigger(prices, price_list, i, next_signal, -sl_heap[0][0], tp_heap[0][0])
+            if i == next_signal:
+                break
+            price = price_list[i]
+            cash, holdings = _close_triggered(price, i, quantity, cash, holdings, sl_heap, tp_heap, open_positions, trades)
+            change_ticks.append(i)
+            cash_path.append(cash)
+            holdings_path.append(holdings)
+            i += 1
+        if next_signal == n:
+            break
+
+        i = next_signal
+        price = price_list[i]
+        changed = False
+        if signals[i] == 1 and cash >= price * quantity:
+            holdings += quantity
+            cash -= price * quantity
+            sl = price * (1 - stop_loss_pct / 100)
+            tp = price * (1 + take_profit_pct / 100)
+            open_positions[seq] = (sl, tp)
+            heapq.heappush(sl_heap, (-sl, seq))
+            heapq.heappush(tp_heap, (tp, seq))
+            seq += 1
+            trades.append((i, "BUY", price, quantity, cash, holdings, sl, tp, None))
+            changed = True
+        elif signals[i] == -1 and holdings >= quantity:
+            holdings -= quantity
+            cash += price * quantity
+            trades.append((i, "SELL", price, quantity, cash, holdings, None, None, None))
+            changed = True
+        if open_positions and (-sl_heap[0][0] >= price or tp_heap[0][0] <= price):
+            cash, holdings = _close_triggered(price, i, quantity, cash, holdings, sl_heap, tp_heap, open_positions, trades)
+            changed = True
+        if changed:
+            change_ticks.append(i)
+            cash_path.append(cash)
+            holdings_path.append(holdings)
+        i += 1
+
+    # Cash/holdings are piecewise constant between state changes
+    segment = np.searchsorted(np.array(change_ticks), np.arange(n), side="right") - 1
+    equity = np.array(cash_path)[segment] + np.array(holdings_path)[segment] * prices
+
+    stopped_at = None
+    if stop_at_profit_target:
+        reached = np.flatnonzero(equity >= initial_cash * (1 + profit_target_pct / 100))
+        if len(reached):
+            stopped_at = int(reached[0])
+            equity = equity[:stopped_at + 1]
+            trades = [t for t in trades if t[0] <= stopped_at]
+            last = np.searchsorted(np.array(change_ticks), stopped_at, side="right") - 1
+            cash, holdings = cash_path[last], holdings_path[last]
+    columns = ("tick", "signal", "price", "amount", "cash", "holdings", "sl", "tp", "exit_reason")
+    trades = {name: np.array(values, dtype=object if name in ("sl", "tp", "exit_reason") else None)
+              for name, values in zip(columns, zip(*trades) if trades else [()] * len(columns))}
+    return _result(trades, equity, cash, holdings, stopped_at)
+
+def _close_triggered(price, tick, quantity, cash, holdings, sl_heap, tp_heap, open_positions, trades):
+    # Same order and SL-over-TP precedence as PositionBook.pop_triggered
+    hit = set()
+    while sl_heap and -sl_heap[0][0] >= price:
+        seq = heapq.heappop(sl_heap)[1]
+        if seq in open_positions:
+            hit.add(seq)
+    while tp_heap and tp_heap[0][0] <= price:
+        seq = heapq.heappop(tp_heap)[1]
+        if seq in open_positions:
+            hit.add(seq)
+    for seq in sorted(hit):
+        sl, tp = open_positions.pop(seq)
+        cash += quantity * price
+        holdings -= quantity
+        trades.append((tick, "CLOSE", price, quantity, cash, holdings, None, None, "SL Hit" if price <= sl else "TP Hit"))
+    # Drop entries of closed positions left at the top of either heap
+    while sl_heap and sl_heap[0][1] not in open_positions:
+        heapq.heappop(sl_heap)
+    while tp_heap and tp_heap[0][1] not in open_positions:
+        heapq.heappop(tp_heap)
+    return cash, holdings
+
+# --- MOMENTUM BACKTEST ---
+def momentum_signals(prices, short_window=3, long_window=7, momentum_window=5):
+    # +1 BUY, -1 SELL, 0 HOLD at every tick, same rules as momentum.TradingStrategy.generate_signal
+    prices = np.asarray(prices, dtype=np.float64)
+    n = len(prices)
+    history = max(long_window, momentum_window)  # TradingStrategy keeps this many prices
+    short_ma = rolling_mean(prices, short_window)
+    long_ma = rolling_mean(prices, history)
+    # Until `history` prices are held the long average covers everything seen so far
+    warmup = min(n, history - 1)
+    long_ma[:warmup] = np.cumsum(prices[:warmup]) / np.arange(1, warmup + 1)
+    momentum = np.zeros(n)
+    if n >= momentum_window:
+        momentum[momentum_window - 1:] = prices[momentum_window - 1:] - prices[:n - momentum_window + 1]
+    signals = np.zeros(n, dtype=np.int8)
+    signals[(short_ma > long_ma) & (momentum > 0)] = 1
+    signals[(short_ma < long_ma) & (momentum < 0)] = -1
+    signals[:long_window - 1] = 0
+    return signals
+
+def backtest_momentum(prices, short_window=3, long_window=7, momentum_window=5, trade_amount=TRADE_AMOUNT,
+                      initial_cash=INITIAL_CASH):
+    # Replays momentum.TradingBot.run: only signal ticks can change cash/holdings
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    n = len(prices)
+    signals = momentum_signals(prices, short_window, long_window, momentum_window)
+    ticks = np.flatnonzero(signals)
+    cash = float(initial_cash)
+    holdings = 0.0
+    filled, bought = [], []
+    cash_path, holdings_path = [cash], [holdings]
+    for i, signal, price in zip(ticks.tolist(), signals[ticks].tolist(), prices[ticks].tolist()):
+        if signal == 1 and cash >= trade_amount * price:
+            holdings += trade_amount
+            cash -= trade_amount * price
+        elif signal == -1 and holdings >= trade_amount:
+            holdings -= trade_amount
+            cash += trade_amount * price
+        else:
+            continue
+        filled.append(i)
+        bought.append(signal == 1)
+        cash_path.append(cash)
+        holdings_path.append(holdings)
+    filled = np.array(filled, dtype=np.int64)
+    segment = np.searchsorted(filled, np.arange(n), side="right")
+    equity = np.array(cash_path)[segment] + np.array(holdings_path)[segment] * prices
+    trades = {
+        "tick": filled,
+        "action": np.where(bought, "BUY", "SELL"),
+        "price": prices[filled],
+        "amount": np.full(len(filled), trade_amount),
+    }
+    return _result(trades, equity, cash, holdings, None)
+
+def _result(trades, equity, cash, holdings, stopped_at):
+    # trades is a dict of equal-length columns
+    return {
+        "trades": trades,
+        "n_trades": len(trades["tick"]),
+        "equity": equity,
+        "cash": cash,
+        "holdings": holdings,
+        "final_value": float(equity[-1]) if len(equity) else cash,
+        "stopped_at": stopped_at,
+    }
+
+# --- MAIN EXECUTION ---
+def main():
+    parser = argparse.ArgumentParser(description="Backtest a strategy over a historical price file")
+    parser.add_argument("path", help="CSV or Parquet file with a price column, or a TickStore directory")
+    parser.add_argument("--strategy", choices=["grid", "momentum"], default="grid")
+    parser.add_argument("--column", default="price")
+    parser.add_argument("--pair", help="TickStore pair to read")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="TickStore range start, ISO date/time")
+    parser.add_argument("--end", type=datetime.fromisoformat, help="TickStore range end (exclusive)")
+    args = parser.parse_args()
+
+    prices = load_prices(args.path, args.column, args.pair, args.start, args.end)
+    start = time.perf_counter()
+    if args.strategy == "grid":
+        result = backtest_rsi_grid(prices)
+    else:
+        result = backtest_momentum(prices)
+    elapsed = time.perf_counter() - start
+
+    net_profit = result["final_value"] - INITIAL_CASH
+    print(f"Ticks: {len(prices)} in {elapsed:.2f}s, Trades: {result['n_trades']}")
+    print(f"Final Portfolio Value: {result['final_value']:.2f}")
+    print(f"Net Profit: {net_profit:.2f}")
+    if result["stopped_at"] is not None:
+        print(f"Profit target reached at tick {result['stopped_at']}")
+
+if __name__ == "__main__":
+    main()
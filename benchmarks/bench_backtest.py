@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Checks the vectorized backtests against the tick-by-tick bots, then times them on 10M ticks.
+
+import os
+import sys
+import time
+import logging
+import tempfile
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import Grid
+from backtest import backtest_rsi_grid, backtest_momentum
+from ringbuffer import PriceRingBuffer
+from momentum import TradingStrategy, TRADE_AMOUNT
+
+CHECK_TICKS = 20_000
+TICKS = 10_000_000
+
+def random_walk(n, seed=0, start=0.1, step=0.001):
+    rng = np.random.default_rng(seed)
+    return np.abs(start + np.cumsum(rng.normal(0, step, n))) + 0.01
+
+class FilledClient:
+    def place_order(self, *args):
+        return {"Success": True}
+
+def replay_grid_bot(prices, journal_path):
+    bot = Grid.TradingBot(Grid.RsiGridTradingStrategy(), Grid.RiskManager())
+    bot.api_client = FilledClient()
+    bot.journal.close()
+    bot.journal = Grid.TradeJournal(journal_path, Grid.TRADE_COLUMNS)
+    bot.data = PriceRingBuffer(1000)
+    equity = []
+    for i, price in enumerate(prices.tolist()):
+        bot.data.append(i, price)
+        bot.live_trade(bot.strategy.generate_signal(bot.data), price, i)
+        bot.check_sl_tp(price, i)
+        equity.append(bot.update_portfolio_value(price, i))
+        if bot.check_profit_target(equity[-1]):
+            break
+    bot.journal.close()
+    return bot, np.array(equity)
+
+def check_grid():
+    prices = random_walk(CHECK_TICKS)
+    with tempfile.TemporaryDirectory() as tmp:
+        bot, equity = replay_grid_bot(prices, os.path.join(tmp, "trades.csv"))
+    result = backtest_rsi_grid(prices)
+    expected = [(t["timestamp"], t["signal"], t["exit_reason"]) for t in bot.trade_log]
+    trades = result["trades"]
+    got = list(zip(trades["tick"].tolist(), trades["signal"].tolist(), trades["exit_reason"].tolist()))
+    assert got == expected, "trade sequence differs"
+    assert np.array_equal(result["equity"], equity), "equity curve differs"
+    print(f"grid: {len(got)} trades and {len(equity)} equity points identical to TradingBot")
+
+def check_momentum():
+    # momentum.TradingBot.run's per-tick update/signal/trade order, without the sleeps and plotting
+    prices = random_walk(CHECK_TICKS, seed=1, start=35000, step=50)
+    strategy = TradingStrategy()
+    cash, holdings, trades = 100000.0, 0.0, []
+    for i, price in enumerate(prices.tolist()):
+        strategy.update_price(price)
+        signal = strategy.generate_signal()
+        if signal == "BUY" and cash >= TRADE_AMOUNT * price:
+            holdings += TRADE_AMOUNT
+            cash -= TRADE_AMOUNT * price
+            trades.append((i, "BUY"))
+        elif signal == "SELL" and holdings >= TRADE_AMOUNT:
+            holdings -= TRADE_AMOUNT
+            cash += TRADE_AMOUNT * price
+            trades.append((i, "SELL"))
+    result = backtest_momentum(prices)
+    assert list(zip(result["trades"]["tick"].tolist(), result["trades"]["action"].tolist())) == trades, "trade sequence differs"
+    assert result["cash"] == cash and result["holdings"] == holdings
+    print(f"momentum: {len(trades)} trades identical to TradingStrategy")
+
+def main():
+    logging.disable(logging.INFO)
+    check_grid()
+    check_momentum()
+    prices = random_walk(TICKS, seed=2)
+    for name, run in (("grid", lambda: backtest_rsi_grid(prices, stop_at_profit_target=False)),
+                      ("momentum", lambda: backtest_momentum(prices))):
+        t0 = time.perf_counter()
+        result = run()
+        print(f"{name}: {TICKS:,} ticks in {time.perf_counter() - t0:.2f}s, {result['n_trades']:,} trades")
+
+if __name__ == "__main__":
+    main()
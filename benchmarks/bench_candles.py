@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# CandleAggregator building 1s/10s/1m/5m/1h candles in one pass, checked against pandas
+# resample, and its per-tick cost next to re-deriving 10s bars from the raw ticks.
+
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from candles import CandleAggregator, TIMEFRAMES
+
+TICKS = 500_000
+
+def main():
+    rng = np.random.default_rng(0)
+    timestamps = 1_700_000_000 + np.cumsum(rng.exponential(0.2, TICKS))  # ~5 ticks per second
+    prices = 30000 + np.cumsum(rng.normal(0, 5, TICKS))
+    volumes = rng.exponential(0.01, TICKS)
+
+    closed = []
+    aggregator = CandleAggregator(TIMEFRAMES, capacity=TICKS)
+    aggregator.subscribe(lambda tf, candle: closed.append(tf), timeframe=60)
+    start = time.perf_counter()
+    for price, ts, volume in zip(prices.tolist(), timestamps.tolist(), volumes.tolist()):
+        aggregator.update(price, ts, volume)
+    elapsed = time.perf_counter() - start
+    aggregator.flush()
+    print(f"CandleAggregator, {len(TIMEFRAMES)} timeframes: {elapsed / TICKS * 1e9:.0f} ns/tick, {len(closed)} 1m close events")
+
+    frame = pd.DataFrame({"price": prices, "volume": volumes}, index=pd.to_datetime(timestamps, unit="s"))
+    for tf in TIMEFRAMES:
+        expected = frame["price"].resample(f"{tf}s").ohlc().dropna()
+        got = aggregator.series[tf].to_arrays()
+        assert np.allclose(got["open"], expected["open"]) and np.allclose(got["high"], expected["high"])
+        assert np.allclose(got["low"], expected["low"]) and np.allclose(got["close"], expected["close"])
+        assert np.allclose(got["volume"], frame["volume"].resample(f"{tf}s").sum()[expected.index])
+    print("candles match pandas resample for every timeframe")
+
+    sample = 2_000
+    start = time.perf_counter()
+    for i in range(1, sample + 1):
+        frame["price"].iloc[:i].resample("10s").ohlc()
+    print(f"re-deriving 10s bars from raw ticks (first {sample} ticks): {(time.perf_counter() - start) / sample * 1e9:.0f} ns/tick")
+
+if __name__ == "__main__":
+    main()
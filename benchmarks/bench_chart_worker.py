@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Tick-path cost of a live chart: candle updates with no chart, with the off-process
+# ChartRenderer subscribed (every tick closes a candle, the worst case), and the cost of
+# one synchronous mplfinance render in the bot process for comparison.
+
+import os
+import sys
+import time
+import tempfile
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from candles import CandleAggregator
+from chart_worker import ChartRenderer
+
+TICKS = 20_000
+TIMEFRAME = 1
+
+def feed(aggregator, prices):
+    t0 = time.perf_counter()
+    for i, price in enumerate(prices):
+        aggregator.update(price, float(i), 1.0)  # one tick per second: a candle closes every tick
+    return (time.perf_counter() - t0) / len(prices)
+
+def sync_render(prices, path):
+    import matplotlib
+    matplotlib.use("Agg")
+    import pandas as pd
+    import mplfinance as mpf
+    aggregator = CandleAggregator((TIMEFRAME,))
+    feed(aggregator, prices[:500])
+    candles = aggregator.series[TIMEFRAME].to_arrays()
+    df = pd.DataFrame({'Open': candles['open'], 'High': candles['high'], 'Low': candles['low'],
+                       'Close': candles['close'], 'Volume': candles['volume']},
+                      index=pd.to_datetime(candles['time'], unit='s'))
+    t0 = time.perf_counter()
+    mpf.plot(df, type='candle', savefig=dict(fname=path, format="png"))
+    return time.perf_counter() - t0
+
+def main():
+    prices = 30000 + np.cumsum(np.random.default_rng(0).normal(0, 10, TICKS))
+    bare = feed(CandleAggregator((TIMEFRAME,)), prices.tolist())
+    with tempfile.TemporaryDirectory() as tmp:
+        # Queue sized for the burst: the worker is still importing mplfinance when it starts
+        chart = ChartRenderer(os.path.join(tmp, "chart.png"), TIMEFRAME, max_fps=2.0, queue_size=TICKS)
+        aggregator = CandleAggregator((TIMEFRAME,))
+        aggregator.subscribe(chart.on_candle, TIMEFRAME)
+        t0 = time.perf_counter()
+        live = feed(aggregator, prices.tolist())
+        elapsed = time.perf_counter() - t0
+        chart.close()
+        stats = chart.stats()
+        render = sync_render(prices.tolist(), os.path.join(tmp, "sync.png"))
+    print(f"candle update, no chart:     {bare * 1e6:7.2f} us/tick")
+    print(f"candle update, live chart:   {live * 1e6:7.2f} us/tick  ({stats['sent']:,} sent, {stats['dropped']:,} dropped, "
+          f"{stats['frames']} frames over {elapsed:.2f} s)")
+    print(f"synchronous mpf.plot (500 candles): {render * 1000:.1f} ms per frame in the bot process")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Order round-trips against a local stub server: one new connection per request
+# (the old module-level requests.post) versus the pooled keep-alive client.
+
+import os
+import sys
+import json
+import time
+import threading
+import numpy as np
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from roostoo import RoostooAPIClient
+
+ORDERS = 2000
+HANDSHAKE_DELAY = 0.005  # stands in for the TCP+TLS handshake to the real exchange; loopback has none
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # allows keep-alive
+    disable_nagle_algorithm = True
+
+    def _reply(self, body):
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply({"Success": True, "OrderDetail": {"Status": "FILLED"}})
+
+    def setup(self):
+        time.sleep(HANDSHAKE_DELAY)  # paid once per connection
+        super().setup()
+
+    def log_message(self, *args):
+        pass
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+def percentiles(latencies):
+    p50, p99 = np.percentile(np.array(latencies) * 1000, [50, 99])
+    return f"p50 {p50:.3f} ms, p99 {p99:.3f} ms"
+
+def main():
+    server = StubServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    client = RoostooAPIClient("key", "secret", base_url=base_url)
+
+    latencies = []
+    for _ in range(ORDERS):
+        params = {"pair": "BTC/USD", "side": "BUY", "type": "MARKET", "quantity": "1", "timestamp": client._get_timestamp()}
+        start = time.perf_counter()
+        requests.post(f"{base_url}/v3/place_order", data=params, headers=client._headers(params, is_signed=True))
+        latencies.append(time.perf_counter() - start)
+    print(f"requests.post per order: {server.connections} connections, {percentiles(latencies)}")
+
+    server.connections = 0
+    for _ in range(ORDERS):
+        client.place_order("BTC/USD", "BUY", "MARKET", "1")
+    stats = client.latency_stats()["/v3/place_order"]
+    print(f"pooled session:          {server.connections} connections, p50 {stats['p50_ms']:.3f} ms, p99 {stats['p99_ms']:.3f} ms")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Cold-start cost of the bots: wall time and peak RSS of a fresh interpreter importing each
+# module, and momentum with the plotting stack loaded eagerly as it used to be.
+
+import os
+import sys
+import json
+import tempfile
+import subprocess
+import statistics
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+RUNS = 5
+
+CASES = {
+    "python + numpy": "import numpy",
+    "Grid": "import Grid",
+    "dca": "import dca",
+    "momentum (headless)": "import momentum",
+    "momentum (eager plotting)": "import pandas, matplotlib.pyplot, mplfinance; import momentum",
+}
+
+WORKER = """
+import sys, time, json, resource
+sys.path.insert(0, {root!r})
+t0 = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - t0
+heavy = [m for m in ("pandas", "matplotlib", "mplfinance") if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, "heavy": heavy}}))
+"""
+
+def measure(code, cwd):
+    runs = []
+    for _ in range(RUNS):
+        out = subprocess.run([sys.executable, "-c", WORKER.format(root=os.path.abspath(ROOT), code=code)],
+                             cwd=cwd, capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(out.strip().splitlines()[-1]))
+    return (statistics.median(r["seconds"] for r in runs), statistics.median(r["rss_mb"] for r in runs), runs[0]["heavy"])
+
+def main():
+    # Fresh interpreters run in a scratch directory, away from the bot's files
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"median of {RUNS} fresh interpreters:")
+        for name, code in CASES.items():
+            seconds, rss, heavy = measure(code, tmp)
+            print(f"  {name:<26} import {seconds * 1000:8.1f} ms   peak RSS {rss:7.1f} MB   {', '.join(heavy) or '-'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Per-tick cost of the streaming indicators as the window grows, next to the old
+# list + pop(0) + np.mean approach of momentum.TradingStrategy.
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from indicators import SMA, EMA, Momentum, RollingMax, RollingMin
+
+TICKS = 100_000
+WINDOWS = (10, 100, 1000, 10000)
+
+def list_mean(prices, window):
+    history = []
+    for price in prices:
+        history.append(price)
+        if len(history) > window:
+            history.pop(0)
+        np.mean(history)
+
+def streaming(indicator_class):
+    def run(prices, window):
+        indicator = indicator_class(window)
+        for price in prices:
+            indicator.update(price)
+    return run
+
+def main():
+    prices = (30000 + np.cumsum(np.random.default_rng(0).normal(0, 10, TICKS))).tolist()
+    print(f"{'ns/tick':>12}" + "".join(f"{'window ' + str(w):>14}" for w in WINDOWS))
+    for name, run in (("list+np.mean", list_mean), ("SMA", streaming(SMA)), ("EMA", streaming(EMA)),
+                      ("Momentum", streaming(Momentum)), ("RollingMax", streaming(RollingMax)),
+                      ("RollingMin", streaming(RollingMin))):
+        cells = []
+        for window in WINDOWS:
+            ticks = prices[:TICKS // 10] if run is list_mean else prices
+            start = time.perf_counter()
+            run(ticks, window)
+            cells.append(f"{(time.perf_counter() - start) / len(ticks) * 1e9:14.0f}")
+        print(f"{name:>12}" + "".join(cells))
+
+if __name__ == "__main__":
+    main()
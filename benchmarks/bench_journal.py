@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Hot-path cost of logging a trade (per-trade pandas to_csv vs TradeJournal.append), and a
+# crash check: a child process journals trades, is killed with os._exit mid-stream, and every
+# trade it saw acknowledged must be readable afterwards, also after a restart that reopens the
+# journal behind a torn record and appends more trades.
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+from journal import TradeJournal
+
+COLUMNS = ["timestamp", "signal", "price", "amount", "cash", "holdings", "order_id", "sl", "tp", "exit_reason"]
+TRADES = 2000
+
+def record(i):
+    return {"timestamp": f"2025-01-01 00:00:{i % 60:02d}", "signal": "BUY", "price": 0.1 + i * 1e-6, "amount": 1000,
+            "cash": 100000 - i, "holdings": 1000.0 * i, "order_id": f"ORDER-{i:06d}", "sl": 0.099, "tp": 0.102, "exit_reason": None}
+
+def bench_hot_path(tmp):
+    path = os.path.join(tmp, "to_csv.csv")
+    t0 = time.perf_counter()
+    for i in range(TRADES):
+        header = not os.path.exists(path) or os.stat(path).st_size == 0
+        pd.DataFrame([record(i)]).to_csv(path, mode='a', header=header, index=False)
+    print(f"to_csv per trade:       {(time.perf_counter() - t0) / TRADES * 1e6:9.2f} us/trade")
+
+    for fmt in ("csv", "binary"):
+        journal = TradeJournal(os.path.join(tmp, f"journal.{fmt}"), COLUMNS, fmt=fmt)
+        records = [record(i) for i in range(TRADES)]
+        t0 = time.perf_counter()
+        for r in records:
+            journal.append(r)
+        hot = (time.perf_counter() - t0) / TRADES
+        journal.close()
+        assert len(TradeJournal.read(journal.path, fmt)) == TRADES
+        print(f"TradeJournal.append ({fmt}): {hot * 1e6:6.2f} us/trade")
+
+def crash_child(path, fmt):
+    journal = TradeJournal(path, COLUMNS, fmt=fmt, batch_size=64, flush_interval=0.01)
+    for i in range(TRADES):
+        journal.append(record(i))
+        if i % 97 == 0:
+            journal.sync()
+            print(i, flush=True)  # acknowledged up to and including trade i
+    os._exit(1)  # crash: no close(), pending records are lost
+
+def check_crash_recovery(tmp):
+    for fmt in ("csv", "binary"):
+        path = os.path.join(tmp, f"crash.{fmt}")
+        child = subprocess.run([sys.executable, __file__, "--crash-child", path, fmt], capture_output=True, text=True)
+        acknowledged = int(child.stdout.split()[-1])
+        recovered = TradeJournal.read(path, fmt)
+        assert len(recovered) > acknowledged
+        assert [r["order_id"] for r in recovered[:acknowledged + 1]] == [f"ORDER-{i:06d}" for i in range(acknowledged + 1)]
+        print(f"crash recovery ({fmt}): acknowledged {acknowledged + 1}, recovered {len(recovered)}")
+
+        # Restart: the crash also tore the record being written, then the bot journals more trades
+        with open(path, "ab") as f:
+            f.write(b"2025-01-01 00:00:00,BU" if fmt == "csv" else TradeJournal._encode(list(record(TRADES).values()))[:-5])
+        journal = TradeJournal(path, COLUMNS, fmt=fmt)
+        for i in range(TRADES, TRADES + 10):
+            journal.append(record(i))
+        assert journal.sync()
+        journal.close()
+        restarted = TradeJournal.read(path, fmt)
+        assert [r["order_id"] for r in restarted] == [r["order_id"] for r in recovered] + [f"ORDER-{i:06d}" for i in range(TRADES, TRADES + 10)]
+        print(f"restart after crash ({fmt}): torn record dropped, {len(restarted) - len(recovered)} new records readable")
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        bench_hot_path(tmp)
+        check_crash_recovery(tmp)
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--crash-child"]:
+        crash_child(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Marking a DCA portfolio to market: a dict of per-pair holdings valued pair by pair
+# against PortfolioLedger.value() on a parse_prices()-style price vector.
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from ledger import PortfolioLedger
+
+REPEAT = 20_000
+
+def main():
+    rng = np.random.default_rng(0)
+    for n in (2, 100, 500):
+        pairs = [f"P{i}/USD" for i in range(n)]
+        prices = rng.uniform(0.1, 50000, n)
+        amounts = rng.uniform(0, 10, n)
+        ledger = PortfolioLedger(pairs, 1e9)
+        ledger.buy(np.arange(n), amounts, prices)
+        holdings = dict(zip(pairs, amounts.tolist()))
+        quotes = dict(zip(pairs, prices.tolist()))
+        cash = ledger.cash
+
+        t0 = time.perf_counter()
+        for _ in range(REPEAT):
+            value = cash + sum(units * quotes[pair] for pair, units in holdings.items())
+        loop = (time.perf_counter() - t0) / REPEAT
+        t0 = time.perf_counter()
+        for _ in range(REPEAT):
+            ledger_value = ledger.value(prices)
+        vectorized = (time.perf_counter() - t0) / REPEAT
+        assert abs(value - ledger_value) < 1e-6 * abs(value)
+        print(f"{n:4d} pairs: per-pair loop {loop * 1e6:8.2f} us   ledger.value {vectorized * 1e6:6.2f} us")
+
+if __name__ == "__main__":
+    main()
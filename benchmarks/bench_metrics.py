@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Instrumentation overhead per tick (sampled stage timers around process_tick's three
+# stages) and histogram percentile error against exact numpy percentiles.
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from metrics import Metrics, LatencyHistogram
+
+TICKS = 1_000_000
+SAMPLES = 200_000
+
+def instrumented_ticks(metrics, n):
+    clock = time.perf_counter_ns
+    for _ in range(n):
+        received = clock()
+        t = metrics.sample()
+        if t:
+            t = metrics.lap("signal", t)
+        if t:
+            t = metrics.lap("trade", t)
+        if t:
+            t = metrics.lap("sl_tp", t)
+    return received
+
+def bare_ticks(n):
+    for _ in range(n):
+        pass
+
+def main():
+    t0 = time.perf_counter()
+    bare_ticks(TICKS)
+    bare = time.perf_counter() - t0
+    for sample_every in (1, 16, 256):
+        metrics = Metrics(sample_every=sample_every)
+        t0 = time.perf_counter()
+        instrumented_ticks(metrics, TICKS)
+        elapsed = time.perf_counter() - t0
+        print(f"sample 1/{sample_every:<4} {(elapsed - bare) / TICKS * 1e9:8.1f} ns/tick overhead")
+
+    hist = LatencyHistogram()
+    values = np.random.default_rng(0).lognormal(10, 1.5, SAMPLES).astype(np.int64)
+    t0 = time.perf_counter()
+    for v in values.tolist():
+        hist.record(v)
+    record = (time.perf_counter() - t0) / SAMPLES
+    print(f"record: {record * 1e9:.1f} ns")
+    for q in (50, 90, 99, 99.9):
+        exact = float(np.percentile(values, q))
+        print(f"  p{q:<5} exact {exact / 1000:10.1f} us  histogram {hist.percentile(q) / 1000:10.1f} us "
+              f"({(hist.percentile(q) / exact - 1) * 100:+.1f}%)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# MultiPairRunner with a growing number of pairs: ticker requests per interval and
+# memory per bot, against one TradingBot process per pair (one request per pair each).
+
+import os
+import sys
+import time
+import logging
+import tempfile
+import tracemalloc
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import Grid
+from journal import TradeJournal
+from roostoo import parse_prices
+
+ITERATIONS = 200
+
+class CountingClient:
+    def __init__(self, pairs):
+        self.pairs = pairs
+        self.requests = 0
+        self.rng = np.random.default_rng(0)
+        self.prices = np.full(len(pairs), 1.0)
+
+    def get_prices(self, pairs):
+        self.requests += 1
+        self.prices *= 1 + self.rng.normal(0, 0.002, len(self.prices))
+        return parse_prices({"Data": {p: {"LastPrice": v} for p, v in zip(self.pairs, self.prices.tolist())}}, pairs)
+
+    def place_order(self, *args):
+        return {"Success": True}
+
+def main():
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (1, 10, 50, 200):
+            pairs = [f"P{i}/USD" for i in range(n)]
+            client = CountingClient(pairs)
+            tracemalloc.start()
+            runner = Grid.MultiPairRunner(client, TradeJournal(os.path.join(tmp, f"trades_{n}.csv"), Grid.TRADE_COLUMNS))
+            for pair in pairs:
+                runner.add_bot(pair)
+            start = time.perf_counter()
+            for _ in range(ITERATIONS):
+                runner.run_iteration()
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            runner.journal.close()
+            print(f"{n:>4} pairs: {client.requests / ITERATIONS:.0f} request/interval (vs {n} with one bot per pair), "
+                  f"{elapsed / ITERATIONS * 1e3:7.2f} ms/interval, peak {peak / n / 1024:7.1f} KiB/bot")
+
+if __name__ == "__main__":
+    main()
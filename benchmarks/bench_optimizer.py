@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Parameter-sweep throughput as the process pool grows (1, 2, 4, ... up to the core count).
+
+import os
+import sys
+import time
+import logging
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from optimizer import optimize
+
+TICKS = 200_000
+SAMPLES = 64
+
+def main():
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(0)
+    prices = np.abs(0.1 + np.cumsum(rng.normal(0, 0.001, TICKS))) + 0.01
+    cores = os.cpu_count() or 1
+    workers = 1
+    baseline = None
+    while True:
+        start = time.perf_counter()
+        rows = optimize(prices, "grid", "random", SAMPLES, workers=workers, seed=0)
+        rate = len(rows) / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"{workers:>3} workers: {rate:8.1f} combinations/s ({rate / baseline:.2f}x)")
+        if workers >= cores:
+            break
+        workers = min(cores, workers * 2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Client-side cost of one signed order up to the bytes handed to the connection: the old
+# path (sort, hmac.new from the raw secret, requests form-encoding the dict again) against
+# the canonical body signed with a copied HMAC state, and a staged order template.
+
+import os
+import sys
+import time
+import hmac
+import hashlib
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from roostoo import RoostooAPIClient, FORM_CONTENT_TYPE
+from mock_exchange import DEFAULT_API_KEY, DEFAULT_SECRET_KEY
+
+ORDERS = 50_000
+URL = "http://127.0.0.1/v3/place_order"
+
+def old_path(client, session):
+    secret = DEFAULT_SECRET_KEY.encode()
+    for _ in range(ORDERS):
+        params = {"pair": "BTC/USD", "side": "BUY", "type": "MARKET", "quantity": "1000", "timestamp": client._get_timestamp()}
+        query_string = '&'.join([f"{key}={value}" for key, value in sorted(params.items())])
+        signature = hmac.new(secret, query_string.encode(), hashlib.sha256).hexdigest()
+        headers = {"Content-Type": FORM_CONTENT_TYPE, "RST-API-KEY": client.api_key, "MSG-SIGNATURE": signature}
+        session.prepare_request(requests.Request("POST", URL, data=params, headers=headers))
+
+def canonical_path(client, session):
+    for _ in range(ORDERS):
+        params = {"pair": "BTC/USD", "side": "BUY", "type": "MARKET", "quantity": "1000", "timestamp": client._get_timestamp()}
+        signature, query_string = client._sign(params)
+        headers = {"Content-Type": FORM_CONTENT_TYPE, "RST-API-KEY": client.api_key, "MSG-SIGNATURE": signature}
+        session.prepare_request(requests.Request("POST", URL, data=query_string.encode(), headers=headers))
+
+def template_path(client, session):
+    for _ in range(ORDERS):
+        body, signature = client.prepare_order("BTC/USD", "BUY", "MARKET", "1000").encode(client._get_timestamp())
+        headers = {"Content-Type": FORM_CONTENT_TYPE, "RST-API-KEY": client.api_key, "MSG-SIGNATURE": signature}
+        session.prepare_request(requests.Request("POST", URL, data=body, headers=headers))
+
+def sign_only(client):
+    # Signature and body alone, without requests' request preparation
+    secret = DEFAULT_SECRET_KEY.encode()
+    params = {"pair": "BTC/USD", "side": "BUY", "type": "MARKET", "quantity": "1000", "timestamp": client._get_timestamp()}
+    template = client.prepare_order("BTC/USD", "BUY", "MARKET", "1000")
+    results = {}
+    t0 = time.perf_counter()
+    for _ in range(ORDERS):
+        query_string = '&'.join([f"{key}={value}" for key, value in sorted(params.items())])
+        hmac.new(secret, query_string.encode(), hashlib.sha256).hexdigest()
+    results["hmac.new"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(ORDERS):
+        client._sign(params)
+    results["hmac copy"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(ORDERS):
+        template.encode(params["timestamp"])
+    results["template"] = time.perf_counter() - t0
+    return results
+
+def main():
+    client = RoostooAPIClient(DEFAULT_API_KEY, DEFAULT_SECRET_KEY)
+    session = requests.Session()
+    print(f"per order, signing + request preparation ({ORDERS:,} orders):")
+    for name, path in (("old", old_path), ("canonical body", canonical_path), ("order template", template_path)):
+        t0 = time.perf_counter()
+        path(client, session)
+        print(f"  {name:<15} {(time.perf_counter() - t0) / ORDERS * 1e6:7.2f} us")
+    print("per order, signature and body only:")
+    for name, elapsed in sign_only(client).items():
+        print(f"  {name:<15} {elapsed / ORDERS * 1e6:7.2f} us")
+
+if __name__ == "__main__":
+    main()
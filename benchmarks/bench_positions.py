@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Per-tick SL/TP check with 100k historical (closed) positions and a handful open:
+# the old scan over every position ever opened versus PositionBook.
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from positions import PositionBook
+
+HISTORY = 100_000
+OPEN = 50
+TICKS = 2_000
+
+def make_position(price):
+    return {'entry_price': price, 'quantity': 1, 'sl': price * 0.99, 'tp': price * 1.02, 'status': 'open'}
+
+def scan_sl_tp(positions, price):
+    closed = []
+    for pos in positions:
+        if pos['status'] == 'open':
+            exit_reason = None
+            if price <= pos['sl']:
+                exit_reason = "SL Hit"
+            elif price >= pos['tp']:
+                exit_reason = "TP Hit"
+            if exit_reason:
+                pos['status'] = 'closed'
+                closed.append((pos, exit_reason))
+    return closed
+
+def main():
+    rng = np.random.default_rng(0)
+    prices = (100 + np.cumsum(rng.normal(0, 0.05, TICKS))).tolist()
+
+    positions = [dict(make_position(100.0), status='closed') for _ in range(HISTORY)]
+    positions += [make_position(100.0 + i * 0.01) for i in range(OPEN)]
+    t0 = time.perf_counter()
+    scanned = [scan_sl_tp(positions, price) for price in prices]
+    scan_time = (time.perf_counter() - t0) / TICKS
+
+    book = PositionBook()
+    for _ in range(HISTORY):
+        book.add(make_position(100.0))
+        book.pop_triggered(0.0)  # closed straight away, ends up in the archive
+    for i in range(OPEN):
+        book.add(make_position(100.0 + i * 0.01))
+    t0 = time.perf_counter()
+    indexed = [book.pop_triggered(price) for price in prices]
+    book_time = (time.perf_counter() - t0) / TICKS
+
+    assert [[(p['sl'], r) for p, r in tick] for tick in scanned] == [[(p['sl'], r) for p, r in tick] for tick in indexed]
+    print(f"{HISTORY:,} closed + {OPEN} open positions")
+    print(f"  list scan:     {scan_time * 1e6:10.2f} us/tick")
+    print(f"  PositionBook:  {book_time * 1e6:10.2f} us/tick ({len(book.archive):,} archived)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Memory per record and append cost: Grid's old trade log (a dict per trade) and portfolio
+# history (a (datetime, float) tuple per tick) against TradeLog and EquityHistory.
+
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from records import TradeLog, EquityHistory
+
+EQUITY_POINTS = 1_000_000
+TRADES = 100_000
+
+def measure(fill):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    kept = fill()
+    elapsed = time.perf_counter() - t0
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return kept, size, elapsed
+
+# Each record gets a new datetime, as a running bot creates one per tick; the lists keep it alive
+def equity_list(n, start):
+    history = []
+    for i in range(n):
+        history.append((start + timedelta(seconds=i), 100000.0 + i))
+    return history
+
+def equity_store(n, start):
+    history = EquityHistory()
+    for i in range(n):
+        history.append(start + timedelta(seconds=i), 100000.0 + i)
+    return history
+
+def trade_dicts(n, start):
+    log = []
+    for i in range(n):
+        timestamp = start + timedelta(seconds=i)
+        log.append({"pair": "EPIC/USD", "timestamp": timestamp, "signal": "CLOSE", "price": 1.0 + i, "amount": 1000,
+                    "cash": 100000.0 - i, "holdings": float(i), "order_id": f"ORDER-{i:06d}", "sl": None, "tp": None,
+                    "exit_reason": "TP Hit"})
+    return log
+
+def trade_store(n, start):
+    log = TradeLog()
+    for i in range(n):
+        log.append(start + timedelta(seconds=i), "CLOSE", 1.0 + i, 1000, 100000.0 - i, float(i), i, exit_reason="TP Hit")
+    return log
+
+def report(name, n, old, new):
+    (_, old_size, old_time), (_, new_size, new_time) = old, new
+    print(f"{name} x {n:,}:")
+    print(f"  list        {old_size / n:7.1f} bytes/record  {old_time / n * 1e6:6.2f} us/append")
+    print(f"  columnar    {new_size / n:7.1f} bytes/record  {new_time / n * 1e6:6.2f} us/append  "
+          f"({old_size / new_size:.1f}x smaller)")
+
+def main():
+    start = datetime.now()
+    report("equity points", EQUITY_POINTS, measure(lambda: equity_list(EQUITY_POINTS, start)),
+           measure(lambda: equity_store(EQUITY_POINTS, start)))
+    report("trades", TRADES, measure(lambda: trade_dicts(TRADES, start)), measure(lambda: trade_store(TRADES, start)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Tick-append cost of PriceRingBuffer against the old per-tick pd.concat pattern.
+
+import os
+import sys
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from ringbuffer import PriceRingBuffer
+
+TICKS = 1_000_000
+BLOCK = 100_000
+CONCAT_TICKS = 5_000
+
+def bench_concat():
+    data = pd.DataFrame(columns=["timestamp", "price"])
+    t0 = time.perf_counter()
+    for i in range(CONCAT_TICKS):
+        data = pd.concat([data, pd.DataFrame([{"timestamp": i, "price": float(i)}])], ignore_index=True)
+    elapsed = time.perf_counter() - t0
+    print(f"pd.concat, {CONCAT_TICKS:,} ticks: {elapsed / CONCAT_TICKS * 1e6:8.1f} us/tick")
+
+def bench_ring(spill_path=None):
+    buffer = PriceRingBuffer(100_000, spill_path=spill_path)
+    label = "ring buffer + spill" if spill_path else "ring buffer"
+    for start in range(0, TICKS, BLOCK):
+        t0 = time.perf_counter()
+        for i in range(start, start + BLOCK):
+            buffer.append(i, float(i))
+        elapsed = time.perf_counter() - t0
+        print(f"{label}, ticks {start + BLOCK:>9,}: {elapsed / BLOCK * 1e6:8.3f} us/tick")
+    assert buffer.prices(3).tolist() == [TICKS - 3.0, TICKS - 2.0, TICKS - 1.0]
+    if spill_path:
+        buffer.flush()
+        history = PriceRingBuffer.read_spill(spill_path)
+        assert len(history) == TICKS and np.array_equal(history["price"], np.arange(TICKS, dtype=float))
+
+def main():
+    bench_concat()
+    bench_ring()
+    with tempfile.TemporaryDirectory() as tmp:
+        bench_ring(os.path.join(tmp, "spill.bin"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# RiskEngine against a full NumPy recomputation: same numbers, and a per-update cost that
+# does not grow with the number of portfolio values seen. The VaR limit is enabled, so the
+# updates and the limit check time the sorted VaR window too.
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from risk import RiskEngine, per_period_rate
+
+TICKS = 1_000_000
+BLOCK = 100_000
+VAR_WINDOW = 1000
+
+def reference(values, risk_free_rate, var_window, confidence):
+    returns = np.diff(values) / values[:-1]
+    excess = returns - risk_free_rate
+    downside = np.sqrt(np.mean(np.minimum(excess, 0) ** 2))
+    peak = np.maximum.accumulate(values)
+    window = returns[-var_window:]
+    k = int((1 - confidence) * (len(window) - 1))
+    return {
+        "sharpe": excess.mean() / excess.std(),
+        "sortino": excess.mean() / downside,
+        "max_drawdown_pct": ((peak - values) / peak).max() * 100,
+        "var_pct": max(0.0, -np.partition(window, k)[k]) * 100,
+    }
+
+def main():
+    rng = np.random.default_rng(0)
+    values = 100000 * np.cumprod(1 + rng.normal(0, 0.001, TICKS))
+    rf = per_period_rate(2, 10)
+    engine = RiskEngine(rf, var_window=VAR_WINDOW, max_var_pct=100)  # never breached, always computed
+    series = values.tolist()
+    for start in range(0, TICKS, BLOCK):
+        t0 = time.perf_counter()
+        for value in series[start:start + BLOCK]:
+            engine.update(value)
+            engine.breach()
+        print(f"updates {start + BLOCK:>9,}: {(time.perf_counter() - t0) / BLOCK * 1e9:6.0f} ns/update + limit check")
+
+    expected = reference(values, rf, VAR_WINDOW, engine.var_confidence)
+    for name, got in engine.summary().items():
+        assert np.isclose(got, expected[name], rtol=1e-9), name
+    print("summary matches the full recomputation:", {k: round(v, 6) for k, v in engine.summary().items()})
+
+    t0 = time.perf_counter()
+    for _ in range(100):
+        engine.breach()
+    print(f"limit check with VaR: {(time.perf_counter() - t0) / 100 * 1e6:.2f} us")
+    window = np.array(engine.returns)
+    k = int((1 - engine.var_confidence) * (VAR_WINDOW - 1))
+    t0 = time.perf_counter()
+    for _ in range(100):
+        np.partition(window, k)
+    print(f"np.partition over the window, for comparison: {(time.perf_counter() - t0) / 100 * 1e6:.2f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Per-tick latency of the streaming RSI over a long run, plus a check against the
+# pandas rolling-mean RSI that RsiGridTradingStrategy used to recompute every tick.
+
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from indicators import StreamingRSI
+
+TICKS = 1_000_000
+BLOCK = 100_000
+RSI_PERIOD = 14
+
+def random_walk(n, seed=42):
+    rng = np.random.default_rng(seed)
+    return 0.1 + np.cumsum(rng.normal(0, 0.0005, n)).clip(-0.09, None)
+
+def pandas_rsi(prices, period):
+    delta = pd.Series(prices).diff().dropna()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    rs = gain / loss
+    return (100 - (100 / (1 + rs))).to_numpy()
+
+def check_against_pandas(n=20_000):
+    prices = random_walk(n, seed=7)
+    expected = pandas_rsi(prices, RSI_PERIOD)
+    rsi = StreamingRSI(RSI_PERIOD)
+    got = np.array([np.nan if v is None else v for v in map(rsi.update, prices)])[1:]
+    max_error = np.nanmax(np.abs(got - expected))
+    print(f"max |streaming - pandas| over {n} ticks: {max_error:.3e}")
+    assert np.allclose(got, expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+def main():
+    check_against_pandas()
+    for mode in ("sma", "wilder"):
+        rsi = StreamingRSI(RSI_PERIOD, mode=mode)
+        prices = random_walk(TICKS).tolist()
+        print(f"mode={mode}")
+        for start in range(0, TICKS, BLOCK):
+            block = prices[start:start + BLOCK]
+            t0 = time.perf_counter()
+            for price in block:
+                rsi.update(price)
+            elapsed = time.perf_counter() - t0
+            print(f"  ticks {start + BLOCK:>9,}: {elapsed / len(block) * 1e9:8.1f} ns/tick")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Tick period drift: sleeping a fixed interval after each fetch (the old loops) versus the
+# deadline scheduler, with a simulated fetch that takes 20-40 ms.
+
+import os
+import sys
+import time
+import random
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from scheduler import TickScheduler
+
+INTERVAL = 0.1
+TICKS = 50
+
+def fetch(rng):
+    time.sleep(rng.uniform(0.02, 0.04))
+
+def sleep_after_work():
+    rng = random.Random(0)
+    starts = []
+    for _ in range(TICKS):
+        starts.append(time.monotonic())
+        fetch(rng)
+        time.sleep(INTERVAL)
+    return np.array(starts)
+
+def scheduled():
+    rng = random.Random(0)
+    starts = []
+
+    def tick():
+        starts.append(time.monotonic())
+        fetch(rng)
+        return len(starts) >= TICKS
+
+    scheduler = TickScheduler()
+    scheduler.every(INTERVAL, tick)
+    scheduler.run()
+    return np.array(starts), scheduler.stats()["tick"]
+
+def report(name, starts):
+    periods = np.diff(starts) * 1000
+    drift = (starts[-1] - starts[0] - (len(starts) - 1) * INTERVAL) * 1000
+    print(f"{name:<18} period mean {periods.mean():7.2f} ms  p99 {np.percentile(periods, 99):7.2f} ms  "
+          f"drift after {TICKS} ticks {drift:8.1f} ms")
+
+def main():
+    report("sleep after work", sleep_after_work())
+    starts, stats = scheduled()
+    report("TickScheduler", starts)
+    print(f"  lateness mean {stats['mean_lateness_ms']:.2f} ms  max {stats['max_lateness_ms']:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Reading recorded ticks back: a CSV of (timestamp, price) parsed with pandas versus the
+# memory-mapped TickStore, for the whole history and for a one-hour range.
+
+import os
+import sys
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from tickstore import TickStore
+
+TICKS = 5_000_000  # one per second, ~58 days
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+def main():
+    ts = int(START.timestamp() * 1e9) + np.arange(TICKS, dtype=np.int64) * 10**9
+    px = 1 + np.abs(np.cumsum(np.random.default_rng(0).normal(0, 0.002, TICKS)))
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "ticks.csv")
+        pd.DataFrame({"timestamp": ts, "price": px}).to_csv(csv_path, index=False)
+
+        store = TickStore(os.path.join(tmp, "store"), block_size=TICKS)
+        t0 = time.perf_counter()
+        for a, b in zip(ts.tolist(), px.tolist()):
+            store.append("BTC/USD", a, b)
+        store.close()
+        append = (time.perf_counter() - t0) / TICKS
+
+        t0 = time.perf_counter()
+        frame = pd.read_csv(csv_path)
+        csv_all = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        start, end = ts[TICKS // 2], ts[TICKS // 2] + 3600 * 10**9
+        hour = frame.loc[(frame["timestamp"] >= start) & (frame["timestamp"] < end), "price"].to_numpy()
+        csv_hour = csv_all + time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        all_ts, all_px = store.read("BTC/USD")
+        float(all_px.sum())  # touch every page
+        store_all = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        _, store_hour_px = store.read("BTC/USD", int(start), int(end))
+        float(store_hour_px.sum())
+        store_hour = time.perf_counter() - t0
+
+        assert np.array_equal(all_ts, ts) and np.array_equal(all_px, px)
+        assert np.allclose(store_hour_px, hour)  # the CSV round trip may be off by an ulp
+        print(f"{TICKS:,} ticks over {len(store.days('BTC/USD'))} daily partitions, append {append * 1e6:.2f} us/tick")
+        print(f"  all ticks:  CSV {csv_all * 1000:9.1f} ms   TickStore {store_all * 1000:9.1f} ms")
+        print(f"  one hour:   CSV {csv_hour * 1000:9.1f} ms   TickStore {store_hour * 1000:9.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Startup cost of a Grid bot with recorded history: feeding the ticks through
+# calculate_rsi one by one, the vectorized warm(), and restoring a checkpoint.
+
+import os
+import sys
+import time
+import logging
+import tempfile
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import Grid
+from journal import TradeJournal
+
+class FilledClient:
+    def place_order(self, *args):
+        return {"Success": True}
+
+def make_bot(tmp, checkpoint_path=None):
+    journal = TradeJournal(os.path.join(tmp, "trades.csv"), Grid.TRADE_COLUMNS, fsync="never")
+    return Grid.TradingBot(Grid.RsiGridTradingStrategy(rsi_mode="wilder"), Grid.RiskManager(), api_client=FilledClient(),
+                           journal=journal, checkpoint_path=checkpoint_path)
+
+def main():
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (1_000, 100_000):
+            prices = 1 + np.abs(np.cumsum(np.random.default_rng(0).normal(0, 0.002, n)))
+            timestamps = time.time_ns() - np.arange(n, 0, -1, dtype=np.int64) * 10**10
+
+            bot = make_bot(tmp)
+            t0 = time.perf_counter()
+            for timestamp, price in zip(timestamps.tolist(), prices.tolist()):
+                bot.data.append(timestamp, price)
+            bot.strategy.calculate_rsi(bot.data)
+            cold = time.perf_counter() - t0
+
+            warm = make_bot(tmp, os.path.join(tmp, "checkpoint.pkl"))
+            t0 = time.perf_counter()
+            warm.warm_start(timestamps, prices)
+            hydrate = time.perf_counter() - t0
+            assert abs(warm.strategy.rsi.value - bot.strategy.rsi.value) < 1e-9
+
+            warm.save_checkpoint()
+            restored = make_bot(tmp, warm.checkpoint_path)
+            t0 = time.perf_counter()
+            Grid.warm_start(restored)
+            restore = time.perf_counter() - t0
+            assert restored.strategy.rsi.value == warm.strategy.rsi.value
+
+            print(f"{n:>8,} ticks: tick-by-tick {cold * 1000:8.2f} ms   warm() {hydrate * 1000:7.2f} ms   "
+                  f"checkpoint restore {restore * 1000:6.2f} ms")
+
+if __name__ == "__main__":
+    main()
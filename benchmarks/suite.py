@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Per-tick hot paths at growing history sizes. Each (case, history) pair runs in its own
+# subprocess so peak RSS is per case; results go to JSON and can be compared to a baseline:
+#
+#   python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+#   python benchmarks/suite.py --baseline benchmarks/baseline.json   # exit status 1 on regression
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import resource
+import tempfile
+import subprocess
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)  # ticks of history before measuring
+MEASURE = 20000  # ticks timed per case
+TRADE_EVERY = 100  # history ticks per logged trade / archived position
+OPEN_POSITIONS = 20
+TOLERANCE = 0.25  # slower / bigger than baseline by more than this fraction is a regression
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results.json")
+
+def synthetic_prices(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return 1.0 + np.abs(np.cumsum(rng.normal(0, 0.002, n)))
+
+class FilledClient:
+    # Every order fills, nothing leaves the process
+    def place_order(self, *args):
+        return {"Success": True}
+
+# --- SETUP ---
+def make_grid_bot(history, journal_dir):
+    import Grid
+    from journal import TradeJournal
+    from records import SIGNAL_CODES, EXIT_REASON_CODES
+    from datetime import datetime, timedelta
+
+    journal = TradeJournal(os.path.join(journal_dir, "trades.csv"), Grid.TRADE_COLUMNS, fsync="never")
+    bot = Grid.TradingBot(Grid.RsiGridTradingStrategy(), Grid.RiskManager(), api_client=FilledClient(), journal=journal)
+    prices = synthetic_prices(history)
+    start = datetime.now() - timedelta(seconds=Grid.FETCH_INTERVAL * history)
+    step = Grid.FETCH_INTERVAL * 10**9
+    ts0 = int(start.timestamp() * 1e9)
+    for i, price in enumerate(prices[-bot.data.capacity:].tolist(), start=max(0, history - bot.data.capacity)):
+        bot.data.append(ts0 + i * step, price)
+    bot.data.total = history  # what a bot that ran `history` ticks would report
+    bot.strategy.calculate_rsi(bot.data)
+    for value in (bot.initial_cash * prices[-Grid.VAR_WINDOW - 1:] / prices[-1]).tolist():
+        bot.risk_manager.update_portfolio(value, start)
+    bot.portfolio_history.extend(timestamp=ts0 + np.arange(history, dtype=np.int64) * step,
+                                 value=np.full(history, float(bot.initial_cash)))
+    trades = history // TRADE_EVERY
+    bot.trade_log.extend(timestamp=ts0, signal=SIGNAL_CODES["CLOSE"], price=1.0, amount=1.0,
+                         cash=bot.cash, holdings=bot.holdings, order_id=np.arange(1, trades + 1),
+                         exit_reason=EXIT_REASON_CODES["TP Hit"])
+    for _ in range(history // TRADE_EVERY):
+        bot.positions.add({'entry_price': 1.0, 'quantity': 1, 'sl': 0.99, 'tp': 1.02, 'status': 'open'})
+        bot.positions.pop_triggered(0.0)
+    for i in range(OPEN_POSITIONS):
+        price = float(prices[-1]) * (1 + (i - OPEN_POSITIONS / 2) / 1000)
+        bot.positions.add({'entry_price': price, 'quantity': 1, 'sl': price * 0.99, 'tp': price * 1.02, 'status': 'open'})
+    return bot, prices[-1]
+
+def make_momentum_bot(history):
+    import momentum
+
+    bot = momentum.TradingBot(momentum.TradingStrategy())
+    prices = synthetic_prices(history)
+    start = time.time() - history
+    for i, price in enumerate(prices.tolist()):
+        bot.strategy.update_price(price)
+        bot.candles.update(price, start + i)
+    return bot, prices[-1]
+
+# --- CASES ---
+# Each returns a function running one tick with the given price
+def case_grid_tick(history, tmp):
+    from datetime import datetime
+    bot, _ = make_grid_bot(history, tmp)
+    return lambda price: bot.process_tick(price, datetime.now())
+
+def case_calculate_rsi(history, tmp):
+    bot, _ = make_grid_bot(history, tmp)
+    data, strategy = bot.data, bot.strategy
+
+    def tick(price):
+        data.append(None, price)
+        strategy.calculate_rsi(data)
+    return tick
+
+def case_check_sl_tp(history, tmp):
+    from datetime import datetime
+    bot, _ = make_grid_bot(history, tmp)
+    now = datetime.now()
+    return lambda price: bot.check_sl_tp(price, now)
+
+def case_log_trade(history, tmp):
+    from datetime import datetime
+    bot, _ = make_grid_bot(history, tmp)
+    now = datetime.now()
+    return lambda price: bot.log_trade(now, "BUY", price, 1000, 1, price * 0.99, price * 1.02)
+
+def case_momentum_signal(history, tmp):
+    bot, _ = make_momentum_bot(history)
+    strategy = bot.strategy
+
+    def tick(price):
+        strategy.update_price(price)
+        strategy.generate_signal()
+    return tick
+
+def case_update_candlestick(history, tmp):
+    bot, _ = make_momentum_bot(history)
+    return bot.update_candlestick
+
+CASES = {
+    "grid_tick": case_grid_tick,  # TradingBot.process_tick: one run_trading_loop iteration without fetch/sleep
+    "calculate_rsi": case_calculate_rsi,
+    "check_sl_tp": case_check_sl_tp,
+    "log_trade": case_log_trade,
+    "momentum_signal": case_momentum_signal,
+    "update_candlestick": case_update_candlestick,
+}
+
+def run_case(name, history, measure):
+    # Runs in the worker process: set up `history` ticks, then time `measure` more one by one
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # any files the bots write stay out of the working tree
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        t0 = time.perf_counter()
+        tick = CASES[name](history, tmp)
+        setup_seconds = time.perf_counter() - t0
+        prices = synthetic_prices(history + measure)[history:].tolist()
+        timings = np.empty(measure, dtype=np.int64)
+        clock = time.perf_counter_ns
+        for i, price in enumerate(prices):
+            start = clock()
+            tick(price)
+            timings[i] = clock() - start
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    p50, p99 = np.percentile(timings, [50, 99])
+    return {
+        "case": name,
+        "history": history,
+        "ticks": measure,
+        "us_per_tick": float(timings.mean()) / 1000,
+        "p50_us": float(p50) / 1000,
+        "p99_us": float(p99) / 1000,
+        "setup_seconds": setup_seconds,
+        "peak_rss_mb": peak_kb / 1024,
+        "case_rss_mb": (peak_kb - rss_before) / 1024,
+    }
+
+# --- DRIVER ---
+def run_suite(cases, sizes, measure):
+    results = []
+    for name in cases:
+        for history in sizes:
+            proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", name, str(history), str(measure)],
+                                  capture_output=True, text=True)
+            if proc.returncode != 0:
+                print(f"{name:>20} {history:>10,}  FAILED\n{proc.stderr}", file=sys.stderr)
+                continue
+            row = json.loads(proc.stdout.strip().splitlines()[-1])
+            results.append(row)
+            print(f"{name:>20} {history:>10,}  {row['us_per_tick']:9.2f} us/tick  p99 {row['p99_us']:9.2f} us  "
+                  f"peak {row['peak_rss_mb']:8.1f} MB", flush=True)
+    return results
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    # (case, history, metric, baseline value, current value) for every metric past the tolerance
+    previous = {(row["case"], row["history"]): row for row in baseline["results"]}
+    regressions = []
+    for row in results:
+        base = previous.get((row["case"], row["history"]))
+        if base is None:
+            continue
+        for metric in ("p50_us", "peak_rss_mb"):  # the median is far less noisy than the mean
+            if row[metric] > base[metric] * (1 + tolerance):
+                regressions.append((row["case"], row["history"], metric, base[metric], row[metric]))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-tick hot-path benchmark suite")
+    parser.add_argument("--worker", nargs=3, metavar=("CASE", "HISTORY", "MEASURE"), help=argparse.SUPPRESS)
+    parser.add_argument("--cases", default=",".join(CASES), help="comma-separated subset of: " + ", ".join(CASES))
+    parser.add_argument("--sizes", default=",".join(str(s) for s in SIZES), help="comma-separated history sizes")
+    parser.add_argument("--measure", type=int, default=MEASURE)
+    parser.add_argument("--output", default=OUTPUT)
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--save-baseline", metavar="PATH", help="also write the results here as the new baseline")
+    args = parser.parse_args()
+
+    if args.worker:
+        name, history, measure = args.worker
+        print(json.dumps(run_case(name, int(history), int(measure))))
+        return
+
+    cases = [c for c in args.cases.split(",") if c]
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+    sizes = [int(float(s)) for s in args.sizes.split(",") if s]
+    results = run_suite(cases, sizes, args.measure)
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "measure": args.measure,
+        "results": results,
+    }
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for case, history, metric, before, after in regressions:
+            print(f"REGRESSION {case} @ {history:,}: {metric} {before:.2f} -> {after:.2f} (+{(after / before - 1) * 100:.0f}%)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import numpy as np
+
+TIMEFRAMES = (1, 10, 60, 300, 3600)  # seconds: 1s, 10s, 1m, 5m, 1h
+CANDLE_FIELDS = ("time", "open", "high", "low", "close", "volume", "trades")
+
+# --- CANDLE HISTORY ---
+class CandleSeries:
+    # Completed candles of one timeframe in fixed-size columnar arrays; the oldest are
+    # overwritten once `capacity` candles are stored.
+    def __init__(self, timeframe, capacity=10000):
+        self.timeframe = timeframe
+        self.capacity = capacity
+        self.time = np.zeros(capacity, dtype=np.int64)  # candle open time, epoch seconds
+        self.open = np.zeros(capacity)
+        self.high = np.zeros(capacity)
+        self.low = np.zeros(capacity)
+        self.close = np.zeros(capacity)
+        self.volume = np.zeros(capacity)
+        self.trades = np.zeros(capacity, dtype=np.int64)
+        self.total = 0  # candles ever appended
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, candle):
+        i = self.total % self.capacity
+        self.time[i], self.open[i], self.high[i], self.low[i], self.close[i], self.volume[i], self.trades[i] = candle
+        self.total += 1
+
+    def to_arrays(self):
+        # Stored candles oldest first, one array per field
+        start = self.total % self.capacity if self.total > self.capacity else 0
+        order = np.r_[start:len(self), 0:start] if start else slice(0, len(self))
+        return {field: getattr(self, field)[order] for field in CANDLE_FIELDS}
+
+    def last(self):
+        if not self.total:
+            return None
+        i = (self.total - 1) % self.capacity
+        return tuple(getattr(self, field)[i].item() for field in CANDLE_FIELDS)
+
+# --- CANDLE AGGREGATOR ---
+class CandleAggregator:
+    # Builds candles for every timeframe from the same ticks in one pass. Candles are aligned
+    # to multiples of their timeframe since the epoch; empty intervals produce no candle.
+    def __init__(self, timeframes=TIMEFRAMES, capacity=10000):
+        self.timeframes = tuple(sorted(timeframes))
+        self.series = {tf: CandleSeries(tf, capacity) for tf in self.timeframes}
+        self.current = {}  # timeframe -> [time, open, high, low, close, volume, trades] still forming
+        self.ends = {}  # timeframe -> end time of the forming candle
+        self.subscribers = {tf: [] for tf in self.timeframes}
+
+    def subscribe(self, callback, timeframe=None):
+        # callback(timeframe, candle) on every candle close; all timeframes when timeframe is None
+        for tf in ([timeframe] if timeframe is not None else self.timeframes):
+            self.subscribers[tf].append(callback)
+
+    def update(self, price, timestamp=None, volume=0.0):
+        timestamp = time.time() if timestamp is None else timestamp
+        price = float(price)
+        current, ends = self.current, self.ends
+        for tf in self.timeframes:
+            candle = current.get(tf)
+            if candle is None or not candle[0] <= timestamp < ends[tf]:
+                if candle is not None:
+                    self._close(tf, candle)
+                bucket = int(timestamp // tf) * tf
+                current[tf] = [bucket, price, price, price, price, volume, 1]
+                ends[tf] = bucket + tf
+                continue
+            if price > candle[2]:
+                candle[2] = price
+            elif price < candle[3]:
+                candle[3] = price
+            candle[4] = price
+            candle[5] += volume
+            candle[6] += 1
+
+    def flush(self):
+        # Close every candle still forming, e.g. at shutdown
+        for tf, candle in list(self.current.items()):
+            self._close(tf, candle)
+        self.current.clear()
+
+    def _close(self, tf, candle):
+        candle = tuple(candle)
+        self.series[tf].append(candle)
+        for callback in self.subscribers[tf]:
+            callback(tf, candle)
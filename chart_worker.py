@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import queue
+import logging
+import multiprocessing as mp
+from collections import deque
+
+MAX_FPS = 1.0  # PNG snapshots written per second at most
+QUEUE_SIZE = 1024  # pending candles/trades before new ones are dropped
+HISTORY = 500  # candles (and trades) kept on the chart
+STOP_TIMEOUT = 5.0  # seconds close() waits for the final frame
+
+# --- RENDER WORKER ---
+# Runs in the child process. It keeps its own rolling window of candles and trades, so the
+# bot only ever sends what is new. Everything queued is drained before a frame is drawn, and
+# frames are spaced at least 1 / max_fps apart: when rendering falls behind, intermediate
+# states are never drawn instead of piling up.
+def _render_loop(events, path, timeframe, max_fps, history, title, rendered):
+    import matplotlib
+    matplotlib.use("Agg")
+    import pandas as pd
+    import mplfinance as mpf
+
+    style = mpf.make_mpf_style(marketcolors=mpf.make_marketcolors(up='g', down='r', edge='black', wick='black'))
+    candles = deque(maxlen=history)  # (time, open, high, low, close, volume)
+    trades = deque(maxlen=history)  # (time, side, price)
+    frame_interval = 1.0 / max_fps
+    last_frame = float("-inf")
+    dirty = stopping = False
+
+    def render():
+        times = [c[0] for c in candles]
+        df = pd.DataFrame({'Open': [c[1] for c in candles], 'High': [c[2] for c in candles],
+                           'Low': [c[3] for c in candles], 'Close': [c[4] for c in candles],
+                           'Volume': [c[5] for c in candles]},
+                          index=pd.to_datetime(times, unit='s').rename('Timestamp'))
+        # Trades are marked on the candle they fell in
+        row = {t: i for i, t in enumerate(times)}
+        buys, sells = [float("nan")] * len(times), [float("nan")] * len(times)
+        for ts, side, price in trades:
+            i = row.get(int(ts // timeframe) * timeframe)
+            if i is not None:
+                (buys if side == "BUY" else sells)[i] = price
+        addplots = [mpf.make_addplot(marks, type='scatter', marker=marker, color=color, markersize=60)
+                    for marks, marker, color in ((buys, '^', 'g'), (sells, 'v', 'r'))
+                    if any(m == m for m in marks)]
+        extra = {"addplot": addplots} if addplots else {}
+        tmp = path + ".tmp"
+        mpf.plot(df, type='candle', style=style, title=title, ylabel='Price ($)',
+                 savefig=dict(fname=tmp, format="png", dpi=100), **extra)
+        os.replace(tmp, path)  # viewers never see a half-written image
+
+    while not stopping:
+        wait = max(0.0, last_frame + frame_interval - time.monotonic()) if dirty else None
+        try:
+            event = events.get(timeout=wait)
+        except queue.Empty:
+            event = None
+        while event is not None:
+            kind, payload = event
+            if kind == "candle":
+                candles.append(payload)
+                dirty = True
+            elif kind == "trade":
+                trades.append(payload)
+                dirty = True
+            elif kind == "stop":
+                stopping = True
+            try:
+                event = events.get_nowait()
+            except queue.Empty:
+                event = None
+        now = time.monotonic()
+        if dirty and candles and (stopping or now >= last_frame + frame_interval):
+            try:
+                render()
+                with rendered.get_lock():
+                    rendered.value += 1
+            except Exception as e:
+                logging.error(f"Chart render failed: {e}")
+            last_frame = time.monotonic()
+            dirty = False
+
+# --- CHART RENDERER ---
+class ChartRenderer:
+    # Live candlestick chart drawn by a separate process into a PNG that is rewritten at most
+    # max_fps times a second. The bot side only puts small tuples on a bounded queue with
+    # put_nowait: a full queue (the worker stalled or died) drops the event and counts it,
+    # it never blocks the trading loop.
+    def __init__(self, path="chart.png", timeframe=10, max_fps=MAX_FPS, queue_size=QUEUE_SIZE, history=HISTORY,
+                 title="BTC/USD Candlestick Chart"):
+        ctx = mp.get_context("spawn")  # no inherited threads or locks from the bot process
+        self.path = path
+        self.timeframe = timeframe
+        self.events = ctx.Queue(queue_size)
+        self.rendered = ctx.Value("l", 0)  # frames written by the worker
+        self.sent = 0
+        self.dropped = 0
+        self.process = ctx.Process(target=_render_loop, name="chart-worker", daemon=True,
+                                   args=(self.events, path, timeframe, max_fps, history, title, self.rendered))
+        self.process.start()
+
+    def _send(self, event):
+        try:
+            self.events.put_nowait(event)
+            self.sent += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def on_candle(self, timeframe, candle):
+        # CandleAggregator.subscribe callback: candle is (time, open, high, low, close, volume, trades)
+        self._send(("candle", tuple(candle[:6])))
+
+    def trade(self, timestamp, side, price):
+        # timestamp in epoch seconds
+        self._send(("trade", (timestamp, side, price)))
+
+    def stats(self):
+        return {"sent": self.sent, "dropped": self.dropped, "frames": self.rendered.value}
+
+    def close(self):
+        # Draws a last frame with everything sent so far, then stops the worker
+        if not self.process.is_alive():
+            return
+        try:
+            self.events.put(("stop", None), timeout=STOP_TIMEOUT)
+        except queue.Full:
+            pass
+        self.process.join(STOP_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.events.close()
+        logging.info("Chart worker stopped: %d events sent, %d dropped, %d frames written to %s",
+                     self.sent, self.dropped, self.rendered.value, self.path)
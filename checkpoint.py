@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+import logging
+
+# --- CHECKPOINTS ---
+# A bot's state (plain dicts, lists and numpy arrays) pickled to one file. The file is
+# written next to its final name and renamed over it, so a crash mid-write leaves the
+# previous checkpoint intact.
+
+def save_checkpoint(path, state):
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def load_checkpoint(path):
+    # The saved state, or None when there is no usable checkpoint
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError) as e:
+        logging.error(f"Ignoring unreadable checkpoint {path}: {e}")
+        return None
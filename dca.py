@@ -1,13 +1,11 @@
-import hmac
-import hashlib
-import requests
-import json
 import logging
 import numpy as np
-import pandas as pd
 import time
 from datetime import datetime
-import os
+from roostoo import RoostooAPIClient
+from journal import TradeJournal
+from scheduler import TickScheduler
+from ledger import PortfolioLedger
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
@@ -21,113 +19,108 @@ TRADE_PAIRS = ["BTC/USD", "XRP/USD"]
 FETCH_INTERVAL = 5
 TRADING_INTERVAL = 5
 INVESTMENT_AMOUNT = 10
-CSV_FILE = "trading_data.csv"
-
-class RoostooAPIClient:
-    def __init__(self, api_key, secret_key, base_url=API_BASE_URL):
-        self.api_key = api_key
-        self.secret_key = secret_key.encode()
-        self.base_url = base_url
-
-    def _get_timestamp(self):
-        return str(int(time.time() * 1000))
-
-    def _sign(self, params: dict):
-        sorted_items = sorted(params.items())
-        query_string = '&'.join([f"{key}={value}" for key, value in sorted_items])
-        signature = hmac.new(self.secret_key, query_string.encode(), hashlib.sha256).hexdigest()
-        return signature, query_string
-
-    def _headers(self, params: dict, is_signed=False):
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        if is_signed:
-            signature, _ = self._sign(params)
-            headers["RST-API-KEY"] = self.api_key
-            headers["MSG-SIGNATURE"] = signature
-        return headers
-
-    def _handle_response(self, response):
-        if response.status_code != 200:
-            logging.error(f"HTTP Error: {response.status_code} {response.text}")
-            return None
-        try:
-            return response.json()
-        except Exception as e:
-            logging.error(f"JSON decode error: {e}")
-            return None
-
-    def get_ticker(self, pair=None):
-        url = f"{self.base_url}/v3/ticker"
-        params = {"timestamp": self._get_timestamp()}
-        if pair:
-            params["pair"] = pair
-        headers = self._headers(params, is_signed=False)
-        response = requests.get(url, params=params, headers=headers)
-        return self._handle_response(response)
+DCA_SCHEDULE = {}  # per-pair (USD per buy, seconds between buys), e.g. {"BTC/USD": (25, 60)}; others use (INVESTMENT_AMOUNT, TRADING_INTERVAL)
+CSV_FILE = "dca_trades.csv"  # not Grid's trading_data.csv: the columns differ
+HTTP_POOL_SIZE = 4
+TRADE_COLUMNS = ["timestamp", "pair", "signal", "price", "amount", "cash", "holdings", "order_id"]
 
 class RiskManager:
     def evaluate_risk(self, portfolio_value, investment_amount):
         return min(investment_amount, portfolio_value)
 
+    def evaluate_risk_batch(self, portfolio_value, investment_amounts):
+        # Same as calling evaluate_risk pair by pair while spending down portfolio_value
+        spent_before = np.cumsum(investment_amounts) - investment_amounts
+        return np.clip(portfolio_value - spent_before, 0, investment_amounts)
+
 class DollarCostAveragingStrategy:
     def generate_signal(self):
         return "buy"
 
 class SimulationBot:
-    def __init__(self, api_client, strategy, risk_manager, initial_cash):
+    def __init__(self, api_client, strategy, risk_manager, initial_cash, journal=None, pairs=TRADE_PAIRS, schedule=None):
         self.api_client = api_client
+        self.journal = journal
         self.strategy = strategy
         self.risk_manager = risk_manager
-        self.cash = initial_cash
-        self.holdings = 0
-
-    def run_iteration(self):
-        for pair in TRADE_PAIRS:
-            ticker = self.api_client.get_ticker(pair=pair)
-        if not ticker:
+        self.ledger = PortfolioLedger(pairs, initial_cash)  # cash, and holdings/cost basis/P&L per pair
+        schedule = DCA_SCHEDULE if schedule is None else schedule
+        plans = [schedule.get(pair, (INVESTMENT_AMOUNT, TRADING_INTERVAL)) for pair in self.ledger.pairs]
+        self.investments = np.array([amount for amount, _ in plans], dtype=float)  # USD per buy, per pair
+        self.intervals = [interval for _, interval in plans]
+
+    def schedule_groups(self):
+        # interval -> indices of the pairs bought on that schedule
+        groups = {}
+        for i, interval in enumerate(self.intervals):
+            groups.setdefault(interval, []).append(i)
+        return {interval: np.array(indices) for interval, indices in groups.items()}
+
+    def run_iteration(self, due=None):
+        # Marks every pair to market and buys the `due` pair indices (all pairs by default)
+        pairs = self.ledger.pairs
+        prices = self.api_client.get_prices(pairs)
+        if prices is None:
             return
+        self.ledger.mark(prices)
 
-        price = float(ticker["Data"][pair]["LastPrice"])
         signal = self.strategy.generate_signal()
 
         if signal == "buy":
-            investment = self.risk_manager.evaluate_risk(self.cash, INVESTMENT_AMOUNT)
-            amount = investment / price
-            self.cash -= investment
-            self.holdings += amount
-            order_id = int(time.time())
-
-            logging.info(f"Bought {amount:.4f} {pair} at {price:.2f} USD")
-            pd.DataFrame([[datetime.now(), signal, price, amount, self.cash, self.holdings, order_id]],
-                          columns=["timestamp", "signal", "price", "amount", "cash", "holdings", "order_id"]).to_csv(CSV_FILE, mode="a", header=False, index=False)
-
-    def calculate_profit_loss(self, final_price):
-        portfolio_value = self.holdings * final_price + self.cash
-        net_profit = portfolio_value - 100000
-        return net_profit
+            candidates = np.arange(len(pairs)) if due is None else due
+            tradable = candidates[prices[candidates] > 0]  # also drops NaN for pairs without a quote
+            investments = self.risk_manager.evaluate_risk_batch(self.ledger.cash, self.investments[tradable])
+            bought = investments > 0
+            tradable, investments = tradable[bought], investments[bought]
+            if not len(tradable):
+                return
+            fill_prices = prices[tradable]
+            amounts = investments / fill_prices
+            # Running cash after each fill, as if the pairs were bought one by one
+            cash_after = self.ledger.cash - np.cumsum(investments)
+            self.ledger.buy(tradable, amounts, fill_prices)
+            bought_pairs = [pairs[i] for i in tradable]
+
+            logging.info(f"Bought {len(bought_pairs)} pairs for {investments.sum():.2f} USD: "
+                         + ", ".join(f"{amount:.4f} {pair} at {price:.2f}" for pair, amount, price in zip(bought_pairs, amounts, fill_prices)))
+            if self.journal:
+                timestamp, order_id = datetime.now(), int(time.time())
+                for pair, price, amount, cash, holdings in zip(bought_pairs, fill_prices.tolist(), amounts.tolist(), cash_after.tolist(),
+                                                               self.ledger.holdings[tradable].tolist()):
+                    self.journal.append({"timestamp": timestamp, "pair": pair, "signal": signal, "price": price, "amount": amount,
+                                         "cash": cash, "holdings": holdings, "order_id": order_id})
+
+    def calculate_profit_loss(self, prices=None):
+        # Net P&L of the whole portfolio; prices in pair order, None uses the last marks
+        return self.ledger.profit_loss(prices)
 
 # --- MAIN EXECUTION ---
 def main():
-    api_client = RoostooAPIClient(API_KEY, SECRET_KEY)
+    api_client = RoostooAPIClient(API_KEY, SECRET_KEY, base_url=API_BASE_URL, pool_size=HTTP_POOL_SIZE)
     risk_manager = RiskManager()
     strategy = DollarCostAveragingStrategy()
-    simulation_bot = SimulationBot(api_client, strategy, risk_manager, initial_cash=100000)
-
-    if not os.path.exists(CSV_FILE):
-        pd.DataFrame(columns=["timestamp", "signal", "price", "amount", "cash", "holdings", "order_id"]).to_csv(CSV_FILE, index=False)
+    journal = TradeJournal(CSV_FILE, TRADE_COLUMNS)  # writes the header when the file is new
+    simulation_bot = SimulationBot(api_client, strategy, risk_manager, initial_cash=100000, journal=journal)
 
     logging.info("Starting real-time DCA trading bot...")
+    # Buys each pair on its own schedule, on the monotonic clock rather than sleeping after each fetch
+    scheduler = TickScheduler()
+    pairs = simulation_bot.ledger.pairs
+    for interval, due in simulation_bot.schedule_groups().items():
+        scheduler.every(interval, lambda due=due: simulation_bot.run_iteration(due), name=",".join(pairs[i] for i in due))
     try:
-        while True:
-            simulation_bot.run_iteration()
-            time.sleep(TRADING_INTERVAL)
+        scheduler.run()
     except KeyboardInterrupt:
-        final_prices = {pair: float(simulation_bot.api_client.get_ticker(pair=pair)["Data"][pair]["LastPrice"]) for pair in TRADE_PAIRS}
-        total_profit_loss = sum(simulation_bot.calculate_profit_loss(final_price) for final_price in final_prices.values())
-        logging.info(f"Total Net Profit/Loss: {total_profit_loss:.2f} USD")
-        print(f"Total Net Profit/Loss: {total_profit_loss:.2f} USD")
+        scheduler.log_stats()
+        final_prices = simulation_bot.api_client.get_prices(pairs)  # None: value at the last marks
+        for pair, entry in simulation_bot.ledger.summary(final_prices).items():
+            logging.info(f"{pair}: {entry['holdings']:.6f} held at avg cost {entry['avg_cost']:.2f}, "
+                         f"price {entry['price']:.2f}, unrealized {entry['unrealized']:.2f} USD")
+        total_profit_loss = simulation_bot.calculate_profit_loss()
         logging.info(f"Final Net Profit/Loss: {total_profit_loss:.2f} USD")
         print(f"Final Net Profit/Loss: {total_profit_loss:.2f} USD")
+    finally:
+        journal.close()
 
 if __name__ == "__main__":
     main()
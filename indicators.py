@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+import numpy as np
+
+# --- STREAMING INDICATORS ---
+# Every indicator here takes one price at a time and keeps a fixed amount of state,
+# so the per-tick cost does not depend on how long the bot has been running.
+# warm(prices) sets the state update() would reach over `prices` from scratch in one
+# numpy pass, for warm starts from recorded history.
+
+def _ring(values, window, count):
+    # Ring list as left by `count` updates: value k sits at slot k % window
+    ring = [0.0] * window
+    start = max(0, count - window)
+    for k, value in zip(range(start, count), values[start - count:].tolist() if count else []):
+        ring[k % window] = value
+    return ring
+
+def _smooth(seed, values, alpha):
+    # seed, then x <- x + alpha * (v - x) for every v: the closed form of the recursion
+    m = len(values)
+    if not m:
+        return seed
+    decay = 1 - alpha
+    weights = alpha * decay ** np.arange(m - 1, -1, -1, dtype=np.float64)
+    return float(decay ** m * seed + weights @ values)
+
+class StreamingRSI:
+    # mode="sma"    -> same result as the pandas rolling-mean RSI used by RsiGridTradingStrategy
+    # mode="wilder" -> Wilder smoothing, seeded with the SMA of the first `period` moves
+    def __init__(self, period=14, mode="sma", resync_every=100000):
+        if period < 1:
+            raise ValueError("RSI period must be at least 1")
+        if mode not in ("sma", "wilder"):
+            raise ValueError(f"Unknown RSI mode: {mode}")
+        self.period = period
+        self.mode = mode
+        self.resync_every = resync_every  # rebuild the running sums to stop float drift
+        self.reset()
+
+    def reset(self):
+        self.gains = [0.0] * self.period  # ring of the last `period` gains
+        self.losses = [0.0] * self.period  # ring of the last `period` losses
+        self.index = 0
+        self.count = 0  # number of price moves seen
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.gain_nonzero = 0  # non-zero entries in the window, lets an all-zero window sum to exactly 0
+        self.loss_nonzero = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.last_price = None
+        self.value = None
+
+    def update(self, price):
+        price = float(price)
+        last_price = self.last_price
+        self.last_price = price
+        if last_price is None:
+            return self.value
+
+        delta = price - last_price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        period = self.period
+        self.count += 1
+
+        if self.mode == "wilder" and self.count > period:
+            self.avg_gain = (self.avg_gain * (period - 1) + gain) / period
+            self.avg_loss = (self.avg_loss * (period - 1) + loss) / period
+        else:
+            i = self.index
+            old_gain = self.gains[i]
+            old_loss = self.losses[i]
+            self.gains[i] = gain
+            self.losses[i] = loss
+            self.index = i + 1 if i + 1 < period else 0
+            self.gain_sum += gain - old_gain
+            self.loss_sum += loss - old_loss
+            self.gain_nonzero += (gain != 0.0) - (old_gain != 0.0)
+            self.loss_nonzero += (loss != 0.0) - (old_loss != 0.0)
+            if self.count % self.resync_every == 0:
+                self.gain_sum = math.fsum(self.gains)
+                self.loss_sum = math.fsum(self.losses)
+            if self.gain_nonzero == 0 or self.gain_sum < 0:
+                self.gain_sum = 0.0
+            if self.loss_nonzero == 0 or self.loss_sum < 0:
+                self.loss_sum = 0.0
+            if self.count < period:
+                return self.value
+            self.avg_gain = self.gain_sum / period
+            self.avg_loss = self.loss_sum / period
+
+        self.value = self._rsi(self.avg_gain, self.avg_loss)
+        return self.value
+
+    def warm(self, prices):
+        prices = np.asarray(prices, dtype=np.float64)
+        self.reset()
+        if not len(prices):
+            return self.value
+        self.last_price = float(prices[-1])
+        deltas = np.diff(prices)
+        n = self.count = len(deltas)
+        gains = np.where(deltas > 0, deltas, 0.0)
+        losses = np.where(deltas < 0, -deltas, 0.0)
+        period = self.period
+        # Wilder keeps the ring of the first `period` moves it was seeded from
+        ring_count = min(n, period) if self.mode == "wilder" else n
+        self.gains = _ring(gains[:ring_count], period, ring_count)
+        self.losses = _ring(losses[:ring_count], period, ring_count)
+        self.index = ring_count % period
+        self.gain_sum = math.fsum(self.gains)
+        self.loss_sum = math.fsum(self.losses)
+        self.gain_nonzero = sum(1 for g in self.gains if g != 0.0)
+        self.loss_nonzero = sum(1 for l in self.losses if l != 0.0)
+        if n < period:
+            return self.value
+        self.avg_gain = self.gain_sum / period
+        self.avg_loss = self.loss_sum / period
+        if self.mode == "wilder":
+            self.avg_gain = _smooth(self.avg_gain, gains[period:], 1 / period)
+            self.avg_loss = _smooth(self.avg_loss, losses[period:], 1 / period)
+        self.value = self._rsi(self.avg_gain, self.avg_loss)
+        return self.value
+
+    @staticmethod
+    def _rsi(avg_gain, avg_loss):
+        # Same edge cases as 100 - 100 / (1 + gain / loss) in pandas
+        if avg_loss == 0:
+            return float("nan") if avg_gain == 0 else 100.0
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+class SMA:
+    # Running-sum simple moving average; averages what it has until the window is full
+    def __init__(self, window, resync_every=100000):
+        if window < 1:
+            raise ValueError("SMA window must be at least 1")
+        self.window = window
+        self.resync_every = resync_every
+        self.values = [0.0] * window  # ring of the last `window` prices
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+        self.value = None
+
+    def update(self, price):
+        price = float(price)
+        i = self.index
+        self.total += price - self.values[i]
+        self.values[i] = price
+        self.index = i + 1 if i + 1 < self.window else 0
+        self.count += 1
+        if self.count % self.resync_every == 0:
+            self.total = math.fsum(self.values)
+        self.value = self.total / min(self.count, self.window)
+        return self.value
+
+    def warm(self, prices):
+        prices = np.asarray(prices, dtype=np.float64)
+        self.count = len(prices)
+        self.values = _ring(prices, self.window, self.count)
+        self.index = self.count % self.window
+        self.total = math.fsum(self.values)
+        self.value = self.total / min(self.count, self.window) if self.count else None
+        return self.value
+
+class EMA:
+    # Exponential moving average, alpha = 2 / (window + 1), seeded with the SMA of the first `window` prices
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("EMA window must be at least 1")
+        self.window = window
+        self.alpha = 2 / (window + 1)
+        self.count = 0
+        self.seed_total = 0.0
+        self.value = None
+
+    def update(self, price):
+        price = float(price)
+        self.count += 1
+        if self.count < self.window:
+            self.seed_total += price
+        elif self.count == self.window:
+            self.value = (self.seed_total + price) / self.window
+        else:
+            self.value += self.alpha * (price - self.value)
+        return self.value
+
+    def warm(self, prices):
+        prices = np.asarray(prices, dtype=np.float64)
+        window = self.window
+        self.count = len(prices)
+        self.seed_total = float(prices[:window - 1].sum())
+        if self.count < window:
+            self.value = None
+            return self.value
+        self.value = _smooth(float(prices[:window].sum()) / window, prices[window:], self.alpha)
+        return self.value
+
+class Momentum:
+    # value: price - price (window - 1) ticks ago, roc: the same move in percent; None until warm
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("Momentum window must be at least 1")
+        self.window = window
+        self.values = [0.0] * window
+        self.index = 0
+        self.count = 0
+        self.value = None
+        self.roc = None
+
+    def update(self, price):
+        price = float(price)
+        i = self.index
+        self.values[i] = price
+        self.index = i + 1 if i + 1 < self.window else 0
+        self.count += 1
+        if self.count >= self.window:
+            oldest = self.values[self.index]  # the slot written `window - 1` ticks ago
+            self.value = price - oldest
+            self.roc = (price / oldest - 1) * 100 if oldest else None
+        return self.value
+
+    def warm(self, prices):
+        prices = np.asarray(prices, dtype=np.float64)
+        self.count = len(prices)
+        self.values = _ring(prices, self.window, self.count)
+        self.index = self.count % self.window
+        self.value = self.roc = None
+        if self.count >= self.window:
+            price, oldest = float(prices[-1]), float(prices[-self.window])
+            self.value = price - oldest
+            self.roc = (price / oldest - 1) * 100 if oldest else None
+        return self.value
+
+class RollingMax:
+    # Maximum of the last `window` prices with a monotonic deque held in fixed-size rings:
+    # each price is pushed and popped at most once, so updates are amortised O(1).
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("Rolling window must be at least 1")
+        self.window = window
+        self.values = [0.0] * window
+        self.ticks = [0] * window  # tick number of each deque entry, to expire the head
+        self.head = 0
+        self.size = 0
+        self.count = 0
+        self.value = None
+
+    def _dominates(self, new, old):
+        return new >= old
+
+    def update(self, price):
+        price = float(price)
+        window, values, ticks = self.window, self.values, self.ticks
+        tick = self.count
+        self.count += 1
+        if self.size and ticks[self.head] <= tick - window:
+            self.head = self.head + 1 if self.head + 1 < window else 0
+            self.size -= 1
+        while self.size and self._dominates(price, values[(self.head + self.size - 1) % window]):
+            self.size -= 1
+        tail = (self.head + self.size) % window
+        values[tail] = price
+        ticks[tail] = tick
+        self.size += 1
+        self.value = values[self.head]
+        return self.value
+
+    def warm(self, prices):
+        # Only the last `window` prices can still be in the deque
+        prices = np.asarray(prices, dtype=np.float64)
+        self.head = self.size = 0
+        self.count = max(0, len(prices) - self.window)
+        self.value = None
+        for price in prices[-self.window:].tolist():
+            self.update(price)
+        return self.value
+
+class RollingMin(RollingMax):
+    def _dominates(self, new, old):
+        return new <= old
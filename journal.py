@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import csv
+import json
+import zlib
+import time
+import queue
+import atexit
+import struct
+import logging
+import threading
+from itertools import count
+
+RECORD_HEADER = struct.Struct("<II")  # payload length, crc32 of payload
+
+# --- TRADE JOURNAL ---
+# The trading path only enqueues a record; a background thread writes them in batches.
+# fsync policy: "batch" after every written batch, "close" only on close/sync, "never".
+# A record is acknowledged once sync() returns or `durable_seq` has reached its sequence number.
+# lazy=True leaves the file and writer thread alone until the first append, so a bot that never
+# trades creates no journal. An existing journal written with other columns is renamed aside
+# (path stem + timestamp) rather than appended to, since its rows would land in the wrong columns.
+class TradeJournal:
+    def __init__(self, path, columns, fmt="csv", batch_size=256, flush_interval=1.0, fsync="batch", lazy=False):
+        if fmt not in ("csv", "binary"):
+            raise ValueError(f"Unknown journal format: {fmt}")
+        if fsync not in ("batch", "close", "never"):
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.path = path
+        self.columns = list(columns)
+        self.fmt = fmt
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.durable_seq = -1  # highest sequence number on disk (fsynced, unless fsync="never")
+        self._written_seq = -1
+        self._last_seq = -1  # highest sequence number appended
+        self._seq = count()
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = None
+        if not lazy:
+            self._start()
+
+    def _start(self):
+        self._open()
+        self._thread = threading.Thread(target=self._run, name="trade-journal", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _open(self):
+        # A crash mid-write leaves a torn record at the end; cut it off before appending, or the
+        # records written after a restart would be unreadable behind it
+        self._truncate_torn_tail()
+        self._rotate_mismatched()
+        self._file = open(self.path, "a" if self.fmt == "csv" else "ab", newline="" if self.fmt == "csv" else None)
+        if self.fmt == "csv":
+            self._writer = csv.writer(self._file)
+            if self._file.tell() == 0:
+                self._writer.writerow(self.columns)
+        elif self._file.tell() == 0:
+            self._file.write(self._encode(self.columns))  # first record holds the column names
+        self._file.flush()
+
+    def _truncate_torn_tail(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            data = f.read()
+        if self.fmt == "csv":
+            end = data.rfind(b"\n") + 1
+        else:
+            end = _scan(data)[1]
+        if end < len(data):
+            logging.warning(f"Trade journal {self.path}: dropping {len(data) - end} bytes of a torn record at the end")
+            with open(self.path, "r+b") as f:
+                f.truncate(end)
+
+    def _rotate_mismatched(self):
+        if not os.path.exists(self.path) or os.stat(self.path).st_size == 0:
+            return
+        if self.fmt == "csv":
+            with open(self.path, newline="") as f:
+                columns = next(csv.reader(f), [])
+        else:
+            with open(self.path, "rb") as f:
+                length, _ = RECORD_HEADER.unpack(f.read(RECORD_HEADER.size))
+                columns = json.loads(f.read(length))
+        if columns == self.columns:
+            return
+        stem, ext = os.path.splitext(self.path)
+        rotated = f"{stem}.{time.strftime('%Y%m%d-%H%M%S')}{ext}"
+        os.replace(self.path, rotated)
+        logging.warning(f"Trade journal {self.path} has columns {columns}, expected {self.columns}; moved it to {rotated}")
+
+    def append(self, record):
+        # Hot path: O(1) in-memory enqueue, returns the record's sequence number
+        if self._closed:
+            raise RuntimeError("Trade journal is closed")
+        if self._thread is None:
+            self._start()
+        seq = self._last_seq = next(self._seq)
+        self._queue.put((seq, record))
+        return seq
+
+    def sync(self, timeout=None):
+        # Block until every record appended so far is on disk (fsynced unless fsync="never").
+        # False when the timeout expired or a write failed; failed batches are retried.
+        target = self._last_seq
+        if not self._closed and self._thread is not None:
+            done = threading.Event()
+            self._queue.put((None, done))
+            if not done.wait(timeout):
+                return False
+        return self.durable_seq >= target
+
+    def close(self):
+        if self._closed:
+            return
+        if self._thread is None:
+            self._closed = True
+            return  # never opened
+        self.sync()
+        self._closed = True
+        self._queue.put((None, None))
+        self._thread.join()
+        if self.durable_seq < self._last_seq:
+            logging.error(f"Trade journal {self.path} closed with records {self.durable_seq + 1}-{self._last_seq} not written")
+        if not self._file.closed:
+            self._file.close()
+        atexit.unregister(self.close)
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            barriers = []
+            stop = False
+            timeout = None if not batch else max(0.0, deadline - time.monotonic())
+            try:
+                seq, item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                pass  # flush_interval elapsed for the pending batch
+            else:
+                if seq is not None:
+                    batch.append((seq, item))
+                    if len(batch) == 1:
+                        deadline = time.monotonic() + self.flush_interval
+                elif item is None:
+                    stop = True
+                else:
+                    barriers.append(item)
+
+            if batch and (len(batch) >= self.batch_size or barriers or stop or time.monotonic() >= deadline):
+                if self._write(batch, durable=self.fsync == "batch" or (self.fsync == "close" and (barriers or stop))):
+                    batch = []
+                else:
+                    deadline = time.monotonic() + self.flush_interval  # kept and retried
+            elif barriers and self.fsync != "never" and self.durable_seq < self._written_seq:
+                try:
+                    os.fsync(self._file.fileno())
+                    self.durable_seq = self._written_seq
+                except Exception as e:
+                    logging.error(f"Trade journal fsync failed: {e}")
+            for barrier in barriers:
+                barrier.set()
+            if stop:
+                return
+
+    def _write(self, batch, durable):
+        # True once the batch is written; on failure the partial write is undone when possible
+        position = None
+        try:
+            if self._file.closed:
+                self._open()
+            position = self._file.tell()
+            if self.fmt == "csv":
+                self._writer.writerows([["" if record.get(c) is None else record.get(c) for c in self.columns] for _, record in batch])
+            else:
+                self._file.write(b"".join(self._encode([record.get(c) for c in self.columns]) for _, record in batch))
+            self._file.flush()
+            if durable:
+                os.fsync(self._file.fileno())
+            self._written_seq = batch[-1][0]
+            if durable or self.fsync == "never":
+                self.durable_seq = self._written_seq
+            return True
+        except Exception as e:
+            logging.error(f"Trade journal write of {len(batch)} records failed, will retry: {e}")
+            if position is not None:
+                try:
+                    self._file.seek(position)
+                    self._file.truncate()
+                except Exception:
+                    pass  # the torn tail is cut when the file is reopened
+            return False
+
+    @staticmethod
+    def _encode(values):
+        payload = json.dumps(values, default=str).encode()
+        return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+    @staticmethod
+    def read(path, fmt="csv"):
+        # Records that made it to disk, as dicts; a torn record at the end (crash mid-write) is dropped
+        if not os.path.exists(path):
+            return []
+        if fmt == "csv":
+            with open(path, newline="") as f:
+                text = f.read()
+            if text and not text.endswith("\n"):
+                text = text[:text.rfind("\n") + 1]
+            rows = list(csv.reader(text.splitlines()))
+            return [dict(zip(rows[0], row)) for row in rows[1:]] if rows else []
+
+        with open(path, "rb") as f:
+            records = _scan(f.read())[0]
+        return [dict(zip(records[0], values)) for values in records[1:]] if records else []
+
+def _scan(data):
+    # Decoded binary records up to the first torn or corrupt one, and the offset where it starts
+    records = []
+    offset = 0
+    while offset + RECORD_HEADER.size <= len(data):
+        length, crc = RECORD_HEADER.unpack_from(data, offset)
+        payload = data[offset + RECORD_HEADER.size:offset + RECORD_HEADER.size + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        records.append(json.loads(payload))
+        offset += RECORD_HEADER.size + length
+    return records, offset
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+# --- PORTFOLIO LEDGER ---
+# Cash plus, per pair, units held, their cost basis (average cost) and realized P&L, all in
+# numpy arrays indexed like `pairs`. Fills are applied for many pairs at once, and valuation
+# is one multiply-and-sum over a price vector in the same order, such as parse_prices()
+# returns. Each pair's last finite price is remembered, so a pair missing from one ticker
+# response (NaN) is still marked at its previous quote; a pair never quoted is marked at 0.
+class PortfolioLedger:
+    def __init__(self, pairs, initial_cash):
+        self.pairs = list(pairs)
+        self.index = {pair: i for i, pair in enumerate(self.pairs)}
+        self.initial_cash = initial_cash
+        self.cash = float(initial_cash)
+        n = len(self.pairs)
+        self.holdings = np.zeros(n)
+        self.cost = np.zeros(n)  # cost basis of the units held
+        self.realized = np.zeros(n)
+        self.last_prices = np.zeros(n)
+
+    def indices(self, pairs):
+        return np.fromiter((self.index[pair] for pair in pairs), dtype=np.intp, count=len(pairs))
+
+    # --- FILLS ---
+    # `indices` must not repeat a pair within one call; fill prices also become the last marks
+    def buy(self, indices, amounts, prices):
+        spent = amounts * prices
+        self.last_prices[indices] = prices
+        self.holdings[indices] += amounts
+        self.cost[indices] += spent
+        self.cash -= float(spent.sum())
+
+    def sell(self, indices, amounts, prices):
+        # Realized against the average cost of the units held
+        held = self.holdings[indices]
+        avg_cost = np.divide(self.cost[indices], held, out=np.zeros(len(held)), where=held > 0)
+        self.last_prices[indices] = prices
+        self.realized[indices] += amounts * (prices - avg_cost)
+        self.cost[indices] -= amounts * avg_cost
+        self.holdings[indices] -= amounts
+        self.cash += float((amounts * prices).sum())
+
+    # --- VALUATION ---
+    def mark(self, prices):
+        # Updates the last known prices from a full price vector; NaN keeps the previous one
+        np.copyto(self.last_prices, prices, where=prices == prices)
+        return self.last_prices
+
+    def market_values(self, prices=None):
+        if prices is not None:
+            self.mark(prices)
+        return self.holdings * self.last_prices
+
+    def value(self, prices=None):
+        if prices is not None:
+            self.mark(prices)
+        return self.cash + float(self.holdings @ self.last_prices)
+
+    def unrealized(self, prices=None):
+        return self.market_values(prices) - self.cost
+
+    def profit_loss(self, prices=None):
+        # Total net P&L: cash counted once, every pair marked to market
+        return self.value(prices) - self.initial_cash
+
+    @property
+    def avg_cost(self):
+        return np.divide(self.cost, self.holdings, out=np.full(len(self.pairs), np.nan), where=self.holdings > 0)
+
+    def summary(self, prices=None):
+        unrealized = self.unrealized(prices)
+        return {pair: {"holdings": float(self.holdings[i]), "avg_cost": float(self.avg_cost[i]),
+                       "price": float(self.last_prices[i]), "unrealized": float(unrealized[i]),
+                       "realized": float(self.realized[i])}
+                for i, pair in enumerate(self.pairs)}
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import logging
+import argparse
+import tempfile
+import threading
+from datetime import datetime
+import Grid
+from journal import TradeJournal
+from roostoo import RoostooAPIClient
+from mock_exchange import MockExchange, PriceFeed, load_price_file, synthetic_prices, DEFAULT_API_KEY, DEFAULT_SECRET_KEY
+
+# --- LOAD GENERATOR ---
+# Drives N Grid bots, each on its own thread, against the mock exchange (or any Roostoo-compatible
+# URL): every bot fetches its pair's ticker, runs process_tick and places its orders as fast as
+# `interval` allows, sharing one pooled client like MultiPairRunner does.
+
+def run_bot(bot, deadline, interval, counts, stop):
+    while not stop.is_set() and time.monotonic() < deadline:
+        ticker_data = bot.api_client.get_ticker(pair=bot.pair)
+        if ticker_data and ticker_data.get("Success"):
+            counts["ticks"] += 1
+            if bot.process_tick(float(ticker_data["Data"][bot.pair]["LastPrice"]), datetime.now()):
+                counts["stopped"] += 1
+                return
+        else:
+            counts["failed"] += 1
+        if interval:
+            time.sleep(interval)
+
+def run_load(base_url, pairs, bots=10, duration=10.0, interval=0.0, strategy_params=None, api_key=DEFAULT_API_KEY,
+             secret_key=DEFAULT_SECRET_KEY, journal_dir=None):
+    client = RoostooAPIClient(api_key, secret_key, base_url=base_url, pool_size=max(bots, 1))
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = TradeJournal(os.path.join(journal_dir or tmp, "loadtest_trades.csv"), Grid.TRADE_COLUMNS, fsync="never")
+        trading_bots = [
+            Grid.TradingBot(Grid.RsiGridTradingStrategy(**(strategy_params or {})), Grid.RiskManager(), pair=pairs[i % len(pairs)],
+                            api_client=client, journal=journal, buffer_capacity=Grid.RUNNER_BUFFER_CAPACITY)
+            for i in range(bots)
+        ]
+        counts = [{"ticks": 0, "failed": 0, "stopped": 0} for _ in trading_bots]
+        stop = threading.Event()
+        start = time.monotonic()
+        deadline = start + duration
+        threads = [threading.Thread(target=run_bot, args=(bot, deadline, interval, c, stop), daemon=True)
+                   for bot, c in zip(trading_bots, counts)]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        elapsed = time.monotonic() - start
+        journal.close()
+
+    ticks = sum(c["ticks"] for c in counts)
+    return {
+        "bots": bots,
+        "seconds": elapsed,
+        "ticks": ticks,
+        "ticks_per_sec": ticks / elapsed if elapsed else 0.0,
+        "failed_fetches": sum(c["failed"] for c in counts),
+        "stopped_bots": sum(c["stopped"] for c in counts),
+        "trades": sum(len(bot.trade_log) for bot in trading_bots),
+        "requests": client.latency_stats(),
+    }
+
+def print_report(report, server_stats=None):
+    print(f"{report['bots']} bots, {report['seconds']:.1f}s: {report['ticks']} ticks ({report['ticks_per_sec']:.1f}/s), "
+          f"{report['trades']} trades, {report['failed_fetches']} failed fetches, {report['stopped_bots']} bots stopped")
+    for path, stats in report["requests"].items():
+        print(f"  {path:<16} n={stats['count']:<7} p50={stats.get('p50_ms', 0.0):7.2f}ms p99={stats.get('p99_ms', 0.0):7.2f}ms "
+              f"mean={stats['mean_ms']:7.2f}ms errors={stats['errors']} retries={stats['retries']} rate_limited={stats['rate_limited']}")
+    if server_stats:
+        print(f"  server: {server_stats}")
+
+# --- MAIN EXECUTION ---
+def main():
+    parser = argparse.ArgumentParser(description="Load test Grid bots against a local mock exchange")
+    parser.add_argument("--bots", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--interval", type=float, default=0.0, help="seconds each bot waits between ticks")
+    parser.add_argument("--url", help="use an already running exchange instead of starting one in-process")
+    parser.add_argument("--prices", help="CSV with a price column (and optionally pair) to replay")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--max-rps", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="keep the bots' INFO/WARNING logging")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.ERROR)
+    series = load_price_file(args.prices) if args.prices else synthetic_prices(seed=args.seed)
+    exchange = None
+    base_url = args.url
+    if base_url is None:
+        exchange = MockExchange(feed=PriceFeed(series), latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+                                max_requests_per_second=args.max_rps, seed=args.seed)
+        base_url = exchange.start()
+    try:
+        report = run_load(base_url, list(series), args.bots, args.duration, args.interval)
+    finally:
+        if exchange is not None:
+            exchange.stop()
+    print_report(report, exchange.stats if exchange is not None else None)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SUB_BITS = 4  # 16 linear sub-buckets per power of two: values are kept to within ~6%
+MAX_BITS = 40  # largest recordable value is ~2^40 ns (~18 minutes); larger values are clamped
+SAMPLE_EVERY = 16  # per-tick stages are timed on 1 tick in this many
+PROMETHEUS_BOUNDS = range(10, 37)  # `le` buckets at 2^k ns, ~1us .. ~69s
+
+# --- LATENCY HISTOGRAM ---
+# HDR-style log-linear buckets over integer nanoseconds: recording is a couple of integer
+# ops and one list increment, memory is fixed (~600 counters) and percentiles stay within
+# one sub-bucket of the exact value at any magnitude.
+class LatencyHistogram:
+    def __init__(self):
+        self.highest = (1 << MAX_BITS) - 1
+        self.counts = [0] * self._index(self.highest) + [0]
+        self.count = 0
+        self.total = 0  # ns
+        self.max = 0
+
+    @staticmethod
+    def _index(ns):
+        e = ns.bit_length() - SUB_BITS - 1
+        return (e << SUB_BITS) + (ns >> e) if e > 0 else ns
+
+    @staticmethod
+    def _upper(index):
+        # Largest value that lands in bucket `index`
+        e = max(0, (index >> SUB_BITS) - 1)
+        return ((index - (e << SUB_BITS)) << e) + (1 << e) - 1
+
+    def record(self, ns):
+        # Not locked: concurrent threads may very rarely lose an increment, which a latency
+        # histogram can afford and the trading path can't pay a lock for
+        if ns < 0:
+            ns = 0
+        elif ns > self.highest:
+            ns = self.highest
+        e = ns.bit_length() - SUB_BITS - 1
+        self.counts[(e << SUB_BITS) + (ns >> e) if e > 0 else ns] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def percentile(self, q):
+        # Upper bound (ns) of the bucket holding the q-th percentile, q in [0, 100]
+        if not self.count:
+            return 0
+        rank = max(1, int(q / 100 * self.count + 0.5))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self._upper(index), self.max)
+        return self.max
+
+    def count_below(self, ns):
+        return sum(self.counts[:self._index(ns)])
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def reset(self):
+        self.counts = [0] * len(self.counts)
+        self.count = self.total = self.max = 0
+
+# --- METRICS REGISTRY ---
+class Metrics:
+    # Per-stage latency histograms plus event counters. Per-tick stages use sampling:
+    #
+    #     t = metrics.sample()          # perf_counter_ns() on sampled ticks, else 0
+    #     ...signal...
+    #     if t: t = metrics.lap("signal", t)
+    #
+    # so an unsampled tick costs one call and a few truth tests. Rare, slow events (orders,
+    # ticker fetches, journal writes) are recorded every time with observe().
+    def __init__(self, sample_every=SAMPLE_EVERY, namespace="trading_bot"):
+        self.sample_every = max(1, sample_every)
+        self.namespace = namespace
+        self.histograms = {}
+        self.counters = {}
+        self.ticks = 0
+        self.started = time.time()
+        self._server = None
+        self._reporter = None
+        self._stop = threading.Event()
+
+    def histogram(self, stage):
+        hist = self.histograms.get(stage)
+        if hist is None:
+            hist = self.histograms[stage] = LatencyHistogram()
+        return hist
+
+    def sample(self):
+        self.ticks += 1
+        return time.perf_counter_ns() if self.ticks % self.sample_every == 0 else 0
+
+    def lap(self, stage, start):
+        # Records the time since `start` for `stage` and returns now, the start of the next stage
+        now = time.perf_counter_ns()
+        self.histogram(stage).record(now - start)
+        return now
+
+    def observe(self, stage, ns):
+        self.histogram(stage).record(ns)
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def summary(self):
+        stages = {}
+        for stage, hist in list(self.histograms.items()):
+            stages[stage] = {
+                "count": hist.count,
+                "mean_us": hist.mean / 1000,
+                "p50_us": hist.percentile(50) / 1000,
+                "p90_us": hist.percentile(90) / 1000,
+                "p99_us": hist.percentile(99) / 1000,
+                "max_us": hist.max / 1000,
+            }
+        return {"ticks": self.ticks, "stages": stages, "counters": dict(self.counters)}
+
+    def format_summary(self):
+        summary = self.summary()
+        parts = [f"ticks={summary['ticks']}"]
+        for stage, s in summary["stages"].items():
+            parts.append(f"{stage}: n={s['count']} p50={s['p50_us']:.1f}us p99={s['p99_us']:.1f}us max={s['max_us']:.1f}us")
+        parts.extend(f"{name}={value}" for name, value in summary["counters"].items())
+        return " | ".join(parts)
+
+    def prometheus_text(self):
+        ns = self.namespace
+        lines = [
+            f"# TYPE {ns}_ticks_total counter",
+            f"{ns}_ticks_total {self.ticks}",
+            f"# TYPE {ns}_stage_latency_seconds histogram",
+        ]
+        for stage, hist in list(self.histograms.items()):
+            for k in PROMETHEUS_BOUNDS:
+                lines.append(f'{ns}_stage_latency_seconds_bucket{{stage="{stage}",le="{(1 << k) / 1e9:.9g}"}} {hist.count_below(1 << k)}')
+            lines.append(f'{ns}_stage_latency_seconds_bucket{{stage="{stage}",le="+Inf"}} {hist.count}')
+            lines.append(f'{ns}_stage_latency_seconds_sum{{stage="{stage}"}} {hist.total / 1e9:.9g}')
+            lines.append(f'{ns}_stage_latency_seconds_count{{stage="{stage}"}} {hist.count}')
+        for name, value in list(self.counters.items()):
+            lines.append(f"# TYPE {ns}_{name}_total counter")
+            lines.append(f"{ns}_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+    # --- EXPORT ---
+    def serve(self, port, host="127.0.0.1"):
+        # Prometheus text endpoint at http://host:port/metrics on a daemon thread
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.prometheus_text().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        logging.info("Metrics endpoint on http://%s:%d/metrics", host, self._server.server_address[1])
+        return self._server.server_address[1]
+
+    def start_reporter(self, interval):
+        # Logs format_summary() every `interval` seconds on a daemon thread
+        def report():
+            while not self._stop.wait(interval):
+                logging.info("Metrics: %s", self.format_summary())
+
+        self._reporter = threading.Thread(target=report, name="metrics-reporter", daemon=True)
+        self._reporter.start()
+
+    def close(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+METRICS = Metrics()  # shared by every bot in the process unless one is passed in
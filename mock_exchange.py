@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import csv
+import json
+import time
+import hmac
+import random
+import hashlib
+import logging
+import argparse
+import threading
+from urllib.parse import urlsplit, parse_qsl
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+
+# --- CONFIGURATION ---
+DEFAULT_PAIRS = ["BTC/USD", "XRP/USD", "EPIC/USD", "XLM/USD"]
+DEFAULT_API_KEY = "jr2XBSSD0E1ZcfHfpsYRuwxCK1DHLZiIPvhtj2nWaYJZ508FnuxoiAdFLGGVExiA"
+DEFAULT_SECRET_KEY = "symX7GSnEcrud98jhs8plYYqcvsKn36RaT8GglNUqwBLSyJPAyVl8XYgIAPkEWE6"
+
+# --- PRICE FEED ---
+def load_price_file(path, pairs=DEFAULT_PAIRS):
+    # CSV with a `price` column and optionally a `pair` column; without `pair`, every pair
+    # replays the same series
+    series = {}
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            for pair in ([row["pair"]] if "pair" in row else pairs):
+                series.setdefault(pair, []).append(float(row["price"]))
+    return {pair: np.array(prices) for pair, prices in series.items()}
+
+def synthetic_prices(pairs=DEFAULT_PAIRS, ticks=100000, seed=0):
+    # Deterministic random walks, one per pair
+    rng = np.random.default_rng(seed)
+    return {pair: np.abs(1 + i + np.cumsum(rng.normal(0, 0.002 * (1 + i), ticks))) + 0.01 for i, pair in enumerate(pairs)}
+
+class PriceFeed:
+    # Replays each pair's series, advancing one step per ticker request (advance="request")
+    # or every `tick_seconds` of wall time (advance="time"); wraps around at the end
+    def __init__(self, series, advance="request", tick_seconds=1.0):
+        self.series = series
+        self.advance = advance
+        self.tick_seconds = tick_seconds
+        self.start = time.monotonic()
+        self.step = 0
+        self.lock = threading.Lock()
+
+    def prices(self, move=False):
+        with self.lock:
+            if self.advance == "time":
+                step = int((time.monotonic() - self.start) / self.tick_seconds)
+            else:
+                step = self.step
+                if move:
+                    self.step += 1
+        return {pair: float(values[step % len(values)]) for pair, values in self.series.items()}
+
+# --- MOCK EXCHANGE ---
+class MockExchange(ThreadingHTTPServer):
+    # Local stand-in for the Roostoo /v3/ticker and /v3/place_order endpoints with the same
+    # RST-API-KEY / MSG-SIGNATURE checks as RoostooAPIClient._sign, plus injected latency,
+    # errors and 429s. All random choices come from one seeded RNG.
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host="127.0.0.1", port=0, feed=None, api_keys=None, latency_ms=0.0, jitter_ms=0.0,
+                 error_rate=0.0, rate_limit_rate=0.0, max_requests_per_second=None, seed=0):
+        super().__init__((host, port), MockExchangeHandler)
+        self.feed = feed or PriceFeed(synthetic_prices(seed=seed))
+        self.api_keys = api_keys or {DEFAULT_API_KEY: DEFAULT_SECRET_KEY}
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate  # fraction of requests answered with HTTP 500
+        self.rate_limit_rate = rate_limit_rate  # fraction of requests answered with HTTP 429
+        self.max_requests_per_second = max_requests_per_second  # token bucket, None disables
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.tokens = max_requests_per_second or 0.0
+        self.last_refill = time.monotonic()
+        self.order_id = 0
+        self.stats = {"requests": 0, "connections": 0, "rate_limited": 0, "errors": 0, "orders": 0, "rejected": 0}
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, name="mock-exchange", daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def process_request(self, request, client_address):
+        with self.lock:
+            self.stats["connections"] += 1
+        super().process_request(request, client_address)
+
+    def admit(self):
+        # Decide the fate of one request: None to serve it, or an HTTP status to fail it with
+        with self.lock:
+            self.stats["requests"] += 1
+            if self.max_requests_per_second:
+                now = time.monotonic()
+                self.tokens = min(self.max_requests_per_second, self.tokens + (now - self.last_refill) * self.max_requests_per_second)
+                self.last_refill = now
+                if self.tokens < 1:
+                    self.stats["rate_limited"] += 1
+                    return 429
+                self.tokens -= 1
+            roll = self.rng.random()
+            if roll < self.rate_limit_rate:
+                self.stats["rate_limited"] += 1
+                return 429
+            if roll < self.rate_limit_rate + self.error_rate:
+                self.stats["errors"] += 1
+                return 500
+            delay = max(0.0, self.rng.gauss(self.latency_ms, self.jitter_ms)) if self.jitter_ms else self.latency_ms
+        if delay:
+            time.sleep(delay / 1000)
+        return None
+
+    def verify(self, headers, params):
+        secret = self.api_keys.get(headers.get("RST-API-KEY"))
+        if secret is None:
+            return False
+        query_string = '&'.join([f"{key}={value}" for key, value in sorted(params.items())])
+        expected = hmac.new(secret.encode(), query_string.encode(), hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, headers.get("MSG-SIGNATURE", ""))
+
+    def next_order_id(self):
+        with self.lock:
+            self.order_id += 1
+            self.stats["orders"] += 1
+            return self.order_id
+
+class MockExchangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real endpoint
+    disable_nagle_algorithm = True
+
+    def _reply(self, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _admitted(self):
+        status = self.server.admit()
+        if status == 429:
+            self._reply(429, {"Success": False, "ErrMsg": "rate limit exceeded"}, {"Retry-After": "0.1"})
+        elif status is not None:
+            self._reply(status, {"Success": False, "ErrMsg": "injected error"})
+        return status is None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path != "/v3/ticker":
+            self._reply(404, {"Success": False, "ErrMsg": "not found"})
+            return
+        if not self._admitted():
+            return
+        params = dict(parse_qsl(url.query))
+        prices = self.server.feed.prices(move=True)
+        pair = params.get("pair")
+        if pair and pair not in prices:
+            self._reply(200, {"Success": False, "ErrMsg": f"unknown pair {pair}"})
+            return
+        data = {p: {"LastPrice": v, "MaxBid": v, "MinAsk": v} for p, v in prices.items() if not pair or p == pair}
+        self._reply(200, {"Success": True, "ErrMsg": "", "ServerTime": int(time.time() * 1000), "Data": data})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length).decode()
+        if urlsplit(self.path).path != "/v3/place_order":
+            self._reply(404, {"Success": False, "ErrMsg": "not found"})
+            return
+        if not self._admitted():
+            return
+        params = dict(parse_qsl(body))
+        if not self.server.verify(self.headers, params):
+            with self.server.lock:
+                self.server.stats["rejected"] += 1
+            self._reply(401, {"Success": False, "ErrMsg": "invalid signature"})
+            return
+        price = self.server.feed.prices().get(params.get("pair"))
+        if price is None:
+            self._reply(200, {"Success": False, "ErrMsg": f"unknown pair {params.get('pair')}"})
+            return
+        order = {
+            "OrderID": self.server.next_order_id(),
+            "Pair": params["pair"],
+            "Side": params.get("side"),
+            "Type": params.get("type"),
+            "Quantity": float(params.get("quantity", 0)),
+            "FilledQuantity": float(params.get("quantity", 0)),
+            "FilledAverPrice": float(params.get("price", price)),
+            "Status": "FILLED",
+        }
+        self._reply(200, {"Success": True, "ErrMsg": "", "OrderDetail": order})
+
+    def log_message(self, format, *args):
+        logging.debug("mock exchange: " + format, *args)
+
+# --- MAIN EXECUTION ---
+def main():
+    parser = argparse.ArgumentParser(description="Local mock of the Roostoo ticker/order API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--prices", help="CSV with a price column (and optionally pair) to replay")
+    parser.add_argument("--advance", choices=["request", "time"], default="request")
+    parser.add_argument("--tick-seconds", type=float, default=1.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--max-rps", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    series = load_price_file(args.prices) if args.prices else synthetic_prices(seed=args.seed)
+    exchange = MockExchange(args.host, args.port, PriceFeed(series, args.advance, args.tick_seconds),
+                            latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                            rate_limit_rate=args.rate_limit_rate, max_requests_per_second=args.max_rps, seed=args.seed)
+    print(f"Mock exchange listening on {exchange.base_url} with pairs {', '.join(series)}")
+    try:
+        exchange.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        exchange.server_close()
+        print(f"Stats: {exchange.stats}")
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,61 @@
 import time
 import logging
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import mplfinance as mpf
 from datetime import datetime, timedelta
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s', filename='trade_log.txt', filemode='w')
+from indicators import SMA, Momentum
+from candles import CandleAggregator
+from tickstore import TickStore
+from scheduler import TickScheduler
+from records import TradeLog, EquityHistory
+from chart_worker import ChartRenderer
 
 # --- CONFIGURATION ---
 TRADING_DURATION = 60  # Run for 1 minute
+TICK_INTERVAL = 5  # Seconds between price ticks
 TRADE_AMOUNT = 0.001  # 0.001 BTC per trade
-CANDLE_INTERVAL = 10  # Seconds per candlestick
+CANDLE_INTERVAL = 10  # Seconds per candlestick in the chart
+CANDLE_TIMEFRAMES = (1, 10, 60, 300, 3600)  # all built in one pass; must include CANDLE_INTERVAL
+CANDLE_HISTORY = 10000  # completed candles kept per timeframe
+TICK_STORE_DIR = None  # e.g. "ticks" (see Grid.py) to warm the indicators from recorded prices
+WARM_START_PAIR = "BTC/USD"
+WARM_START_TICKS = 1000  # only the last long_window prices affect the signal
+LIVE_CHART_FILE = None  # e.g. "chart.png": redrawn during the run by a separate process (chart_worker.py)
+LIVE_CHART_FPS = 1.0  # live chart frames per second at most
+HEADLESS = False  # True skips the chart at the end; pandas/mplfinance are only imported when exporting or charting
 
 class TradingStrategy:
     def __init__(self, short_window=3, long_window=7, momentum_window=5):
         self.short_window = short_window
         self.long_window = long_window
         self.momentum_window = momentum_window
-        self.prices = []
+        # Streaming indicators: per-tick cost doesn't depend on the window sizes.
+        # The long average spans every price the strategy keeps, as the old price list did.
+        self.short_ma = SMA(short_window)
+        self.long_ma = SMA(max(long_window, momentum_window))
+        self.momentum = Momentum(momentum_window)
+        self.ticks = 0
+        self.last_price = None
     
     def update_price(self, price):
-        self.prices.append(price)
-        if len(self.prices) > max(self.long_window, self.momentum_window):
-            self.prices.pop(0)
+        self.ticks += 1
+        self.last_price = price
+        for indicator in (self.short_ma, self.long_ma, self.momentum):
+            indicator.update(price)
     
+    def warm(self, prices):
+        # Same indicator state as update_price over `prices`, in one vectorized pass
+        for indicator in (self.short_ma, self.long_ma, self.momentum):
+            indicator.warm(prices)
+        self.ticks = len(prices)
+        self.last_price = float(prices[-1]) if len(prices) else None
+
     def generate_signal(self):
-        if len(self.prices) < self.long_window:
+        if self.ticks < self.long_window:
             return "HOLD"
 
-        short_ma = np.mean(self.prices[-self.short_window:])
-        long_ma = np.mean(self.prices)
-        momentum = self.prices[-1] - self.prices[-self.momentum_window] if len(self.prices) >= self.momentum_window else 0
+        short_ma = self.short_ma.value
+        long_ma = self.long_ma.value
+        momentum = self.momentum.value if self.momentum.value is not None else 0
 
         if short_ma > long_ma and momentum > 0:
             return "BUY"
@@ -42,92 +65,98 @@ class TradingStrategy:
             return "HOLD"
 
 class TradingBot:
-    def __init__(self, strategy, initial_cash=100000):
+    def __init__(self, strategy, initial_cash=100000, chart=None):
         self.strategy = strategy
         self.initial_cash = initial_cash
         self.cash = initial_cash
         self.holdings = 0.0
-        self.trade_log = []
-        self.portfolio_history = []
+        self.trade_log = TradeLog()
+        self.portfolio_history = EquityHistory()
         self.start_time = datetime.now()
-        self.candlestick_data = []
-        self.current_candle = None  # Store [Open, Close, High, Low, Timestamp]
-        self.last_candle_time = datetime.now()
+        self.candles = CandleAggregator(CANDLE_TIMEFRAMES, CANDLE_HISTORY)  # subscribe() for candle-close events
+        self.chart = chart  # optional ChartRenderer fed with closed candles and trades
+        if chart is not None:
+            self.candles.subscribe(chart.on_candle, chart.timeframe)
     
     def update_portfolio_value(self, price):
         portfolio_value = self.cash + self.holdings * price
-        self.portfolio_history.append((datetime.now(), portfolio_value))
+        self.portfolio_history.append(datetime.now(), portfolio_value)
         return portfolio_value
     
     def simulate_trade(self, signal, price):
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = datetime.now()
         if signal == "BUY" and self.cash >= TRADE_AMOUNT * price:
             self.holdings += TRADE_AMOUNT
             self.cash -= TRADE_AMOUNT * price
-            self.trade_log.append([timestamp, "BUY", price, TRADE_AMOUNT])
+            self.trade_log.append(timestamp, "BUY", price, TRADE_AMOUNT, self.cash, self.holdings)
+            if self.chart is not None:
+                self.chart.trade(time.time(), "BUY", price)
             logging.info(f"Bought {TRADE_AMOUNT} BTC at ${price:.2f}")
         elif signal == "SELL" and self.holdings >= TRADE_AMOUNT:
             self.holdings -= TRADE_AMOUNT
             self.cash += TRADE_AMOUNT * price
-            self.trade_log.append([timestamp, "SELL", price, TRADE_AMOUNT])
+            self.trade_log.append(timestamp, "SELL", price, TRADE_AMOUNT, self.cash, self.holdings)
+            if self.chart is not None:
+                self.chart.trade(time.time(), "SELL", price)
             logging.info(f"Sold {TRADE_AMOUNT} BTC at ${price:.2f}")
     
-    def update_candlestick(self, price):
-        current_time = datetime.now()
-
-        # If it's the first price update, initialize candle
-        if self.current_candle is None:
-            self.current_candle = [price, price, price, price, current_time]
-
-        # Update High, Low, Close
-        self.current_candle[1] = price  # Close price
-        self.current_candle[2] = max(self.current_candle[2], price)  # High
-        self.current_candle[3] = min(self.current_candle[3], price)  # Low
-
-        # Check if CANDLE_INTERVAL seconds have passed
-        if (current_time - self.last_candle_time).seconds >= CANDLE_INTERVAL:
-            self.current_candle[4] = self.last_candle_time  # Set candle time
-            self.candlestick_data.append(self.current_candle)  # Store completed candle
-            self.current_candle = [price, price, price, price, current_time]  # New candle
-            self.last_candle_time = current_time
+    def update_candlestick(self, price, volume=0.0):
+        self.candles.update(price, time.time(), volume)
     
+    def tick(self):
+        price = np.random.uniform(30000, 40000)
+        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        self.strategy.update_price(price)
+        self.update_candlestick(price)
+        signal = self.strategy.generate_signal()
+
+        logging.info("Time: %s | Price: %.2f | Signal: %s", current_time, price, signal)
+        if signal in ["BUY", "SELL"]:
+            self.simulate_trade(signal, price)
+
+        self.update_portfolio_value(price)
+
     def run(self):
         logging.info("Starting trading bot...")
-        while (datetime.now() - self.start_time).seconds < TRADING_DURATION:
-            price = np.random.uniform(30000, 40000)
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            self.strategy.update_price(price)
-            self.update_candlestick(price)
-            signal = self.strategy.generate_signal()
-
-            logging.info(f"Time: {current_time} | Price: {price:.2f} | Signal: {signal}")
-            if signal in ["BUY", "SELL"]:
-                self.simulate_trade(signal, price)
-            
-            self.update_portfolio_value(price)
-            time.sleep(5)
-
+        # Ticks every TICK_INTERVAL on the monotonic clock for TRADING_DURATION seconds
+        scheduler = TickScheduler()
+        scheduler.every(TICK_INTERVAL, self.tick, name="momentum")
+        scheduler.run(duration=TRADING_DURATION - (datetime.now() - self.start_time).total_seconds())
+        scheduler.log_stats()
+
+        self.candles.flush()
+        if self.chart is not None:
+            self.chart.close()
         self.save_trade_log()
-        self.visualize_results()
+        if not HEADLESS:
+            self.visualize_results()
         self.display_final_profit()
     
     def save_trade_log(self):
-        df = pd.DataFrame(self.trade_log, columns=['Timestamp', 'Action', 'Price', 'Amount'])
-        if not df.empty:
-            df.to_csv("trade_log.csv", index=False)
-            logging.info("Trade log saved to trade_log.csv")
-        else:
+        if not self.trade_log:
             logging.warning("No trades executed. Trade log is empty.")
+            return
+        df = self.trade_log.to_dataframe()[['timestamp', 'signal', 'price', 'amount']]
+        df.columns = ['Timestamp', 'Action', 'Price', 'Amount']
+        df['Timestamp'] = [datetime.fromtimestamp(ns / 1e9).strftime('%Y-%m-%d %H:%M:%S')
+                           for ns in self.trade_log.column('timestamp').tolist()]  # local time, as logged
+        df.to_csv("trade_log.csv", index=False)
+        logging.info("Trade log saved to trade_log.csv")
 
     def visualize_results(self):
-        if not self.candlestick_data:
+        series = self.candles.series[CANDLE_INTERVAL]
+        if not len(series):
             logging.warning("No candlestick data available for plotting.")
             return
 
-        df = pd.DataFrame(self.candlestick_data, columns=['Open', 'Close', 'High', 'Low', 'Timestamp'])
-        df['Timestamp'] = pd.to_datetime(df['Timestamp'])
-        df.set_index('Timestamp', inplace=True)
+        # Imported here so the trading loop never loads pandas/matplotlib
+        import pandas as pd
+        import mplfinance as mpf
+        candles = series.to_arrays()
+        df = pd.DataFrame({'Open': candles['open'], 'High': candles['high'], 'Low': candles['low'],
+                           'Close': candles['close'], 'Volume': candles['volume']},
+                          index=pd.to_datetime(candles['time'], unit='s').rename('Timestamp'))
 
         mc = mpf.make_marketcolors(up='g', down='r', edge='black', wick='black')
         s = mpf.make_mpf_style(marketcolors=mc)
@@ -136,7 +165,7 @@ class TradingBot:
         logging.info("Candlestick chart plotted successfully.")
     
     def display_final_profit(self):
-        final_portfolio_value = self.update_portfolio_value(self.strategy.prices[-1])
+        final_portfolio_value = self.update_portfolio_value(self.strategy.last_price)
         profit_loss = final_portfolio_value - self.initial_cash
         profit_loss_percentage = (profit_loss / self.initial_cash) * 100
         
@@ -148,8 +177,16 @@ class TradingBot:
 
 # --- MAIN EXECUTION ---
 def main():
+    # Configured here, not at import: the chart worker's spawned child re-imports this module
+    # and must not truncate the bot's log
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s', filename='trade_log.txt', filemode='w')
     strategy = TradingStrategy()
-    bot = TradingBot(strategy)
+    if TICK_STORE_DIR:
+        _, prices = TickStore(TICK_STORE_DIR).read(WARM_START_PAIR, last=WARM_START_TICKS)
+        strategy.warm(prices)
+        logging.info("Warm-started from %d recorded %s ticks", len(prices), WARM_START_PAIR)
+    chart = ChartRenderer(LIVE_CHART_FILE, CANDLE_INTERVAL, LIVE_CHART_FPS) if LIVE_CHART_FILE else None
+    bot = TradingBot(strategy, chart=chart)
     bot.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import csv
+import time
+import random
+import argparse
+import itertools
+import numpy as np
+from datetime import datetime
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+from backtest import load_prices, backtest_rsi_grid, backtest_momentum, INITIAL_CASH
+from risk import per_period_rate
+from Grid import RISK_FREE_RATE, FETCH_INTERVAL
+
+TICK_RISK_FREE_RATE = per_period_rate(RISK_FREE_RATE, FETCH_INTERVAL)  # what RiskManager subtracts per tick
+
+# --- PARAMETER SPACES ---
+# Lists are sampled as given; (low, high) tuples are sampled uniformly by random search
+# (as ints when both ends are ints) and expanded to 5 evenly spaced points by grid search.
+GRID_SPACE = {
+    "rsi_period": [7, 10, 14, 21, 28],
+    "oversold": [20, 25, 30, 35, 40, 45],
+    "overbought": [55, 60, 65, 70, 75, 80],
+    "grid_gap": [0.0001, 0.0005, 0.001, 0.002, 0.005],
+    "stop_loss_pct": [0.5, 1, 2, 3],
+    "take_profit_pct": [1, 2, 3, 5],
+}
+MOMENTUM_SPACE = {
+    "short_window": [2, 3, 5, 8, 13],
+    "long_window": [7, 13, 21, 34, 55, 89],
+    "momentum_window": [3, 5, 8, 13, 21],
+}
+STRATEGIES = {
+    "grid": (backtest_rsi_grid, GRID_SPACE),
+    "momentum": (backtest_momentum, MOMENTUM_SPACE),
+}
+
+def _valid(strategy, params):
+    if strategy == "grid":
+        return params["oversold"] < params["overbought"]
+    return params["short_window"] < params["long_window"]
+
+def _grid_values(values):
+    if isinstance(values, tuple):
+        low, high = values
+        points = np.linspace(low, high, 5)
+        return sorted(set(int(round(v)) for v in points)) if isinstance(low, int) and isinstance(high, int) else points.tolist()
+    return list(values)
+
+def grid_search(space):
+    names = list(space)
+    for combo in itertools.product(*(_grid_values(space[name]) for name in names)):
+        yield dict(zip(names, combo))
+
+def random_search(space, samples, seed=None):
+    rng = random.Random(seed)
+    for _ in range(samples):
+        params = {}
+        for name, values in space.items():
+            if isinstance(values, tuple):
+                low, high = values
+                params[name] = rng.randint(low, high) if isinstance(low, int) and isinstance(high, int) else rng.uniform(low, high)
+            else:
+                params[name] = rng.choice(values)
+        yield params
+
+# --- METRICS ---
+def performance(equity, initial_cash=INITIAL_CASH, risk_free_rate=TICK_RISK_FREE_RATE):
+    if len(equity) < 2:
+        return {"sharpe": 0.0, "return_pct": 0.0, "max_drawdown_pct": 0.0}
+    excess = np.diff(equity) / equity[:-1] - risk_free_rate
+    std = excess.std()
+    peak = np.maximum.accumulate(equity)
+    return {
+        "sharpe": float(excess.mean() / std) if std > 0 else 0.0,  # per tick, of excess returns, like RiskManager
+        "return_pct": float((equity[-1] / initial_cash - 1) * 100),
+        "max_drawdown_pct": float(((peak - equity) / peak).max() * 100),
+    }
+
+# --- WORKERS ---
+# The price array lives in one shared memory block; each worker maps it once at start-up
+# and tasks only carry their parameter dicts.
+_prices = None
+_shm = None
+
+def _attach(name, length):
+    global _prices, _shm
+    _shm = shared_memory.SharedMemory(name=name)
+    _prices = np.ndarray((length,), dtype=np.float64, buffer=_shm.buf)
+
+def _evaluate(strategy, params):
+    backtest, _ = STRATEGIES[strategy]
+    result = backtest(_prices, **params)
+    row = dict(params)
+    row.update(performance(result["equity"]))
+    row["trades"] = result["n_trades"]
+    return row
+
+def _evaluate_chunk(strategy, chunk):
+    return [_evaluate(strategy, params) for params in chunk]
+
+def optimize(prices, strategy="grid", search="grid", samples=1000, space=None, workers=None, seed=None, chunk_size=8):
+    # Backtests every parameter combination over `prices` on a process pool and returns
+    # the rows ranked by Sharpe, then return
+    _, default_space = STRATEGIES[strategy]
+    space = space or default_space
+    candidates = grid_search(space) if search == "grid" else random_search(space, samples, seed)
+    candidates = [params for params in candidates if _valid(strategy, params)]
+    chunks = [candidates[i:i + chunk_size] for i in range(0, len(candidates), chunk_size)]
+
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, prices.nbytes))
+    try:
+        np.ndarray(prices.shape, dtype=np.float64, buffer=shm.buf)[:] = prices
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_attach,
+                                 initargs=(shm.name, len(prices))) as pool:
+            rows = [row for batch in pool.map(_evaluate_chunk, itertools.repeat(strategy), chunks) for row in batch]
+    finally:
+        shm.close()
+        shm.unlink()
+    rows.sort(key=lambda row: (row["sharpe"], row["return_pct"]), reverse=True)
+    return rows
+
+def print_table(rows, top=20):
+    if not rows:
+        print("No valid parameter combinations.")
+        return
+    columns = list(rows[0])
+    print("  ".join(f"{c:>16}" for c in columns))
+    for row in rows[:top]:
+        print("  ".join(f"{row[c]:>16.6g}" if isinstance(row[c], float) else f"{row[c]:>16}" for c in columns))
+
+# --- MAIN EXECUTION ---
+def main():
+    parser = argparse.ArgumentParser(description="Parameter sweep over a historical price file")
+    parser.add_argument("path", help="CSV or Parquet file with a price column, or a TickStore directory")
+    parser.add_argument("--strategy", choices=list(STRATEGIES), default="grid")
+    parser.add_argument("--search", choices=["grid", "random"], default="random")
+    parser.add_argument("--samples", type=int, default=1000, help="combinations tried by random search")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--output", help="write the full ranked table to this CSV file")
+    parser.add_argument("--column", default="price")
+    parser.add_argument("--pair", help="TickStore pair to read")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="TickStore range start, ISO date/time")
+    parser.add_argument("--end", type=datetime.fromisoformat, help="TickStore range end (exclusive)")
+    args = parser.parse_args()
+
+    prices = load_prices(args.path, args.column, args.pair, args.start, args.end)
+    start = time.perf_counter()
+    rows = optimize(prices, args.strategy, args.search, args.samples, workers=args.workers, seed=args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"{len(rows)} combinations over {len(prices)} ticks in {elapsed:.2f}s ({len(rows) / elapsed:.1f}/s)")
+    print_table(rows, args.top)
+    if args.output and rows:
+        with open(args.output, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import heapq
+from itertools import count
+
+# --- POSITION BOOK ---
+# Open positions indexed by stop-loss (max-heap) and take-profit (min-heap). A tick only pops
+# the positions whose trigger was crossed, O(log n) each; closed positions go to `archive`.
+class PositionBook:
+    def __init__(self):
+        self.open = {}  # sequence number -> position dict, in insertion order
+        self.archive = []  # closed positions, oldest first
+        self._sl_heap = []  # (-sl, seq)
+        self._tp_heap = []  # (tp, seq)
+        self._seq = count()
+
+    def __len__(self):
+        return len(self.open)
+
+    def __iter__(self):
+        return iter(self.open.values())
+
+    def add(self, position):
+        seq = next(self._seq)
+        position['status'] = 'open'
+        self.open[seq] = position
+        heapq.heappush(self._sl_heap, (-position['sl'], seq))
+        heapq.heappush(self._tp_heap, (position['tp'], seq))
+        return position
+
+    def pop_triggered(self, price):
+        # Returns [(position, exit_reason)] for every open position hit at this price, in the
+        # order they were opened; SL wins when a position's SL and TP are both crossed.
+        hit = set()
+        sl_heap, tp_heap, open_positions = self._sl_heap, self._tp_heap, self.open
+        while sl_heap and -sl_heap[0][0] >= price:
+            seq = heapq.heappop(sl_heap)[1]
+            if seq in open_positions:
+                hit.add(seq)
+        while tp_heap and tp_heap[0][0] <= price:
+            seq = heapq.heappop(tp_heap)[1]
+            if seq in open_positions:
+                hit.add(seq)
+        if not hit:
+            return []
+
+        triggered = []
+        for seq in sorted(hit):
+            position = open_positions.pop(seq)
+            position['status'] = 'closed'
+            self.archive.append(position)
+            triggered.append((position, "SL Hit" if price <= position['sl'] else "TP Hit"))
+        # Each close leaves one stale entry in the other heap; rebuild once they outnumber live ones
+        if len(sl_heap) + len(tp_heap) > 4 * len(open_positions) + 64:
+            self._compact()
+        return triggered
+
+    def _compact(self):
+        self._sl_heap = [(-p['sl'], seq) for seq, p in self.open.items()]
+        self._tp_heap = [(p['tp'], seq) for seq, p in self.open.items()]
+        heapq.heapify(self._sl_heap)
+        heapq.heapify(self._tp_heap)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from tickstore import to_ns
+
+SIGNALS = ("HOLD", "BUY", "SELL", "CLOSE")  # signal codes are indexes into this
+EXIT_REASONS = ("SL Hit", "TP Hit")  # exit reason codes; -1 is no exit reason
+SIGNAL_CODES = {signal: code for code, signal in enumerate(SIGNALS)}
+EXIT_REASON_CODES = {None: -1, **{reason: code for code, reason in enumerate(EXIT_REASONS)}}
+INITIAL_CAPACITY = 1024
+
+# --- COLUMN STORE ---
+# Append-only records kept as one typed numpy array per column, doubled when full. A record
+# costs its column widths (a trade 62 bytes, an equity point 16) instead of a tuple or dict
+# of boxed Python objects. Strings are stored as small integer codes.
+class ColumnStore:
+    COLUMNS = ()  # (name, dtype, default for extend())
+    DECODERS = {}  # column -> function turning a stored value back into the logged one
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self._columns = {name: np.empty(capacity, dtype) for name, dtype, _ in self.COLUMNS}
+        self._arrays = tuple(self._columns.values())
+        self.capacity = capacity
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _reserve(self, n):
+        if self.size + n <= self.capacity:
+            return
+        capacity = max(self.capacity * 2, self.size + n)
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, column.dtype)
+            grown[:self.size] = column[:self.size]
+            self._columns[name] = grown
+        self._arrays = tuple(self._columns.values())
+        self.capacity = capacity
+
+    def _append(self, *values):
+        # values in COLUMNS order, already encoded
+        if self.size == self.capacity:
+            self._reserve(1)
+        i = self.size
+        for column, value in zip(self._arrays, values):
+            column[i] = value
+        self.size = i + 1
+
+    def extend(self, **columns):
+        # Bulk append of encoded column arrays of equal length (scalars are broadcast); missing
+        # columns get their default
+        n = next(len(values) for values in columns.values() if np.ndim(values))
+        self._reserve(n)
+        for name, _, default in self.COLUMNS:
+            self._columns[name][self.size:self.size + n] = columns.get(name, default)
+        self.size += n
+
+    def column(self, name):
+        # Stored values of one column: a view, valid until the next append grows the store
+        return self._columns[name][:self.size]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("record index out of range")
+        return Record(self, index)
+
+    def __iter__(self):
+        for index in range(self.size):
+            yield Record(self, index)
+
+    def _export(self, columns):
+        import pandas as pd
+        return pd.DataFrame(columns, copy=False)
+
+    def to_dataframe(self):
+        # Columns exported as views, without a copy; codes are left as integers
+        return self._export({name: self.column(name) for name, _, _ in self.COLUMNS})
+
+class Record:
+    # Read-only view of one stored record: record.price or record["price"]
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def __getattr__(self, name):
+        store = self._store
+        try:
+            value = store._columns[name][self._index].item()
+        except KeyError:
+            raise AttributeError(name) from None
+        decode = store.DECODERS.get(name)
+        return value if decode is None else decode(value)
+
+    def __getitem__(self, name):
+        return self.__getattr__(name)
+
+    def as_dict(self):
+        return {name: self.__getattr__(name) for name, _, _ in self._store.COLUMNS}
+
+    def __repr__(self):
+        return f"Record({self.as_dict()})"
+
+def _optional(value):
+    return None if value != value else value  # NaN -> None
+
+# --- TRADE LOG ---
+class TradeLog(ColumnStore):
+    COLUMNS = (
+        ("timestamp", np.int64, 0),  # ns since epoch
+        ("signal", np.int8, SIGNAL_CODES["HOLD"]),
+        ("price", np.float64, np.nan),
+        ("amount", np.float64, np.nan),
+        ("cash", np.float64, np.nan),
+        ("holdings", np.float64, np.nan),
+        ("order_id", np.int32, 0),  # per-bot order counter
+        ("sl", np.float64, np.nan),  # NaN when not set
+        ("tp", np.float64, np.nan),
+        ("exit_reason", np.int8, EXIT_REASON_CODES[None]),
+    )
+    DECODERS = {"signal": SIGNALS.__getitem__, "exit_reason": lambda code: EXIT_REASONS[code] if code >= 0 else None,
+                "sl": _optional, "tp": _optional}
+
+    def append(self, timestamp, signal, price, amount, cash, holdings, order_id=0, sl=None, tp=None, exit_reason=None):
+        self._append(to_ns(timestamp), SIGNAL_CODES[signal], price, amount, cash, holdings, order_id,
+                     np.nan if sl is None else sl, np.nan if tp is None else tp, EXIT_REASON_CODES[exit_reason])
+
+    def to_dataframe(self, decode=True):
+        # decode=True views the timestamps as datetime64[ns] (UTC) and turns the one-byte codes
+        # into categoricals; the numeric columns are never copied
+        columns = {name: self.column(name) for name, _, _ in self.COLUMNS}
+        if decode:
+            import pandas as pd
+            columns["timestamp"] = columns["timestamp"].view("datetime64[ns]")
+            columns["signal"] = pd.Categorical.from_codes(columns["signal"], SIGNALS)
+            columns["exit_reason"] = pd.Categorical.from_codes(columns["exit_reason"], EXIT_REASONS)
+        return self._export(columns)
+
+# --- EQUITY HISTORY ---
+class EquityHistory(ColumnStore):
+    COLUMNS = (
+        ("timestamp", np.int64, 0),  # ns since epoch
+        ("value", np.float64, np.nan),
+    )
+
+    def append(self, timestamp, value):
+        if self.size == self.capacity:
+            self._reserve(1)
+        i = self.size
+        self._arrays[0][i] = to_ns(timestamp)
+        self._arrays[1][i] = value
+        self.size = i + 1
+
+    @property
+    def values(self):
+        return self.column("value")
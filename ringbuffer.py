@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import numpy as np
+from datetime import datetime
+
+SPILL_DTYPE = np.dtype([("timestamp", "<i8"), ("price", "<f8")])
+
+# --- PRICE RING BUFFER ---
+# Fixed-capacity (timestamp, price) store. Every row is written twice, at i and i + capacity,
+# so the most recent rows are always one contiguous slice and window views never copy.
+class PriceRingBuffer:
+    def __init__(self, capacity=100000, spill_path=None, spill_block=4096):
+        if capacity < 2:
+            raise ValueError("Ring buffer capacity must be at least 2")
+        self.capacity = capacity
+        self.spill_path = spill_path  # evicted rows are appended here when set
+        self.spill_block = max(1, min(spill_block, capacity))
+        self._timestamps = np.zeros(2 * capacity, dtype=np.int64)  # ns since epoch
+        self._prices = np.zeros(2 * capacity, dtype=np.float64)
+        self._head = 0  # next write position in [0, capacity)
+        self.total = 0  # rows ever appended
+        self.spilled = 0  # rows ever written to the spill file
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    @property
+    def empty(self):
+        return self.total == 0
+
+    def append(self, timestamp, price):
+        if self.spill_path and self.total - self.spilled >= self.capacity:
+            self._spill()
+        if isinstance(timestamp, datetime):
+            timestamp = int(timestamp.timestamp() * 1e9)
+        elif timestamp is None:
+            timestamp = time.time_ns()
+        i = self._head
+        j = i + self.capacity
+        self._timestamps[i] = self._timestamps[j] = timestamp
+        self._prices[i] = self._prices[j] = price
+        self._head = i + 1 if i + 1 < self.capacity else 0
+        self.total += 1
+
+    def extend(self, timestamps, prices):
+        # Bulk append of int64 ns timestamps and prices; only the last `capacity` rows are kept
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        prices = np.asarray(prices, dtype=np.float64)
+        if self.spill_path:
+            for timestamp, price in zip(timestamps.tolist(), prices.tolist()):
+                self.append(timestamp, price)
+            return
+        n = len(prices)
+        k = min(n, self.capacity)
+        slots = (self._head + np.arange(n - k, n)) % self.capacity
+        self._timestamps[slots] = self._timestamps[slots + self.capacity] = timestamps[n - k:]
+        self._prices[slots] = self._prices[slots + self.capacity] = prices[n - k:]
+        self._head = (self._head + n) % self.capacity
+        self.total += n
+
+    def _window(self, column, n):
+        size = len(self)
+        n = size if n is None else min(n, size)
+        end = self._head + self.capacity if self.total >= self.capacity else self._head
+        return column[end - n:end]
+
+    def prices(self, n=None):
+        # Zero-copy view of the last n prices (all buffered prices by default), oldest first
+        return self._window(self._prices, n)
+
+    def timestamps(self, n=None):
+        return self._window(self._timestamps, n)
+
+    @property
+    def last_price(self):
+        if self.empty:
+            raise IndexError("Ring buffer is empty")
+        return float(self._prices[self._head - 1 + self.capacity])
+
+    @property
+    def last_timestamp(self):
+        if self.empty:
+            raise IndexError("Ring buffer is empty")
+        return datetime.fromtimestamp(self._timestamps[self._head - 1 + self.capacity] / 1e9)
+
+    def _spill(self):
+        # Write the oldest not-yet-spilled rows in one block before they are overwritten
+        n = min(self.spill_block, self.total - self.spilled)
+        start = len(self) - (self.total - self.spilled)
+        block = np.empty(n, dtype=SPILL_DTYPE)
+        block["timestamp"] = self.timestamps()[start:start + n]
+        block["price"] = self.prices()[start:start + n]
+        with open(self.spill_path, "ab") as f:
+            block.tofile(f)
+        self.spilled += n
+
+    def flush(self):
+        # Spill everything still only held in memory, e.g. before shutdown
+        while self.spill_path and self.spilled < self.total:
+            self._spill()
+
+    @staticmethod
+    def read_spill(path, mmap=True):
+        if mmap:
+            return np.memmap(path, dtype=SPILL_DTYPE, mode="r")
+        return np.fromfile(path, dtype=SPILL_DTYPE)
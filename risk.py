@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import math
+from bisect import bisect_left, insort
+
+SECONDS_PER_YEAR = 365 * 24 * 3600
+
+def per_period_rate(annual_rate_pct, period_seconds):
+    # Annual percentage rate (e.g. 2 for 2%) compounded down to one tick of `period_seconds`
+    return (1 + annual_rate_pct / 100) ** (period_seconds / SECONDS_PER_YEAR) - 1
+
+# --- ONLINE RISK ENGINE ---
+# Memory is fixed and the moments are O(1) per update: Welford running mean/variance of excess
+# returns, running downside deviation and max drawdown. Historical VaR keeps the last
+# `var_window` returns in a ring plus the same returns in a sorted list, updated with a bisect
+# remove/insert (O(log window) search and a memmove of the list), so reading VaR is one lookup.
+class RiskEngine:
+    def __init__(self, risk_free_rate=0.0, var_window=1000, var_confidence=0.95,
+                 max_drawdown_pct=None, max_var_pct=None):
+        self.risk_free_rate = risk_free_rate  # per period, see per_period_rate
+        self.var_window = var_window
+        self.var_confidence = var_confidence
+        self.max_drawdown_pct = max_drawdown_pct  # halt limits, None disables
+        self.max_var_pct = max_var_pct
+        self.returns = [0.0] * var_window  # ring of recent simple returns
+        self.sorted_returns = []  # the same returns, ascending
+        self.last_value = None
+        self.count = 0  # returns seen
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared deviations from the mean
+        self.downside_sq = 0.0  # sum of squared negative excess returns
+        self.peak = None
+        self.drawdown = 0.0  # current, as a fraction of the peak
+        self.max_drawdown = 0.0
+
+    def update(self, value):
+        value = float(value)
+        if self.peak is None or value > self.peak:
+            self.peak = value
+        if self.peak > 0:
+            self.drawdown = (self.peak - value) / self.peak
+            if self.drawdown > self.max_drawdown:
+                self.max_drawdown = self.drawdown
+        last_value, self.last_value = self.last_value, value
+        if not last_value:
+            return None
+
+        r = value / last_value - 1
+        slot = self.count % self.var_window
+        ordered = self.sorted_returns
+        if self.count >= self.var_window:
+            del ordered[bisect_left(ordered, self.returns[slot])]
+        insort(ordered, r)
+        self.returns[slot] = r
+        self.count += 1
+        excess = r - self.risk_free_rate
+        delta = excess - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (excess - self.mean)
+        if excess < 0:
+            self.downside_sq += excess * excess
+        return r
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+    @property
+    def sharpe(self):
+        std = self.std
+        return self.mean / std if std else 0.0
+
+    @property
+    def sortino(self):
+        if not self.count:
+            return 0.0
+        downside = math.sqrt(self.downside_sq / self.count)
+        return self.mean / downside if downside else 0.0
+
+    def value_at_risk(self):
+        # Historical VaR of one period's return over the window, as a positive loss fraction
+        n = len(self.sorted_returns)
+        if not n:
+            return 0.0
+        k = int((1 - self.var_confidence) * (n - 1))
+        return max(0.0, -self.sorted_returns[k])
+
+    def breach(self):
+        # Reason string when a configured limit is exceeded, otherwise None
+        if self.max_drawdown_pct is not None and self.drawdown * 100 >= self.max_drawdown_pct:
+            return f"drawdown {self.drawdown * 100:.2f}% >= {self.max_drawdown_pct}%"
+        if self.max_var_pct is not None and self.count >= self.var_window:
+            var = self.value_at_risk() * 100
+            if var >= self.max_var_pct:
+                return f"VaR {var:.3f}% >= {self.max_var_pct}%"
+        return None
+
+    def summary(self):
+        return {
+            "sharpe": self.sharpe,
+            "sortino": self.sortino,
+            "max_drawdown_pct": self.max_drawdown * 100,
+            "var_pct": self.value_at_risk() * 100,
+        }
@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import hmac
+import asyncio
+import random
+import hashlib
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+API_BASE_URL = "https://mock-api.roostoo.com"
+POOL_SIZE = 10  # keep-alive connections kept per host
+MAX_RETRIES = 5  # retries on rate-limit / unavailable responses
+BACKOFF_BASE = 0.25  # seconds, doubled on every retry
+BACKOFF_CAP = 8.0  # seconds
+RETRY_STATUS = (429, 503)
+ORDER_TEMPLATE_CACHE = 256  # staged (pair, side, type, quantity, price) orders kept per client
+FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+
+# --- SHARED HTTP SESSION ---
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def get_session(pool_size=POOL_SIZE):
+    # One keep-alive session per pool size, shared by every client in the process
+    with _sessions_lock:
+        session = _sessions.get(pool_size)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["Connection"] = "keep-alive"
+            _sessions[pool_size] = session
+        return session
+
+def backoff_delay(attempt, response=None, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    # Honour Retry-After when the server sends one, otherwise full-jitter exponential backoff
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(cap, float(retry_after))
+            except ValueError:
+                pass
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+# --- LATENCY COUNTERS ---
+class RequestStats:
+    def __init__(self, window=10000):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.total_time = 0.0
+        self.latencies = deque(maxlen=window)  # most recent round-trip times in seconds
+        self._lock = threading.Lock()
+
+    def record(self, elapsed, ok):
+        with self._lock:
+            self.count += 1
+            self.total_time += elapsed
+            self.latencies.append(elapsed)
+            if not ok:
+                self.errors += 1
+
+    def snapshot(self):
+        with self._lock:
+            latencies = np.fromiter(self.latencies, dtype=float, count=len(self.latencies))
+            summary = {
+                "count": self.count,
+                "errors": self.errors,
+                "retries": self.retries,
+                "rate_limited": self.rate_limited,
+                "mean_ms": self.total_time / self.count * 1000 if self.count else 0.0,
+            }
+        if len(latencies):
+            p50, p99 = np.percentile(latencies, [50, 99])
+            summary["p50_ms"] = float(p50) * 1000
+            summary["p99_ms"] = float(p99) * 1000
+        return summary
+
+# --- ORDER ENCODING ---
+# Signed requests send the canonical query string (keys sorted, `k=v` joined by `&`) as the
+# form body, so the bytes that are signed are the bytes on the wire and nothing is encoded
+# twice. Values are sent as is: pairs, sides, types, quantities and timestamps never contain
+# `&`, `=`, `+` or `%`.
+def canonical_query(params):
+    return '&'.join([f"{key}={value}" for key, value in sorted(params.items())])
+
+class OrderTemplate:
+    # An order whose fields are all fixed except the timestamp, staged once: the body is
+    # head + timestamp + tail, and the HMAC state has already absorbed the head, so placing
+    # it costs one hmac copy and a hash of the timestamp and tail.
+    def __init__(self, mac, params):
+        head, tail = canonical_query(dict(params, timestamp="\0")).encode().split(b"\0")
+        self.head = head
+        self.tail = tail
+        self.mac = mac.copy()
+        self.mac.update(head)
+
+    def encode(self, timestamp):
+        # (body, signature) for this order sent at `timestamp`
+        ts = timestamp.encode()
+        mac = self.mac.copy()
+        mac.update(ts + self.tail)
+        return self.head + ts + self.tail, mac.hexdigest()
+
+# --- API CLIENT ---
+class RoostooAPIClient:
+    def __init__(self, api_key, secret_key, base_url=API_BASE_URL, pool_size=POOL_SIZE, max_retries=MAX_RETRIES, timeout=10):
+        self.api_key = api_key
+        self.secret_key = secret_key.encode()  # must be bytes for HMAC
+        self._mac = hmac.new(self.secret_key, digestmod=hashlib.sha256)  # keyed state, copied per signature
+        self._templates = {}  # (pair, side, type, quantity, price) -> OrderTemplate
+        self.base_url = base_url
+        self.session = get_session(pool_size)
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.stats = {}  # endpoint path -> RequestStats
+
+    def _get_timestamp(self):
+        return str(int(time.time() * 1000))
+
+    def _sign(self, params: dict):
+        query_string = canonical_query(params)
+        mac = self._mac.copy()
+        mac.update(query_string.encode())
+        return mac.hexdigest(), query_string
+
+    def _headers(self, params: dict, is_signed=False):
+        headers = {"Content-Type": FORM_CONTENT_TYPE}
+        if is_signed:
+            signature, _ = self._sign(params)
+            headers["RST-API-KEY"] = self.api_key
+            headers["MSG-SIGNATURE"] = signature
+        return headers
+
+    def _handle_response(self, response):
+        if response is None:
+            return None
+        if response.status_code != 200:
+            logging.error(f"HTTP Error: {response.status_code} {response.text}")
+            return None
+        try:
+            return response.json()
+        except Exception as e:
+            logging.error(f"JSON decode error: {e}")
+            return None
+
+    def _request(self, method, path, **kwargs):
+        stats = self.stats.get(path)
+        if stats is None:
+            stats = self.stats[path] = RequestStats()
+        url = f"{self.base_url}{path}"
+        response = None
+        for attempt in range(self.max_retries + 1):
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            except requests.RequestException as e:
+                stats.record(time.perf_counter() - start, ok=False)
+                # Only a GET is safe to resend when we don't know whether the server saw it
+                if method != "GET" or attempt == self.max_retries:
+                    logging.error(f"Request to {path} failed: {e}")
+                    return None
+                stats.retries += 1
+                time.sleep(backoff_delay(attempt))
+                continue
+            stats.record(time.perf_counter() - start, ok=response.status_code == 200)
+            if response.status_code not in RETRY_STATUS or attempt == self.max_retries:
+                break
+            if response.status_code == 429:
+                stats.rate_limited += 1
+            stats.retries += 1
+            delay = backoff_delay(attempt, response)
+            logging.warning(f"{path} returned {response.status_code}, retrying in {delay:.2f}s")
+            time.sleep(delay)
+        return response
+
+    def latency_stats(self):
+        return {path: stats.snapshot() for path, stats in self.stats.items()}
+
+    def get_ticker(self, pair=None):
+        params = {"timestamp": self._get_timestamp()}
+        if pair:
+            params["pair"] = pair
+        headers = self._headers(params, is_signed=False)
+        response = self._request("GET", "/v3/ticker", params=params, headers=headers)
+        return self._handle_response(response)
+
+    def get_prices(self, pairs):
+        # One request for every pair: /v3/ticker returns all pairs when `pair` is omitted
+        ticker = self.get_ticker()
+        if not ticker or not ticker.get("Success"):
+            return None
+        return parse_prices(ticker, pairs)
+
+    def prepare_order(self, pair, side, order_type, quantity, price=None):
+        # Stages an order for repeated placement, e.g. a bot's fixed-size BUY and SELL at startup
+        key = (pair, side, order_type, quantity, price)
+        template = self._templates.get(key)
+        if template is None:
+            params = {"pair": pair, "side": side, "type": order_type, "quantity": quantity}
+            # For MARKET orders, price is not required.
+            if order_type.upper() == "LIMIT":
+                if price is None:
+                    raise ValueError("Price must be provided for LIMIT orders")
+                params["price"] = price
+            if len(self._templates) >= ORDER_TEMPLATE_CACHE:
+                self._templates.clear()
+            template = self._templates[key] = OrderTemplate(self._mac, params)
+        return template
+
+    def place_prepared(self, template):
+        body, signature = template.encode(self._get_timestamp())
+        headers = {"Content-Type": FORM_CONTENT_TYPE, "RST-API-KEY": self.api_key, "MSG-SIGNATURE": signature}
+        response = self._request("POST", "/v3/place_order", data=body, headers=headers)
+        return self._handle_response(response)
+
+    def place_order(self, pair, side, order_type, quantity, price=None):
+        # Repeated (pair, side, type, quantity, price) orders reuse their staged template
+        return self.place_prepared(self.prepare_order(pair, side, order_type, quantity, price))
+
+def parse_prices(ticker, pairs):
+    # LastPrice of each pair as a float array in `pairs` order, NaN for pairs missing from the response
+    data = ticker.get("Data") or {}
+    prices = np.full(len(pairs), np.nan)
+    for i, pair in enumerate(pairs):
+        entry = data.get(pair)
+        if entry:
+            prices[i] = float(entry["LastPrice"])
+    return prices
+
+# --- ASYNC API CLIENT ---
+class AsyncRoostooAPIClient:
+    # asyncio front-end over RoostooAPIClient: calls run on a small thread pool that shares
+    # the pooled session, so awaiting an order never blocks market-data tasks.
+    def __init__(self, client, max_workers=None):
+        self.client = client
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or POOL_SIZE, thread_name_prefix="roostoo")
+
+    async def _call(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+
+    async def get_ticker(self, pair=None):
+        return await self._call(self.client.get_ticker, pair)
+
+    async def get_prices(self, pairs):
+        return await self._call(self.client.get_prices, pairs)
+
+    async def place_order(self, pair, side, order_type, quantity, price=None):
+        return await self._call(self.client.place_order, pair, side, order_type, quantity, price)
+
+    def close(self):
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import heapq
+import logging
+import threading
+from itertools import count
+
+# --- CADENCE ---
+# Deadlines on the monotonic clock at start + k * interval, so the time spent fetching and
+# processing is absorbed instead of added to every period. When a run ends past the next
+# deadline the missed ticks are either skipped (wait for the next slot on the original
+# phase) or coalesced (one catch-up run straight away, then a new phase from there).
+class Cadence:
+    def __init__(self, interval, policy="skip", clock=time.monotonic, start=None):
+        if interval <= 0:
+            raise ValueError("Interval must be positive")
+        if policy not in ("skip", "coalesce"):
+            raise ValueError(f"Unknown scheduling policy: {policy}")
+        self.interval = interval
+        self.policy = policy
+        self.clock = clock
+        self.next_due = clock() if start is None else start
+        self.started = None
+        self.runs = 0
+        self.skipped = 0  # ticks dropped by "skip"
+        self.coalesced = 0  # ticks folded into one catch-up run by "coalesce"
+        self.overruns = 0  # runs that took longer than the interval
+        self.lateness_total = 0.0  # seconds between deadline and actual start
+        self.lateness_max = 0.0
+        self.duration_total = 0.0
+        self.duration_max = 0.0
+
+    def delay(self):
+        # Seconds until the next deadline, 0 when it has passed
+        return max(0.0, self.next_due - self.clock())
+
+    def begin(self):
+        now = self.started = self.clock()
+        lateness = max(0.0, now - self.next_due)
+        self.lateness_total += lateness
+        if lateness > self.lateness_max:
+            self.lateness_max = lateness
+
+    def end(self):
+        now = self.clock()
+        duration = now - self.started
+        self.runs += 1
+        self.duration_total += duration
+        if duration > self.duration_max:
+            self.duration_max = duration
+        if duration > self.interval:
+            self.overruns += 1
+        self.next_due += self.interval
+        if self.next_due <= now:
+            missed = int((now - self.next_due) // self.interval) + 1
+            if self.policy == "skip":
+                self.skipped += missed
+                self.next_due += missed * self.interval
+            else:
+                self.coalesced += missed - 1  # the catch-up run stands in for the rest
+                self.next_due = now
+
+    def stats(self):
+        runs = self.runs or 1
+        return {
+            "interval": self.interval,
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "coalesced": self.coalesced,
+            "overruns": self.overruns,
+            "mean_lateness_ms": self.lateness_total / runs * 1000,
+            "max_lateness_ms": self.lateness_max * 1000,
+            "mean_duration_ms": self.duration_total / runs * 1000,
+            "max_duration_ms": self.duration_max * 1000,
+        }
+
+# --- TICK SCHEDULER ---
+# Runs any number of periodic jobs, each with its own interval, on one thread: always the job
+# with the earliest deadline next, so a sub-second job can't starve a slow one. A job whose
+# callback returns True is removed; run() returns when no jobs are left, stop() is called or
+# `duration` seconds have passed.
+class Job:
+    def __init__(self, name, callback, cadence):
+        self.name = name
+        self.callback = callback
+        self.cadence = cadence
+        self.cancelled = False
+
+class TickScheduler:
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.jobs = []
+        self._heap = []  # (next_due, seq, job)
+        self._seq = count()
+        self._stop = threading.Event()
+
+    def every(self, interval, callback, name=None, policy="skip", start=None):
+        job = Job(name or getattr(callback, "__name__", "job"), callback, Cadence(interval, policy, self.clock, start))
+        self.jobs.append(job)
+        heapq.heappush(self._heap, (job.cadence.next_due, next(self._seq), job))
+        return job
+
+    def cancel(self, job):
+        job.cancelled = True
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self, duration=None):
+        deadline = None if duration is None else self.clock() + duration
+        heap = self._heap
+        while heap and not self._stop.is_set():
+            due, _, job = heap[0]
+            if job.cancelled:
+                heapq.heappop(heap)
+                continue
+            if deadline is not None and due >= deadline:
+                break
+            wait = due - self.clock()
+            if wait > 0:
+                # Sleep in one piece, woken early only by stop()
+                if self._stop.wait(wait if deadline is None else min(wait, deadline - self.clock())):
+                    break
+                continue
+            heapq.heappop(heap)
+            cadence = job.cadence
+            cadence.begin()
+            try:
+                finished = job.callback()
+            finally:
+                cadence.end()
+            if finished:
+                job.cancelled = True
+            else:
+                heapq.heappush(heap, (cadence.next_due, next(self._seq), job))
+
+    def stats(self):
+        return {job.name: job.cadence.stats() for job in self.jobs}
+
+    def log_stats(self):
+        for name, s in self.stats().items():
+            logging.info("Schedule %s every %ss: %d runs, %d skipped, %d coalesced, %d overruns, "
+                         "lateness mean %.1f ms max %.1f ms, duration mean %.1f ms max %.1f ms",
+                         name, s["interval"], s["runs"], s["skipped"], s["coalesced"], s["overruns"],
+                         s["mean_lateness_ms"], s["max_lateness_ms"], s["mean_duration_ms"], s["max_duration_ms"])
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import time
+import atexit
+import numpy as np
+from urllib.parse import unquote
+from datetime import datetime, timezone
+
+DAY_NS = 86400 * 10**9
+TIMESTAMP_SUFFIX = ".ts"  # int64 ns since epoch, little-endian
+PRICE_SUFFIX = ".px"  # float64, little-endian
+TIMESTAMP_DTYPE = np.dtype("<i8")
+PRICE_DTYPE = np.dtype("<f8")
+
+def to_ns(timestamp):
+    # datetime, int ns or None (now) -> int ns since epoch
+    if isinstance(timestamp, datetime):
+        return int(timestamp.timestamp() * 1e9)
+    if timestamp is None:
+        return time.time_ns()
+    return int(timestamp)
+
+def _day(ns):
+    return datetime.fromtimestamp(ns // DAY_NS * 86400, tz=timezone.utc).strftime("%Y-%m-%d")
+
+# --- TICK STORE ---
+# Columnar, append-only tick history: root/<pair>/<UTC day>.ts holds int64 ns timestamps
+# and <UTC day>.px the float64 prices, row for row. There is no header or parsing; reads
+# map the files with np.memmap and binary-search the (time-ordered) timestamps, so only the
+# pages of the requested range are ever touched. After a crash the two files of a day may
+# differ in length; readers use the rows present in both, and the first write to the day
+# after a restart truncates both to those rows.
+class TickStore:
+    def __init__(self, root, block_size=4096, flush_interval=60.0):
+        self.root = root
+        self.block_size = block_size  # ticks buffered per pair before a write
+        self.flush_interval = flush_interval  # seconds a tick may stay buffered
+        self._buffers = {}  # pair -> ([timestamps], [prices])
+        self._checked = set()  # partitions whose tail was made consistent this session
+        self._deadline = None
+        os.makedirs(root, exist_ok=True)
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _pair_dir(pair):
+        # BTC/USD -> BTC-USD; a '-' or '%' in the pair itself is percent-encoded so the name
+        # maps back to exactly one pair
+        return pair.replace("%", "%25").replace("-", "%2D").replace("/", "-")
+
+    @staticmethod
+    def _dir_pair(name):
+        return unquote(name.replace("-", "/"))
+
+    def _paths(self, pair, day):
+        base = os.path.join(self.root, self._pair_dir(pair), day)
+        return base + TIMESTAMP_SUFFIX, base + PRICE_SUFFIX
+
+    # --- WRITING ---
+    def append(self, pair, timestamp, price):
+        buffer = self._buffers.get(pair)
+        if buffer is None:
+            buffer = self._buffers[pair] = ([], [])
+        buffer[0].append(to_ns(timestamp))
+        buffer[1].append(price)
+        if self._deadline is None:
+            self._deadline = time.monotonic() + self.flush_interval
+        if len(buffer[0]) >= self.block_size or time.monotonic() >= self._deadline:
+            self.flush()
+
+    def append_many(self, pairs, timestamp, prices):
+        # One tick for several pairs at the same time, e.g. a parse_prices() array; NaN prices are skipped
+        ns = to_ns(timestamp)
+        for pair, price in zip(pairs, prices):
+            if price == price:
+                self.append(pair, ns, price)
+
+    def flush(self):
+        for pair, (timestamps, prices) in self._buffers.items():
+            if not timestamps:
+                continue
+            ts = np.array(timestamps, dtype=TIMESTAMP_DTYPE)
+            px = np.array(prices, dtype=PRICE_DTYPE)
+            days = ts // DAY_NS
+            # Split the block at day boundaries, one append per partition
+            cuts = np.flatnonzero(np.diff(days)) + 1
+            for start, stop in zip(np.r_[0, cuts], np.r_[cuts, len(ts)]):
+                ts_path, px_path = self._paths(pair, _day(int(ts[start])))
+                os.makedirs(os.path.dirname(ts_path), exist_ok=True)
+                if ts_path not in self._checked:
+                    self._repair(ts_path, px_path)
+                    self._checked.add(ts_path)
+                with open(ts_path, "ab") as f:
+                    ts[start:stop].tofile(f)
+                with open(px_path, "ab") as f:
+                    px[start:stop].tofile(f)
+            timestamps.clear()
+            prices.clear()
+        self._deadline = None
+
+    @staticmethod
+    def _repair(ts_path, px_path):
+        # A crash can leave the two files of a day at different lengths or end in half a row.
+        # Cut both back to the rows they have in common before appending, or every later
+        # timestamp would be paired with the wrong price.
+        sizes = [os.path.getsize(path) if os.path.exists(path) else 0 for path in (ts_path, px_path)]
+        rows = min(sizes[0] // TIMESTAMP_DTYPE.itemsize, sizes[1] // PRICE_DTYPE.itemsize)
+        for path, size, itemsize in zip((ts_path, px_path), sizes, (TIMESTAMP_DTYPE.itemsize, PRICE_DTYPE.itemsize)):
+            if size != rows * itemsize:
+                with open(path, "r+b") as f:
+                    f.truncate(rows * itemsize)
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self.flush)
+
+    # --- READING ---
+    def pairs(self):
+        return sorted(self._dir_pair(name) for name in os.listdir(self.root)
+                      if os.path.isdir(os.path.join(self.root, name)))
+
+    def days(self, pair):
+        directory = os.path.join(self.root, self._pair_dir(pair))
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name[:-len(TIMESTAMP_SUFFIX)] for name in os.listdir(directory) if name.endswith(TIMESTAMP_SUFFIX))
+
+    def _partition(self, pair, day):
+        ts_path, px_path = self._paths(pair, day)
+        n = min(os.path.getsize(ts_path) // TIMESTAMP_DTYPE.itemsize,
+                os.path.getsize(px_path) // PRICE_DTYPE.itemsize if os.path.exists(px_path) else 0)
+        if not n:
+            return None
+        return (np.memmap(ts_path, dtype=TIMESTAMP_DTYPE, mode="r", shape=(n,)),
+                np.memmap(px_path, dtype=PRICE_DTYPE, mode="r", shape=(n,)))
+
+    def iter_partitions(self, pair, start=None, end=None):
+        # (timestamps, prices) memmap views of each day within [start, end), oldest first;
+        # nothing outside the range is read
+        start_ns = None if start is None else to_ns(start)
+        end_ns = None if end is None else to_ns(end)
+        first = None if start_ns is None else _day(start_ns)
+        last = None if end_ns is None else _day(end_ns - 1)
+        for day in self.days(pair):
+            if (first is not None and day < first) or (last is not None and day > last):
+                continue
+            partition = self._partition(pair, day)
+            if partition is None:
+                continue
+            ts, px = partition
+            lo = 0 if start_ns is None else int(np.searchsorted(ts, start_ns, side="left"))
+            hi = len(ts) if end_ns is None else int(np.searchsorted(ts, end_ns, side="left"))
+            if lo < hi:
+                yield ts[lo:hi], px[lo:hi]
+
+    def read(self, pair, start=None, end=None, last=None):
+        # Timestamps (int64 ns) and prices of `pair` within [start, end), or only the `last`
+        # n ticks. A single day comes back as zero-copy memmap views, several are concatenated.
+        if last is not None:
+            return self._read_last(pair, last, end)
+        parts = list(self.iter_partitions(pair, start, end))
+        if not parts:
+            return np.empty(0, dtype=TIMESTAMP_DTYPE), np.empty(0, dtype=PRICE_DTYPE)
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate([ts for ts, _ in parts]), np.concatenate([px for _, px in parts])
+
+    def _read_last(self, pair, n, end=None):
+        end_ns = None if end is None else to_ns(end)
+        parts = []
+        remaining = n
+        for day in reversed(self.days(pair)):
+            if remaining <= 0:
+                break
+            if end_ns is not None and day > _day(end_ns - 1):
+                continue
+            partition = self._partition(pair, day)
+            if partition is None:
+                continue
+            ts, px = partition
+            hi = len(ts) if end_ns is None else int(np.searchsorted(ts, end_ns, side="left"))
+            lo = max(0, hi - remaining)
+            parts.append((ts[lo:hi], px[lo:hi]))
+            remaining -= hi - lo
+        parts.reverse()
+        if not parts:
+            return np.empty(0, dtype=TIMESTAMP_DTYPE), np.empty(0, dtype=PRICE_DTYPE)
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate([ts for ts, _ in parts]), np.concatenate([px for _, px in parts])